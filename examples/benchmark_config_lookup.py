@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: Configuration.get() for deep dotted keys - flat index lookup vs the recursive
+lookup (the way Configuration.get() worked before the flat index was introduced) vs attribute
+access through the generated accessors (Configuration.accessors()).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import operator
+import timeit
+
+from pyutilities.config.configuration import Configuration
+
+DEPTH = 8  # depth of the nested configuration
+WIDTH = 4  # number of keys on each level (except the leaf level)
+LOOKUPS = 100_000  # number of lookups for each measurement
+
+
+def build_tree(depth: int, width: int) -> dict:
+    if depth == 0:
+        return {f"leaf{i}": f"value{i}" for i in range(width)}
+    return {f"key{i}": build_tree(depth - 1, width) for i in range(width)}
+
+
+def recursive_get(key: str, values: dict):
+    """Lookup algorithm used by Configuration.get() before the flat index."""
+    if not values:
+        raise KeyError
+    keys = key.split(".", 1)
+    if len(keys) < 2:
+        return values[keys[0]]
+    return recursive_get(keys[1], values[keys[0]])
+
+
+if __name__ == "__main__":
+    config = Configuration(dict_to_merge=build_tree(DEPTH, WIDTH), is_merge_env=False)
+    deep_key = ".".join([f"key{WIDTH - 1}"] * DEPTH + ["leaf0"])
+    assert config.get(deep_key) == recursive_get(deep_key, config.config_dict)
+
+    print(f"Deep key: [{deep_key}], depth: {DEPTH + 1}, lookups: {LOOKUPS}.")
+    recursive = timeit.timeit(lambda: recursive_get(deep_key, config.config_dict), number=LOOKUPS)
+    indexed = timeit.timeit(lambda: config.get(deep_key), number=LOOKUPS)
+    print(f"\trecursive lookup: {recursive:.4f} sec")
+    print(f"\tindexed lookup:   {indexed:.4f} sec (x{recursive / indexed:.1f} faster)")
+
+    root = config.accessors().root
+    attribute_chain = operator.attrgetter(deep_key)  # root.key3.key3...leaf0
+    assert attribute_chain(root) == config.get(deep_key)
+    accessor = timeit.timeit(lambda: attribute_chain(root), number=LOOKUPS)
+    print(f"\taccessor attributes chain: {accessor:.4f} sec (x{recursive / accessor:.1f} faster)")
+    parent = operator.attrgetter(deep_key.rpartition(".")[0])(root)  # accessor of the leaf parent
+    accessor = timeit.timeit(lambda: parent.leaf0, number=LOOKUPS)
+    print(f"\tsingle accessor attribute: {accessor:.4f} sec (x{recursive / accessor:.1f} faster)")
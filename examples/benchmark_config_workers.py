@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: configuration startup in the worker process - loading from YAML files vs rebuilding from the
+binary (marshal) form vs attaching to the memory mapped file (MappedConfig).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+import tempfile
+import time
+
+from pyutilities.config.binary import MappedConfig
+from pyutilities.config.configuration import Configuration
+
+FILES = 20  # number of YAML files in the config directory
+SECTIONS_PER_FILE = 250  # number of top-level sections in each file
+KEYS_PER_SECTION = 10  # number of keys in each section
+REPEATS = 5  # number of startups for each measurement
+
+
+def generate_configs(config_dir: str) -> None:
+    for file in range(FILES):
+        with open(os.path.join(config_dir, f"config{file:02}.yml"), "w", encoding="utf-8") as yaml_file:
+            for section in range(SECTIONS_PER_FILE):
+                yaml_file.write(f"section{file}_{section}:\n")
+                for key in range(KEYS_PER_SECTION):
+                    yaml_file.write(f"  key{key}: value {key} of section {section}\n")
+
+
+def measure(name: str, startup) -> None:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        config = startup()
+        assert config.get("section3_7.key5") == "value 5 of section 7"
+    print(f"\t{name}: {(time.perf_counter() - start) / REPEATS * 1000:.1f} ms per startup")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        generate_configs(tmp_dir)
+        source = Configuration(tmp_dir, is_merge_env=False)
+        data = source.to_bytes()
+        mapped_path = os.path.join(tmp_dir, "config.bin")
+        source.write_mapped(mapped_path)
+        print(
+            f"Config: {FILES * SECTIONS_PER_FILE * KEYS_PER_SECTION} values, binary form {len(data)} bytes."
+        )
+
+        measure("YAML files", lambda: Configuration(tmp_dir, is_merge_env=False))
+        measure("binary form", lambda: Configuration.from_bytes(data))
+        measure("memory mapped file", lambda: MappedConfig(mapped_path))
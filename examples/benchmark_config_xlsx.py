@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: loading of the 100k-row xlsx config sheet - full workbook mode with cell() access per row
+(previous implementation) vs read-only streaming mode of ConfigurationXls (whole config initialization).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+
+from pyutilities.config.configuration import ConfigurationXls
+
+ROWS = 100_000  # number of rows in the config sheet
+CONFIG_SHEET = "config_sheet"
+
+
+def generate_xlsx(file_path: str) -> None:
+    workbook = openpyxl.Workbook(write_only=True)
+    other_sheet = workbook.create_sheet("other_sheet")  # sheet, which isn't needed for config
+    for row in range(ROWS // 2):
+        other_sheet.append([f"other{row}", row, row * 2])
+    config_sheet = workbook.create_sheet(CONFIG_SHEET)
+    for row in range(ROWS):
+        config_sheet.append([f"name{row}", f"value of the config parameter {row}"])
+    workbook.save(file_path)
+
+
+def load_full_mode(file_path: str) -> dict:
+    excel_sheet = openpyxl.load_workbook(file_path)[CONFIG_SHEET]
+    return {
+        excel_sheet.cell(row=row + 1, column=1).value: excel_sheet.cell(row=row + 1, column=2).value
+        for row in range(excel_sheet.max_row)
+    }
+
+
+def load_streaming(file_path: str) -> dict:
+    return ConfigurationXls(file_path, CONFIG_SHEET, is_merge_env=False).config_dict
+
+
+def measure(name: str, loader, file_path: str) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    dictionary = loader(file_path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\t{name}: {elapsed:.2f} sec, peak memory {peak / 1024 / 1024:.1f} MB, {len(dictionary)} row(s)")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xlsx_path = os.path.join(tmp_dir, "big_config.xlsx")
+        generate_xlsx(xlsx_path)
+        print(f"XLSX file size: {os.path.getsize(xlsx_path) / 1024 / 1024:.1f} MB.")
+
+        measure("full workbook mode", load_full_mode, xlsx_path)
+        measure("read-only streaming", load_streaming, xlsx_path)
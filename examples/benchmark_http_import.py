@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: import time of the HTTP client module (python -X importtime in a fresh interpreter) and
+time of the first/next random user agent (fake user agents dataset is loaded lazily, on the first call).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+RUNS = 5  # number of interpreter runs for the import time measurement
+MODULE = "pyutilities.web.http_client"
+CODE = f"import sys, {MODULE}; print('fake_useragent' in sys.modules)"
+
+
+def import_time() -> tuple[int, int, str]:
+    """Returns self and cumulative import time of the module (microseconds) + is dataset imported."""
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONTRACEMALLOC"}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODE], capture_output=True, text=True, check=True, env=env
+    )
+    for line in process.stderr.splitlines():  # import time: self [us] | cumulative | imported package
+        parts = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == MODULE:
+            return int(parts[0]), int(parts[1]), process.stdout.strip()
+    raise RuntimeError(f"No import time for {MODULE}!")
+
+
+if __name__ == "__main__":
+    results = [import_time() for _ in range(RUNS)]
+    print(f"{MODULE} import (best of {RUNS}):")
+    print(f"\tself {min(result[0] for result in results) / 1000:8.1f} ms")
+    print(f"\tcumulative {min(result[1] for result in results) / 1000:8.1f} ms")
+    print(f"\tfake_useragent imported: {results[0][2]}")
+
+    from pyutilities.web.http_client import HttpClient  # pylint: disable=wrong-import-position
+
+    start = time.perf_counter()
+    HttpClient.random_user_agent()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(10_000):
+        HttpClient.random_user_agent()
+    following = (time.perf_counter() - start) / 10_000
+    print(f"random user agent: first call {first * 1000:.1f} ms, next calls {following * 1e6:.2f} us")
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: HttpClient throughput vs number of threads (one shared client) for the different connection
+pool sizes, against the local HTTP server (HTTP/1.1, keep-alive). Pool statistics show connections,
+opened/reused/discarded per run.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pyutilities.web.http_client import HttpClient
+
+REQUESTS = 3000  # number of requests for each measurement
+THREADS = (1, 4, 16, 64)  # numbers of threads
+POOL_SIZES = (10, 64)  # connection pool sizes (per host)
+BODY = b"x" * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def measure(url: str, threads: int, pool_size: int) -> None:
+    client = HttpClient(user_agent="benchmark", pool_size=pool_size)
+    start = time.perf_counter()
+    results = list(client.get_many([url] * REQUESTS, max_concurrency=threads))
+    elapsed = time.perf_counter() - start
+    assert all(result.error is None for result in results)
+    stats = client.pool_stats()
+    print(
+        f"\tthreads {threads:>3}, pool {pool_size:>3}: {REQUESTS / elapsed:8.0f} req/sec, "
+        f"created {stats['created']:>5}, reused {stats['reused']:>5}, discarded {stats['discarded']:>5}"
+    )
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        for pool in POOL_SIZES:
+            for threads_number in THREADS:
+                measure(server_url, threads_number, pool)
+    finally:
+        server.shutdown()
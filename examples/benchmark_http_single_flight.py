@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: "thundering herd" - many threads request the same slow URL at once, HttpClient without and
+with the single-flight coalescing (SingleFlight). Shows number of upstream requests, wall time and the
+coalescing rate.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.single_flight import SingleFlight
+
+THREADS = 64  # concurrent callers
+ROUNDS = 10  # herds (one after another)
+DELAY = 0.05  # upstream response time (seconds)
+BODY = b"x" * 64 * 1024
+
+upstream_requests = 0  # pylint: disable=invalid-name
+counter_lock = threading.Lock()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        global upstream_requests  # pylint: disable=global-statement
+        with counter_lock:
+            upstream_requests += 1
+        time.sleep(DELAY)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def measure(name: str, client: HttpClient, url: str) -> None:
+    global upstream_requests  # pylint: disable=global-statement
+    upstream_requests = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        results = list(client.get_many([url] * THREADS, max_concurrency=THREADS))
+        assert all(result.error is None for result in results)
+    elapsed = time.perf_counter() - start
+    stats = client.single_flight.stats() if client.single_flight else {"rate": 0.0}
+    print(
+        f"\t{name:>14}: {elapsed:6.2f} sec, upstream requests {upstream_requests:>4} "
+        f"of {THREADS * ROUNDS}, coalescing rate {stats['rate']:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        measure("no coalescing", HttpClient(user_agent="benchmark", pool_size=THREADS), server_url)
+        measure(
+            "single flight",
+            HttpClient(user_agent="benchmark", pool_size=THREADS, single_flight=SingleFlight()),
+            server_url,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: overhead of the requests timing instrumentation (RequestTimer) - HttpClient throughput
+without timer / with timer, against the local HTTP server (HTTP/1.1, keep-alive), one thread.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.http_timing import RequestTimer
+
+REQUESTS = 3000  # number of requests for each measurement
+ROUNDS = 3  # measurements are interleaved, the best one is shown
+BODY = b"x" * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def measure(client: HttpClient, url: str) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(url)
+    return REQUESTS / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        timer = RequestTimer()
+        clients = {
+            "no timer": HttpClient(user_agent="benchmark"),
+            "timer": HttpClient(user_agent="benchmark", timer=timer),
+        }
+        results: dict[str, float] = {}
+        for _ in range(ROUNDS):
+            for name, http_client in clients.items():
+                results[name] = max(results.get(name, 0.0), measure(http_client, server_url))
+        for name, rate in results.items():
+            print(f"\t{name:>8}: {rate:8.0f} req/sec")
+        print(json.dumps(timer.export(), indent=2))
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: Configuration.merge_dict() for large generated configs - iterative merge engine vs the
+recursive merge (the way Configuration.merge_dict() worked before), plus
+merge of the very deep dictionary, which the recursive merge can't handle.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import time
+
+from pyutilities.config.configuration import Configuration, _index_key, _index_value
+
+SECTIONS = 2_000  # number of top-level sections in the generated config
+KEYS_PER_SECTION = 50  # number of keys in each section (half of them are nested)
+DEEP_DEPTH = 5_000  # depth of the deep dictionary
+
+
+def generate_config(part: int) -> dict:
+    return {
+        f"section{section}": {
+            f"key{part}_{key}": {"value": key, "list": [key]} if key % 2 else f"value {key}"
+            for key in range(KEYS_PER_SECTION)
+        }
+        for section in range(SECTIONS)
+    }
+
+
+def recursive_merge(index, dict1, dict2, current_key="", index_key=""):
+    """Merge algorithm used by Configuration.merge_dict() before the iterative engine (including the
+    flat index maintenance)."""
+    if isinstance(dict2, dict) and isinstance(dict1, dict):
+        for key in dict2.keys():
+            child_key = _index_key(index_key, key)
+            if key in dict1.keys():
+                sep = "." if current_key else ""
+                recursive_merge(index, dict1[key], dict2[key], f"{current_key}{sep}{key}", child_key)
+            else:
+                dict1[key] = dict2[key]
+                _index_value(index, child_key, dict2[key])
+    else:
+        raise ValueError(f"Attempt of overwriting old {dict1} with new {dict2} to key {current_key}!")
+    return dict1
+
+
+def measure(name: str, merge) -> None:
+    parts = [generate_config(part) for part in range(3)]
+    start = time.perf_counter()
+    for part in parts:
+        merge(part)
+    print(f"\t{name}: {time.perf_counter() - start:.3f} sec")
+
+
+def deep_dict(depth: int) -> dict:
+    deep = value = {}
+    for _ in range(depth):
+        value["n"] = {}
+        value = value["n"]
+    return deep
+
+
+if __name__ == "__main__":
+    print(f"Merging 3 configs: {SECTIONS} sections x {KEYS_PER_SECTION} keys each.")
+    target: dict = {}
+    target_index: dict = {}
+    measure("recursive merge", lambda part: recursive_merge(target_index, target, part))
+    config = Configuration(is_merge_env=False)
+    measure("iterative merge engine", config.merge_dict)
+
+    print(f"Merging dictionary with depth {DEEP_DEPTH}.")
+    try:
+        recursive_merge({}, deep_dict(DEEP_DEPTH), deep_dict(DEEP_DEPTH))
+        print("\trecursive merge: ok")
+    except RecursionError:
+        print("\trecursive merge: RecursionError")
+    start = time.perf_counter()
+    Configuration(is_merge_env=False).merge_dict(deep_dict(DEEP_DEPTH))
+    print(f"\titerative merge engine: ok, {time.perf_counter() - start:.3f} sec")
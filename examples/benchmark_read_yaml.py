@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: io_utils.read_yaml() on a multi-megabyte YAML file - C loader (libyaml) vs pure
+python loader.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+import tempfile
+import time
+
+from pyutilities.io.io_utils import (
+    YAML_C_LOADER_AVAILABLE,
+    YAML_LOADER_C,
+    YAML_LOADER_PYTHON,
+    read_yaml,
+)
+
+SECTIONS = 5_000  # number of top-level sections in the generated YAML file
+KEYS_PER_SECTION = 10  # number of keys in each section
+
+
+def generate_yaml(file_path: str) -> None:
+    with open(file_path, "w", encoding="utf-8") as yaml_file:
+        for section in range(SECTIONS):
+            yaml_file.write(f"section{section}:\n")
+            for key in range(KEYS_PER_SECTION):
+                yaml_file.write(f"  key{key}: some string value for the key {key} in section {section}\n")
+            yaml_file.write(f"  list: [{section}, {section + 1}, {section + 2}]\n")
+
+
+def measure(file_path: str, loader: str) -> float:
+    start = time.perf_counter()
+    read_yaml(file_path, loader=loader)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yaml_path = os.path.join(tmp_dir, "big_config.yml")
+        generate_yaml(yaml_path)
+        print(f"YAML file size: {os.path.getsize(yaml_path) / 1024 / 1024:.1f} MB.")
+
+        python_time = measure(yaml_path, YAML_LOADER_PYTHON)
+        print(f"\tpure python loader: {python_time:.3f} sec")
+        if YAML_C_LOADER_AVAILABLE:
+            c_time = measure(yaml_path, YAML_LOADER_C)
+            print(f"\tC (libyaml) loader: {c_time:.3f} sec (x{python_time / c_time:.1f} faster)")
+        else:
+            print("\tC (libyaml) loader isn't available.")
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+Generated accessor classes for the Configuration: nested dictionaries are turned into the instances of
+generated classes with __slots__, so config value is a plain attribute load - cfg.db.primary.port instead
+of config.get("db.primary.port").
+
+Optional schema is a nested dictionary, which mirrors the configuration: leaf values are types/converters
+(callable, value -> converted value), nested dictionaries - schemas for the nested keys. With schema only
+the keys from the schema are included, all of them are required, values are converted once at build time
+(bool/list values are converted with to_bool()/to_list(), see view module). All validation errors are
+reported at once by ConfigError. Without schema all configuration keys, including the keys from the
+environment (see Configuration.keys()), are included as is.
+
+Keys, which aren't valid identifiers, are converted to attribute names: invalid characters are replaced
+with "_", names, which are keywords or start with digit, are prefixed with "_", names, which start with
+"__", are prefixed with "k".
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import keyword
+import logging
+import re
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from pyutilities.config.environment import MISSING
+from pyutilities.config.errors import ConfigError
+from pyutilities.config.view import to_bool, to_list
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+_CONVERTERS: Dict[Any, Callable[[Any], Any]] = {bool: to_bool, list: to_list}
+
+
+def attribute_name(key: Any) -> str:
+    """Converts configuration key to the valid attribute name."""
+    name = re.sub(r"\W", "_", str(key))
+    if not name or name[0].isdigit() or keyword.iskeyword(name):
+        name = "_" + name
+    if name.startswith("__"):  # private (mangled) and special names
+        name = "k" + name
+    return name
+
+
+class ConfigNode:
+    """Base class for the generated accessor classes. Instances are read-only."""
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Configuration accessor is read-only, can't set [{name}]!")
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class ConfigAccessors:
+    """Builds (and rebuilds after the configuration changes) accessor objects for the configuration.
+    Root accessor is available as the [root] property, it is rebuilt if the configuration was changed
+    (version is increased) and immediately after reload() of the configuration."""
+
+    def __init__(self, config, schema: Dict[str, Any] | None = None) -> None:
+        self.__config = config
+        self.__schema = schema
+        self.__classes: Dict[Tuple[str, Tuple[str, ...]], type] = {}  # (path, attribute names) -> class
+        self.__version = -1
+        self.__root: ConfigNode | None = None
+        self.rebuild()  # validation errors are reported up front
+        config.subscribe(self.__on_reload)
+
+    @property
+    def root(self) -> Any:
+        if self.__version != self.__config.version:
+            self.rebuild()
+        return self.__root
+
+    def close(self) -> None:
+        """Stops rebuilding accessors on reload."""
+        self.__config.unsubscribe(self.__on_reload)
+
+    def __on_reload(self, keys) -> None:
+        try:
+            self.rebuild()
+        except ConfigError as e:  # reported by the root property (it retries the rebuilding)
+            log.error("Can't rebuild configuration accessors after reload: %s", e)
+
+    def rebuild(self) -> None:
+        """Builds new accessor objects for the current configuration state.
+        :raises ConfigError: if configuration doesn't match the schema (all errors are reported)
+        """
+        version = self.__config.version
+        errors: List[str] = []
+        if self.__schema is None:
+            values = self.__values()
+        else:
+            values = self.__convert("", self.__schema, errors)
+        if errors:
+            raise ConfigError("Configuration doesn't match the schema:\n\t" + "\n\t".join(errors))
+        self.__root = self.__node("", values)
+        self.__version = version
+
+    def __values(self) -> Dict[Any, Any]:
+        """Returns all top-level values (with environment/templates) of the configuration."""
+        config_dict = self.__config.config_dict
+        values: Dict[Any, Any] = {}
+        names: Set[str] = set()
+        for key in self.__config.keys():
+            name = attribute_name(key)
+            if key not in config_dict and name in names:  # environment keys don't break the accessors
+                log.debug("Environment key [%s] is skipped: duplicate attribute name [%s].", key, name)
+                continue
+            names.add(name)
+            plain_key = isinstance(key, str) and "." not in key
+            values[key] = self.__config.get(key) if plain_key else config_dict[key]
+        return values
+
+    def __convert(self, path: str, schema: Dict[str, Any], errors: List[str]) -> Dict[str, Any]:
+        """Converts configuration values for the schema (nested dictionary)."""
+        values: Dict[str, Any] = {}
+        for key, spec in schema.items():
+            key_path = f"{path}.{key}" if path else key
+            value = self.__config.get(key_path, MISSING)
+            if value is MISSING:
+                errors.append(f"[{key_path}]: missing value")
+            elif isinstance(spec, dict):
+                if isinstance(value, dict):
+                    values[key] = self.__convert(key_path, spec, errors)
+                else:
+                    errors.append(f"[{key_path}]: expected dictionary, got [{value!r}]")
+            else:
+                try:
+                    converter = _CONVERTERS.get(spec, spec)
+                    values[key] = (
+                        value if isinstance(spec, type) and type(value) is spec else converter(value)
+                    )
+                except (TypeError, ValueError) as e:
+                    errors.append(f"[{key_path}]: invalid value [{value!r}] ({e})")
+        return values
+
+    def __node(self, path: str, values: Dict[Any, Any]) -> ConfigNode:
+        """Creates accessor object (of the generated class) for the dictionary."""
+        names: Dict[str, Tuple[Any, Any]] = {}
+        for key, value in values.items():
+            name = attribute_name(key)
+            if name in names:
+                raise ConfigError(
+                    f"Keys [{names[name][0]}] and [{key}] of [{path}] have the same attribute name!"
+                )
+            child_path = f"{path}.{key}" if path else str(key)
+            names[name] = (key, self.__node(child_path, value) if isinstance(value, dict) else value)
+
+        signature = (path, tuple(names))
+        cls = self.__classes.get(signature)
+        if cls is None:  # classes are reused, while the configuration structure isn't changed
+            class_name = "".join(attribute_name(part).title() for part in path.split(".")) if path else "Root"
+            cls = self.__classes[signature] = type(
+                f"{class_name}Config", (ConfigNode,), {"__slots__": signature[1]}
+            )
+
+        node: ConfigNode = cls()
+        for name, (_, value) in names.items():
+            object.__setattr__(node, name, value)
+        return node
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
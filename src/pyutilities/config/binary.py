@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+Binary forms of the configuration for the worker processes:
+    - dumps_config()/loads_config(): compact marshal form of the configuration dictionary, configuration
+      is rebuilt from it in O(size) without YAML parsing and merging (see Configuration.to_bytes()).
+    - write_mapped_config()/MappedConfig: read-only file, which is mapped into the memory (mmap) by any
+      number of processes - pages are shared by all processes, values are decoded only on lookup.
+
+Mapped file layout (all numbers are little-endian):
+    header:  magic (8 bytes), number of entries (8 bytes)
+    entries: (key offset, key length, value offset, value length) for each entry, sorted by key
+    keys:    UTF-8 encoded dotted keys
+    values:  marshal encoded values
+Entries are leaf values (and dictionaries, which can't be addressed key by key: empty or with non-string or
+dotted keys), so the key is found by the binary search, and nested dictionary is rebuilt from the range of
+the entries with the key prefix. Top-level keys must be addressable (non-empty strings without dots).
+
+Only basic types (str, int, float, bool, None, list, dict, etc.) are supported by marshal, marshal format
+is specific for the python version - binary forms are intended for the processes of the same installation.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import logging
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+from pyutilities.config.environment import MISSING
+from pyutilities.config.errors import ConfigError
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+BINARY_FORMAT_VERSION = 1  # increase it in case of the marshal form changes
+MAPPED_MAGIC = b"PYUCFG\x00\x01"  # mapped file signature + format version
+HEADER = struct.Struct("<8sQ")  # magic, number of entries
+ENTRY = struct.Struct("<QIQI")  # key offset, key length, value offset, value length
+
+
+def dumps_config(config_dict: Dict[Any, Any]) -> bytes:
+    """Serializes configuration dictionary to the compact marshal form."""
+    try:
+        return marshal.dumps((BINARY_FORMAT_VERSION, config_dict))
+    except ValueError as e:  # configuration contains non-basic types
+        raise ConfigError(f"Configuration can't be serialized: {e}") from e
+
+
+def loads_config(data: bytes) -> Dict[Any, Any]:
+    """Deserializes configuration dictionary, serialized by dumps_config()."""
+    try:
+        version, config_dict = marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as e:
+        raise ConfigError(f"Invalid serialized configuration: {e}") from e
+    if version != BINARY_FORMAT_VERSION or not isinstance(config_dict, dict):
+        raise ConfigError(f"Unsupported serialized configuration format [{version}]!")
+    return config_dict
+
+
+def _addressable_key(key: Any) -> bool:
+    return isinstance(key, str) and key != "" and "." not in key
+
+
+def _flatten(config_dict: Dict[Any, Any]) -> List[Tuple[bytes, bytes]]:
+    """Returns sorted (encoded key, encoded value) entries for the mapped file. Dictionaries, which children
+    can't be addressed by the dotted keys, are stored as a whole.
+    :raises ConfigError: top-level key can't be addressed (not a string, empty or dotted key)
+    """
+    for key in config_dict:
+        if not _addressable_key(key):
+            raise ConfigError(
+                f"Top-level configuration key [{key!r}] can't be mapped (not a string or dotted)!"
+            )
+    entries = []
+    stack = list(config_dict.items())
+    while stack:
+        key, value = stack.pop()
+        if isinstance(value, dict) and value and all(_addressable_key(child) for child in value):
+            stack.extend((f"{key}.{child}", child_value) for child, child_value in value.items())
+            continue
+        try:
+            entries.append((key.encode("utf-8"), marshal.dumps(value)))
+        except ValueError as e:
+            raise ConfigError(f"Configuration entry [{key}] can't be serialized: {e}") from e
+    entries.sort()
+    return entries
+
+
+def _insert(result: Dict[str, Any], key: str, value: Any) -> None:
+    """Inserts value into the nested dictionary by the dotted key."""
+    *parents, last = key.split(".")
+    node = result
+    for part in parents:
+        node = node.setdefault(part, {})
+    node[last] = value
+
+
+def write_mapped_config(config_dict: Dict[Any, Any], file_path: str) -> None:
+    """Writes configuration dictionary to the file for MappedConfig (atomically - through the temporary
+    file, so processes, which already mapped the old file, aren't affected)."""
+    entries = _flatten(config_dict)
+    keys_offset = HEADER.size + ENTRY.size * len(entries)
+    values_offset = keys_offset + sum(len(key) for key, _ in entries)
+
+    table = bytearray(HEADER.pack(MAPPED_MAGIC, len(entries)))
+    key_offset, value_offset = keys_offset, values_offset
+    for key, value in entries:
+        table += ENTRY.pack(key_offset, len(key), value_offset, len(value))
+        key_offset += len(key)
+        value_offset += len(value)
+
+    target_dir = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_file = tempfile.mkstemp(dir=target_dir, prefix=".mapped_config_")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(table)
+            tmp.writelines(key for key, _ in entries)
+            tmp.writelines(value for _, value in entries)
+        os.replace(tmp_file, file_path)
+    except OSError:
+        os.unlink(tmp_file)
+        raise
+    log.debug("Written mapped config [%s]: %s entries.", file_path, len(entries))
+
+
+class MappedConfig:
+    """Read-only configuration, backed by the memory mapped file (see write_mapped_config()). Lookups
+    have the same semantics as Configuration.get()/contains_key(), decoded values are memoized."""
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, "rb") as mapped_file:
+            try:
+                self.__mmap = mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file can't be mapped
+                raise ConfigError(f"Invalid mapped config file [{file_path}]!") from e
+        self.__count: int
+        magic, self.__count = (
+            HEADER.unpack_from(self.__mmap, 0) if len(self.__mmap) >= HEADER.size else (b"", 0)
+        )
+        if magic != MAPPED_MAGIC:
+            self.__mmap.close()
+            raise ConfigError(f"Invalid mapped config file [{file_path}]!")
+        self.__cache: Dict[str, Any] = {}
+
+    def close(self) -> None:
+        self.__mmap.close()
+
+    def __enter__(self) -> "MappedConfig":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __entry(self, position: int) -> Tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self.__mmap, HEADER.size + ENTRY.size * position)
+
+    def __key(self, position: int) -> bytes:
+        key_offset, key_length, _, _ = self.__entry(position)
+        key_end = key_offset + key_length
+        return self.__mmap[key_offset:key_end]
+
+    def __value(self, position: int) -> Any:
+        _, _, value_offset, value_length = self.__entry(position)
+        value_end = value_offset + value_length
+        return marshal.loads(self.__mmap[value_offset:value_end])
+
+    def __lower_bound(self, key: bytes) -> int:
+        """Returns position of the first entry with the key >= given key (binary search)."""
+        low, high = 0, self.__count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __lookup(self, key: str) -> Any:
+        encoded = key.encode("utf-8")
+        position = self.__lower_bound(encoded)
+        if position < self.__count and self.__key(position) == encoded:
+            return self.__value(position)
+
+        prefix = encoded + b"."  # nested dictionary - rebuilt from the entries with the key prefix
+        result: Dict[str, Any] = {}
+        position = self.__lower_bound(prefix)
+        while position < self.__count:
+            nested_key = self.__key(position)
+            if not nested_key.startswith(prefix):
+                break
+            _insert(result, nested_key.decode("utf-8").removeprefix(key + "."), self.__value(position))
+            position += 1
+        return result if result else MISSING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieves config value for the key, see Configuration.get()."""
+        try:
+            value = self.__cache[key]
+        except KeyError:
+            value = self.__cache[key] = self.__lookup(key)
+        if value is MISSING:
+            if default is not None:
+                return default
+            raise ConfigError(f"Configuration entry [{key}] not found!")
+        return value
+
+    def contains_key(self, key: str) -> bool:
+        try:
+            value = self.__cache[key]
+        except KeyError:
+            value = self.__cache[key] = self.__lookup(key)
+        return value is not MISSING
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodes the whole configuration dictionary."""
+        result: Dict[str, Any] = {}
+        for position in range(self.__count):
+            _insert(result, self.__key(position).decode("utf-8"), self.__value(position))
+        return result
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+On-disk cache for the merged configuration, loaded from YAML files. Cache is keyed by the path,
+modification time, size and content hash of each source YAML file, so a warm start skips YAML
+parsing completely. Any change of the source files invalidates the cache. Cache is stored in the
+marshal format, so only configurations with the basic types (str, int, float, bool, None, list,
+dict, etc.) are cached - if configuration contains other types (e.g. dates) it isn't cached.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+CACHE_FORMAT_VERSION = 1  # increase it in case of the cache format changes
+
+# source file fingerprint: (absolute path, modification time in ns, size in bytes, sha256 of content)
+SourceFingerprint = Tuple[str, int, int, str]
+
+
+def sources_fingerprint(files: List[str]) -> List[SourceFingerprint]:
+    """Calculates fingerprints for the given source files (sorted by path)."""
+
+    fingerprint = []
+    for file_path in sorted(os.path.abspath(file) for file in files):
+        stat = os.stat(file_path)
+        with open(file_path, "rb") as source:
+            digest = hashlib.sha256(source.read()).hexdigest()
+        fingerprint.append((file_path, stat.st_mtime_ns, stat.st_size, digest))
+    return fingerprint
+
+
+def load_cached_config(cache_file: str, fingerprint: List[SourceFingerprint]) -> Dict[str, Any] | None:
+    """Loads cached configuration dictionary. Returns None if there is no cache, it is broken or
+    it was created for the other source files (any file was changed)."""
+
+    log.debug("load_cached_config(): reading cache [%s].", cache_file)
+    if not os.path.isfile(cache_file):
+        return None
+
+    try:
+        with open(cache_file, "rb") as cache:
+            cached = marshal.load(cache)
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        log.warning("Can't read config cache [%s]: %s", cache_file, e)
+        return None
+
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_FORMAT_VERSION:
+        log.warning("Config cache [%s] has unknown format.", cache_file)
+        return None
+    if cached.get("sources") != [list(source) for source in fingerprint]:
+        log.debug("Config cache [%s] is outdated.", cache_file)
+        return None
+
+    return cached.get("config")
+
+
+def save_cached_config(cache_file: str, fingerprint: List[SourceFingerprint], config: Dict[str, Any]) -> bool:
+    """Saves configuration dictionary to the cache file (atomically - through the temporary file).
+    Returns True if the cache was saved, False - otherwise."""
+
+    log.debug("save_cached_config(): writing cache [%s].", cache_file)
+    try:
+        data = marshal.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "sources": [list(source) for source in fingerprint],
+                "config": config,
+            }
+        )
+    except ValueError as e:  # configuration contains non-basic types
+        log.warning("Configuration can't be cached: %s", e)
+        return False
+
+    cache_dir = os.path.dirname(os.path.abspath(cache_file))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, prefix=".config_cache_")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            os.unlink(tmp_file)
+            raise
+    except OSError as e:
+        log.warning("Can't write config cache [%s]: %s", cache_file, e)
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Key-level diff of the (nested) configuration dictionaries. Used for the incremental configuration
+reload: only changed keys are applied to the live configuration.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+from typing import Any, Dict, Set, Tuple
+
+from pyutilities.config.environment import MISSING
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+KeyPath = Tuple[Any, ...]  # path of the key in the nested dictionary: ("a", "b", "c") -> a.b.c
+
+
+def diff_trees(old: Dict[Any, Any], new: Dict[Any, Any]) -> Dict[KeyPath, Any]:
+    """Calculates difference between two nested dictionaries. Nested dictionaries are compared
+    key by key, other values - as a whole.
+    :return: dictionary {key path: new value}, new value is MISSING for the removed keys
+    """
+    changes: Dict[KeyPath, Any] = {}
+    stack: list[Tuple[KeyPath, Dict[Any, Any], Dict[Any, Any]]] = [((), old, new)]
+    while stack:
+        path, old_dict, new_dict = stack.pop()
+        for key, old_value in old_dict.items():
+            if key not in new_dict:
+                changes[path + (key,)] = MISSING
+        for key, new_value in new_dict.items():
+            old_value = old_dict.get(key, MISSING)
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                stack.append((path + (key,), old_value, new_value))
+            elif old_value is MISSING or old_value != new_value or type(old_value) is not type(new_value):
+                changes[path + (key,)] = new_value
+    return changes
+
+
+def changed_keys(old: Dict[Any, Any], changes: Dict[KeyPath, Any]) -> Set[str]:
+    """Returns dotted keys of all changed values (including all nested keys of the replaced/removed
+    dictionaries) for the changes, calculated by diff_trees() for the [old] dictionary."""
+    keys: Set[str] = set()
+    for path, new_value in changes.items():
+        old_value: Any = old
+        for key in path:
+            old_value = old_value.get(key, MISSING) if isinstance(old_value, dict) else MISSING
+        for value in (old_value, new_value):
+            stack = [(".".join(str(key) for key in path), value)]
+            while stack:
+                dotted_key, current = stack.pop()
+                if current is MISSING:
+                    continue
+                keys.add(dotted_key)
+                if isinstance(current, dict):
+                    stack.extend((f"{dotted_key}.{k}", v) for k, v in current.items())
+    return keys
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
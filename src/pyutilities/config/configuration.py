@@ -11,56 +11,207 @@ For more data - see docstring for Configuration class.
 18.11.2018 Added config class that is able to load config from xls file.
 24.11.2022 Various refactorings, added some typing.
 02.01.2025 Logging refactoring and minor improvements.
+18.10.2026 Flat dotted-key index for the fast get()/contains_key() lookups.
+18.10.2026 Optional on-disk cache of the parsed YAML files.
+18.10.2026 Parallel parsing of YAML files from the config directory.
+18.10.2026 Environment is a lazy overlay instead of the copy in the config dictionary.
+18.10.2026 Reload of the changed YAML files with the key-level diff.
+18.10.2026 Immutable snapshots and copy-on-write updates.
+18.10.2026 Streaming (read-only) loading of the excel config sheets.
+18.10.2026 Lazy memoized resolution of the ${...} references in values.
+18.10.2026 Bulk lookup (get_many()) and prefix-scoped views (view()).
+18.10.2026 Iterative merge with conflict strategies and dotted keys expansion.
+18.10.2026 Binary (marshal) and memory mapped forms of the configuration.
+18.10.2026 Generated slotted accessor classes (accessors()).
 
 Created:  Gusev Dmitrii, 2017
-Modified: Gusev Dmitrii, 02.01.2025
+Modified: Dmitrii Gusev, 18.10.2026
 """
 
+import copy
 import logging
 import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from string import Template
+from typing import Any, Callable
 
 import openpyxl  # reading excel files (Excel 2010+ - xlsx)
 import xlrd  # reading excel files (old Excel up to 2010 (not including) - xls)
 
+from pyutilities.config.accessors import ConfigAccessors
+from pyutilities.config.binary import dumps_config, loads_config, write_mapped_config
+from pyutilities.config.config_cache import load_cached_config, save_cached_config, sources_fingerprint
+from pyutilities.config.config_diff import changed_keys, diff_trees
+from pyutilities.config.environment import MISSING, EnvironmentOverlay
+from pyutilities.config.errors import ConfigError as ConfigError  # re-exported (moved to errors module)
+from pyutilities.config.merge import MERGE_ERROR, check_strategy, resolve_conflict
+from pyutilities.config.snapshot import ConfigSnapshot
+from pyutilities.config.templates import TemplateResolver
+from pyutilities.config.view import ConfigView
 from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
 from pyutilities.io.io_utils import read_yaml
 
+# init module logger (used by the class methods, instances have their own loggers)
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 YAML_EXTENSION_1 = ".yml"
 YAML_EXTENSION_2 = ".yaml"
 DEFAULT_ENCODING = "UTF8"
+KEYS_SEPARATOR = "."
+
+
+def _index_key(parent_key, key):
+    """Returns dotted key for the child [key] of the node with dotted key [parent_key] or None if the child
+    can't be reached by the dotted key (parent isn't reachable, key isn't string or contains separator)."""
+    if parent_key is None or not isinstance(key, str) or KEYS_SEPARATOR in key:
+        return None
+    return f"{parent_key}{KEYS_SEPARATOR}{key}" if parent_key else key
+
+
+def _index_value(index, index_key, value):
+    """Puts value and all its nested values (if value is a dictionary) into the flat index."""
+    stack = [(index_key, value)]
+    while stack:
+        current_key, current_value = stack.pop()
+        if current_key is None:
+            continue
+        index[current_key] = current_value
+        if isinstance(current_value, dict):
+            stack.extend((_index_key(current_key, k), v) for k, v in current_value.items())
+
+
+def _new_index(dictionary):
+    """Returns flat index of all nested values of the (root) dictionary."""
+    index: dict[str, Any] = {}
+    _index_value(index, "", dictionary)
+    index.pop("", None)
+    return index
+
+
+def _unindex_value(index, index_key, value):
+    """Removes all nested values of the value (if value is a dictionary) from the flat index. The value
+    itself isn't removed - usually it is immediately replaced by the new one."""
+    stack = [(index_key, value)]
+    while stack:
+        current_key, current_value = stack.pop()
+        if current_key is None or not isinstance(current_value, dict):
+            continue
+        for k, v in current_value.items():
+            child_key = _index_key(current_key, k)
+            if child_key is not None:
+                index.pop(child_key, None)
+                stack.append((child_key, v))
+
+
+def _index_new_dict(index, index_key, value):
+    """Puts all nested values of the new dictionary into the flat index (not the dictionary itself). Stops
+    and returns False on the first dotted key - such dictionary is copied with expanding the dotted keys
+    (index entries put so far are replaced then)."""
+    stack = [(index_key, value)]
+    while stack:
+        current_key, current_value = stack.pop()
+        prefix = None if current_key is None else (current_key + KEYS_SEPARATOR if current_key else "")
+        for k, v in current_value.items():
+            child_key = None
+            if isinstance(k, str):
+                if KEYS_SEPARATOR in k:
+                    return False
+                if prefix is not None:
+                    child_key = prefix + k
+                    index[child_key] = v
+            if isinstance(v, dict):
+                stack.append((child_key, v))
+    return True
+
+
+def _path_keys(path):
+    """Converts linked path (parent path, key) of the nested dictionary to the tuple of keys."""
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    return tuple(reversed(keys))
 
 
 class Configuration:
     """Tree-like configuration-holding structure, allows loading from YAML and retrieving values
     by using chained hierarchical key with dot-separated levels, e.g. "hdfs.namenode.address".
     Can include environment variables (switch by key), environment usually override internal values.
+    Environment isn't copied into the configuration - it is an overlay, consulted on lookups (see
+    EnvironmentOverlay), values set after merging the environment override it.
+    YAML files, loaded with reloadable=True, can be reloaded (see reload()/start_auto_reload()): only
+    changed files are parsed, changed keys are applied to the live configuration and subscribers are
+    notified about them.
+    freeze() returns immutable snapshot of the configuration, which can be read without any locks. After
+    the first freeze() all updates are copy-on-write: nested dictionaries, shared with snapshots, aren't
+    modified in place, each update publishes the new snapshot atomically.
+    All reachable values are kept in the flat index {"a.b.c": value}, so get() / contains_key() are
+    a single dictionary lookup. The index is maintained by set(), merge_dict() and append_dict() -
+    don't modify nested dictionaries (returned by get() or from config_dict) in place.
     :param: path_to_config ???
     :param: dict_to_merge ???
     :param: is_override_config ???
     :param: is_merge_env ???
+    :param: cache_file: path to the cache of parsed YAML config files (None - don't use cache)
+    :param: env_prefix: prefix of environment variables for the config (other variables are ignored)
+    :param: env_separator: separator of nested levels in the environment variables names, e.g. "__"
+    :param: resolve_templates: resolve ${...} references in values on get() (see templates module)
     """
 
-    def __init__(self, path_to_config=None, dict_to_merge=None, is_override_config=True, is_merge_env=True):
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        path_to_config=None,
+        dict_to_merge=None,
+        is_override_config=True,
+        is_merge_env=True,
+        cache_file=None,
+        env_prefix="",
+        env_separator=None,
+        resolve_templates=False,
+    ):
 
         # init logger
         self.log = logging.getLogger(__name__)  # get logger itself
         self.log.addHandler(logging.NullHandler())  # add null handler to prevent exceptions
         self.log.debug("Initializing Configuration() instance...")
         self.log.debug(
-            "Load configuration:\n\tpath -> %s\n\tdict -> %s\n\toverride config -> %s\n\tmerge env -> %s",
+            "Load configuration:\n\tpath -> %s\n\tdict -> %s\n\toverride config -> %s\n\tmerge env -> %s"
+            "\n\tcache file -> %s",
             path_to_config,
             dict_to_merge,
             is_override_config,
             is_merge_env,
+            cache_file,
         )
 
-        # init internal dictionary
-        self.config_dict = {}
+        # init internal dictionary and the flat index for it
+        self.__config_dict = {}
+        self.__index = {}
+        # environment overlay (see merge_env())
+        self.__env: EnvironmentOverlay | None = None
+        self.__env_prefix = env_prefix
+        self.__env_separator = env_separator
+        # tracked YAML files for reload(): loaded paths, file -> (mtime ns, size, content), merged content
+        self.__reload_paths: list[str] = []
+        self.__reload_files: dict[str, tuple[int, int, Any]] = {}
+        self.__reload_tree: dict[Any, Any] = {}
+        self.__reload_lock = threading.RLock()
+        self.__reload_stop: threading.Event | None = None
+        self.__subscribers: list[Callable[[set[str]], Any]] = []
+        # copy-on-write state (see freeze()): published snapshot, config version, dictionaries copied after
+        # the last publishing (they can be modified in place), lock for the updates
+        self.__snapshot: ConfigSnapshot | None = None
+        self.__version = 0
+        self.__owned: dict[int, dict[Any, Any]] = {}
+        self.__write_lock = threading.RLock()
+        # lazy resolver of the ${...} references (None - values are returned as is)
+        self.__templates = TemplateResolver(self.__raw_get) if resolve_templates else None
 
         if path_to_config and path_to_config.strip():  # if provided file path - try to load config
             self.log.debug("Loading config from [%s].", path_to_config)
-            self.load(path_to_config, is_merge_env)
+            self.load(path_to_config, is_merge_env, cache_file=cache_file)
 
         if dict_to_merge:  # merge config from file(s) (if any) with dictionary, if any
             self.log.debug("Dictionary for merge isn't empty: %s.", dict_to_merge)
@@ -75,23 +226,137 @@ class Configuration:
                 raise ConfigError(f"Provided unknown type [{type(dict_to_merge)}] of dictionary for merge!")
         self.log.info("Configuration loaded successfully.")
 
+    @property
+    def config_dict(self):
+        """Internal (nested) configuration dictionary."""
+        return self.__config_dict
+
+    @config_dict.setter
+    def config_dict(self, dictionary):
+        with self.__write_lock:
+            dictionary = self.__ingest(dictionary)
+            index = _new_index(dictionary)
+            self.__config_dict = dictionary
+            self.__index = index
+            self.__invalidate()
+            self.__publish()
+
+    @property
+    def version(self):
+        """Version of the configuration, it is increased by each update."""
+        return self.__version
+
+    def freeze(self):
+        """Returns immutable snapshot (see ConfigSnapshot) of the current configuration state. Snapshot
+        shares nested dictionaries with the configuration, it can be read from any thread without locks.
+        First call copies the configuration once (merged/set dictionaries could be referenced by the caller)
+        and switches it to the copy-on-write updates with copying of the new values, after it each update
+        publishes the new snapshot, so this method returns the latest snapshot without copying.
+        """
+        if self.__snapshot is None:
+            with self.__write_lock:
+                if self.__snapshot is None:
+                    self.__config_dict = copy.deepcopy(self.__config_dict)
+                    self.__index = _new_index(self.__config_dict)
+                self.__publish(enable_snapshots=True)
+        return self.__snapshot
+
+    def __publish(self, enable_snapshots=False):
+        """Completes the update: increases version and publishes the new snapshot (if snapshots are used)."""
+        self.__version += 1
+        if self.__snapshot is not None or enable_snapshots:
+            self.__owned = {}  # all dictionaries are shared with the new snapshot
+            self.__snapshot = ConfigSnapshot(
+                self.__config_dict, self.__env, self.__version, self.__templates is not None
+            )
+
+    def __ingest(self, value):
+        """Returns value to be stored into the configuration: the value itself or its deep copy, if there are
+        snapshots (caller's changes of the value mustn't be visible in the published snapshots)."""
+        return value if self.__snapshot is None else copy.deepcopy(value)
+
+    def __writable(self, node):
+        """Returns the dictionary, that can be modified in place: node itself (if there are no snapshots or
+        the node was already copied after the last publishing) or its copy."""
+        if self.__snapshot is None or not isinstance(node, dict) or id(node) in self.__owned:
+            return node
+        copied = dict(node)
+        self.__owned[id(copied)] = copied
+        return copied
+
+    def __writable_root(self):
+        self.__config_dict = self.__writable(self.__config_dict)
+        return self.__config_dict
+
+    def __invalidate(self, keys=None):
+        """Drops resolved templates, depending on the changed keys (None - all keys are changed)."""
+        if self.__templates is not None:
+            self.__templates.invalidate(keys)
+
     def append_dict(self, dictionary, is_override):
         """Appends specified dictionary to internal dictionary of current class.
         :param dictionary
         :param is_override
         """
         self.log.debug("append_dict() is working.")
-        for key, value in dictionary.items():
-            if is_override or key not in self.config_dict.keys():
-                # override key only with non-empty value
-                if value:
-                    self.set(key, value)
-
-    def load(self, path: str | None, is_merge_env=True):
-        """Parses YAML file(s) from the given directory/file to add content into this configuration instance
+        with self.__write_lock:
+            keys = []
+            for key, value in dictionary.items():
+                if is_override or not self.__has_top_key(key):
+                    # override key only with non-empty value
+                    if value:
+                        self.__set(key, value)
+                        keys.append(key)
+            if keys and self.__env is not None:
+                self.__env = self.__env.shadowed(*keys)
+            self.__invalidate(keys)
+            self.__publish()
+
+    def __has_top_key(self, key):
+        """Checks the key of the config dictionary or of the environment overlay (if merged)."""
+        if key in self.__config_dict:
+            return True
+        if self.__env is None or not isinstance(key, str):
+            return False
+        return self.__env.overlay(key, MISSING) is not MISSING
+
+    def __check_env_conflicts(self, new_dict, strategy):
+        """Raises ConfigError (strategy MERGE_ERROR) if the merged dictionary has values for the keys, which
+        have values from the environment overlay - as if the environment was merged into the configuration."""
+        if self.__env is None or strategy != MERGE_ERROR:
+            return
+        stack = [("", new_dict)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+                dotted_key = prefix + key
+                env_value = self.__env.overlay(dotted_key, MISSING)
+                if env_value is not MISSING and not isinstance(env_value, dict):
+                    raise ConfigError(f"Value for the key [{dotted_key}] conflicts with the environment!")
+                if isinstance(value, dict):
+                    stack.append((dotted_key + KEYS_SEPARATOR, value))
+
+    def load(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        path: str | None,
+        is_merge_env=True,
+        cache_file: str | None = None,
+        workers: int = 0,
+        use_processes: bool = False,
+        reloadable: bool = False,
+    ):
+        """Parses YAML file(s) from the given directory/file to add content into this configuration instance.
+        Files from the directory are merged in order, sorted by file name.
         :param is_merge_env: merge parameters with environment (True) or not (False)
         :param path: directory/file to load files from
         :type path: str
+        :param cache_file: path to the cache of parsed YAML file(s), if specified - YAML file(s) are parsed
+            only if the cache doesn't exist or any YAML file was changed (see config_cache module)
+        :param workers: number of workers for parallel parsing of YAML files (0/1 - parse sequentially)
+        :param use_processes: parse YAML files on the process pool (True) or on the thread pool (False)
+        :param reloadable: track loaded YAML files for the reload() (keeps a copy of the files content)
         """
 
         self.log.debug("load() is working. Path [%s], is_merge_env [%s].", path, is_merge_env)
@@ -101,76 +366,336 @@ class Configuration:
         if not os.path.exists(path):
             raise ConfigError(f"Provided path [{path}] doesn't exist!")
 
-        # TODO: extract two methods - load from file/load from dir + refactor unit tests
+        yaml_files = self.__yaml_files(path)
+        if cache_file:  # load merged YAML files from the cache (or parse them and create the cache)
+            loaded = self.__load_cached(yaml_files, cache_file, workers, use_processes)
+            if reloadable:  # content of the separate files isn't known - they will be parsed on reload
+                self.__track_files(path, dict.fromkeys(yaml_files), copy.deepcopy(loaded))
+            self.merge_dict(loaded)
+        else:
+            contents = {}
+            parsed = self.__read_yaml_files(yaml_files, workers, use_processes)
+            for file_path, content in zip(yaml_files, parsed):
+                if reloadable:
+                    contents[file_path] = copy.deepcopy(content)
+                self.merge_dict(content)
+            if reloadable:
+                self.__track_files(path, contents, self.__merged(contents.values()))
+
+        # merge environment variables to internal dictionary
+        if is_merge_env:
+            self.log.info("Merging environment variables is switched ON.")
+            self.merge_env(self.__env_prefix, self.__env_separator)
+
+    def __yaml_files(self, path):
+        """Returns list of YAML files for loading: the path itself or all YAML files in the path."""
         # loading from file -> if provided path to single file - load it
         if os.path.isfile(path) and (path.endswith(YAML_EXTENSION_1) or path.endswith(YAML_EXTENSION_2)):
             self.log.debug("Provided path [%s] is a YAML file.", path)
-            self.log.debug("Loading configuration from [%s].", path)
-            self.merge_dict(read_yaml(path))
+            return [path]
 
         # loading from directory -> load all found YAML files
-        elif os.path.isdir(path):
+        if os.path.isdir(path):
             self.log.debug("Provided path [%s] is a directory. Loading all YAML files.", path)
-            for some_file in os.listdir(path):
+            yaml_files = []
+            for some_file in sorted(os.listdir(path)):
                 file_path = os.path.join(path, some_file)
                 if os.path.isfile(file_path) and (
                     some_file.endswith(YAML_EXTENSION_1) or some_file.endswith(YAML_EXTENSION_2)
                 ):
-                    self.log.debug("Loading configuration from [%s].", some_file)
-                    self.merge_dict(read_yaml(file_path))
+                    yaml_files.append(file_path)
+            return yaml_files
 
         # unknown file/dir type
+        raise ConfigError(f"Unknown thing [{path}], not a file, not a dir!")
+
+    def __read_yaml_files(self, yaml_files, workers, use_processes):
+        """Parses YAML files (sequentially or in parallel) and yields their content in the order of files."""
+        if workers <= 1 or len(yaml_files) <= 1:
+            for file_path in yaml_files:
+                self.log.debug("Loading configuration from [%s].", file_path)
+                yield read_yaml(file_path)
+            return
+
+        self.log.debug("Loading configuration from %s file(s), workers: %s.", len(yaml_files), workers)
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=workers)
         else:
-            raise ConfigError(f"Unknown thing [{path}], not a file, not a dir!")
-
-        # merge environment variables to internal dictionary
-        if is_merge_env:
-            self.log.info("Merging environment variables is switched ON.")
-            self.merge_env()
+            executor = ThreadPoolExecutor(max_workers=workers)
+        with executor:
+            yield from executor.map(read_yaml, yaml_files)
+
+    def __load_cached(self, yaml_files, cache_file, workers, use_processes):
+        """Returns merged content of the YAML files from the cache. If the cache is missing or outdated -
+        parses YAML files and (re)creates the cache."""
+        fingerprint = sources_fingerprint(yaml_files)
+        cached = load_cached_config(cache_file, fingerprint)
+        if cached is not None:
+            self.log.debug("Configuration is loaded from the cache [%s].", cache_file)
+            return cached
+
+        self.log.debug("Cache [%s] is missing or outdated, parsing YAML files.", cache_file)
+        loaded = Configuration(is_merge_env=False)
+        for content in self.__read_yaml_files(yaml_files, workers, use_processes):
+            loaded.merge_dict(content)
+        save_cached_config(cache_file, fingerprint, loaded.config_dict)
+        return loaded.config_dict
+
+    def __merged(self, contents):
+        """Merges (copies of) the given dictionaries into the new dictionary, see merge_dict()."""
+        merged = Configuration(is_merge_env=False)
+        for content in contents:
+            merged.merge_dict(copy.deepcopy(content))
+        return merged.config_dict
+
+    def __track_files(self, path, contents, content_tree):
+        """Starts tracking of the loaded YAML files for reload()."""
+        with self.__reload_lock:
+            self.__reload_tree = self.__merged([self.__reload_tree, content_tree])
+            self.__reload_paths.append(path)
+            for file_path, content in contents.items():
+                stat = os.stat(file_path)
+                self.__reload_files[file_path] = (stat.st_mtime_ns, stat.st_size, content)
+
+    def subscribe(self, callback):
+        """Subscribes callback for the reload() notifications: callback(changed_keys) is called with the set
+        of changed dotted keys after the changes were applied."""
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.__subscribers.remove(callback)
+
+    def reload(self):
+        """Reloads YAML files, loaded with reloadable=True: detects changed/added/removed files (by mtime and
+        size), parses only changed files and applies changed keys to the live configuration. Changes are
+        applied atomically - readers see either old or new values. Values, changed in the live configuration
+        (e.g. by set()), are overwritten only if they are changed in the files.
+        :return: set of changed dotted keys
+        """
+        with self.__reload_lock:
+            files = {}
+            for path in self.__reload_paths:
+                for file_path in self.__yaml_files(path):
+                    stat = os.stat(file_path)
+                    tracked = self.__reload_files.get(file_path)
+                    if tracked and tracked[0] == stat.st_mtime_ns and tracked[1] == stat.st_size:
+                        files[file_path] = tracked
+                    else:
+                        files[file_path] = (stat.st_mtime_ns, stat.st_size, None)
+            if files.keys() == self.__reload_files.keys() and all(t[2] is not None for t in files.values()):
+                return set()  # nothing changed (content of the changed files is None)
+
+            to_parse = [file_path for file_path, tracked in files.items() if tracked[2] is None]
+            self.log.info("Reloading configuration, parsing %s file(s).", len(to_parse))
+            for file_path, content in zip(to_parse, self.__read_yaml_files(to_parse, 0, False)):
+                files[file_path] = files[file_path][:2] + (content,)
+            new_tree = self.__merged(tracked[2] for tracked in files.values())
+
+            changes = diff_trees(self.__reload_tree, new_tree)
+            keys = changed_keys(self.__reload_tree, changes)
+            if changes:
+                with self.__write_lock:
+                    self.__apply_changes(changes)
+                    self.__invalidate(keys)
+                    self.__publish()
+            self.__reload_files = files
+            self.__reload_tree = new_tree
+
+        if keys:
+            self.log.info("Configuration reloaded, %s key(s) changed.", len(keys))
+            for callback in list(self.__subscribers):
+                callback(keys)
+        return keys
+
+    def __apply_changes(self, changes):
+        """Applies changes (see diff_trees()) to the copies of the config dictionary and the index (only
+        changed nested dictionaries are copied) and then replaces them."""
+        root = dict(self.__config_dict)
+        index = dict(self.__index)
+        copied = {id(root)}
+        for path, value in changes.items():
+            node = root
+            index_key = ""
+            for key in path[:-1]:  # copy (or create) nested dictionaries on the path to the changed value
+                index_key = _index_key(index_key, key)
+                child = node.get(key)
+                if not isinstance(child, dict):
+                    child = {}
+                elif id(child) not in copied:
+                    child = dict(child)
+                copied.add(id(child))
+                node[key] = child
+                if index_key is not None:
+                    index[index_key] = child
+                node = child
+
+            key = path[-1]
+            index_key = _index_key(index_key, key)
+            if key in node:
+                _unindex_value(index, index_key, node[key])
+            if value is MISSING:
+                node.pop(key, None)
+                if index_key is not None:
+                    index.pop(index_key, None)
+            else:
+                node[key] = copy.deepcopy(value)
+                _index_value(index, index_key, node[key])
+
+        self.__config_dict = root
+        self.__index = index
+
+    def start_auto_reload(self, interval: float = 1.0):
+        """Starts background (daemon) thread, polling tracked YAML files and reloading them (see reload())."""
+        if self.__reload_stop is not None:
+            return
+        stop = self.__reload_stop = threading.Event()
+
+        def poll():
+            while not stop.wait(interval):
+                try:
+                    self.reload()
+                except Exception as e:  # pylint: disable=W0718
+                    self.log.error("Configuration reload failed: %s", e)
+
+        threading.Thread(target=poll, name="config-auto-reload", daemon=True).start()
+        self.log.debug("Auto reload started, polling interval: %s sec.", interval)
+
+    def stop_auto_reload(self):
+        if self.__reload_stop is not None:
+            self.__reload_stop.set()
+            self.__reload_stop = None
+
+    def to_bytes(self):
+        """Serializes the configuration dictionary to the compact binary (marshal) form, e.g. for passing
+        configuration to the worker processes. Environment overlay isn't serialized - workers merge the
+        environment themselves (see merge_env()).
+        :raises ConfigError: if configuration contains values of non-basic types (e.g. dates)
+        """
+        return dumps_config(self.__config_dict)
 
-    # TODO: possible bug: if merge dict with multi-level keys (a.b.c), these keys can't be accessed by get()
-    def merge_dict(self, new_dict):
-        """Adds another dictionary (respecting nested sub-dictionaries) to config.
-        If there are same keys in both dictionaries, raise ConfigError (no overwrites!)
+    @classmethod
+    def from_bytes(cls, data, **kwargs):
+        """Creates configuration from the binary form (see to_bytes()) - without YAML parsing and merging.
+        :param kwargs: other arguments for the configuration constructor, e.g. resolve_templates
+        """
+        config = cls(**kwargs)
+        config.config_dict = loads_config(data)
+        return config
+
+    def write_mapped(self, file_path):
+        """Writes the configuration dictionary to the file, which can be mapped into the memory of any
+        number of processes (see MappedConfig) without copying it."""
+        write_mapped_config(self.__config_dict, file_path)
+
+    def merge_dict(self, new_dict, strategy=MERGE_ERROR):
+        """Adds another dictionary (respecting nested sub-dictionaries) to config. Dotted keys in the
+        dictionary (e.g. "a.b.c") are expanded to the nested dictionaries. If there are same keys in both
+        dictionaries (and at least one of values isn't a dictionary) - conflict is resolved by the strategy,
+        by default ConfigError is raised (no overwrites!), also for keys, which have values from the
+        environment (if merged). With other strategies environment keeps its priority on lookups.
         :param new_dict: dictionary to be added
         :type new_dict: dict
+        :param strategy: conflict resolution strategy - MERGE_ERROR/MERGE_OVERRIDE/MERGE_APPEND or callable,
+            see merge module
         """
-        self.log.debug("merge_dict() is working. Dictionary to merge [%s].", new_dict)
-        dict1 = self.config_dict
-        if len(dict1) != 0:
-            result = self.__add_entity__(dict1, new_dict)
-            self.config_dict = result
-        else:
-            self.config_dict.update(new_dict)
-
-    def __add_entity__(self, dict1, dict2, current_key=""):
-        """Adds second dictionary to the first (processing nested dicts recursively)
-        No overwriting is accepted.
-        :param dict1: target dictionary (exception raising if it is not dict)
-        :type dict1: dict
-        :param dict2: source dictionary (exception raising if it is not dict)
-        :type dict2: dict
-        :return: the first parameter (i.e. target dictionary)
-        :rtype: dict
+        check_strategy(strategy)
+        if not isinstance(new_dict, dict):
+            raise ConfigError(
+                f"Can't merge [{type(new_dict).__name__}] into the configuration, dict is expected!"
+            )
+        self.log.debug("merge_dict() is working. Merging [%s] top-level key(s).", len(new_dict))
+        with self.__write_lock:
+            self.__check_env_conflicts(new_dict, strategy)
+            try:
+                self.__merge(self.__writable_root(), self.__ingest(new_dict), strategy)
+            finally:
+                self.__invalidate(str(key).split(KEYS_SEPARATOR, 1)[0] for key in new_dict.keys())
+                self.__publish()
+
+    def __merge(self, target, source, strategy):
+        """Merges source dictionary into the target one iteratively (stack of nested dictionaries to merge).
+        New nested dictionaries from the source without dotted keys are referenced (not copied) and indexed,
+        nested dictionaries with dotted keys are copied, so the keys are expanded in the same pass."""
+        index = self.__index
+        # (target node, source node, dotted key of the node, path of the node as linked (parent path, key))
+        stack: list[tuple[dict[Any, Any], dict[Any, Any], str | None, tuple[Any, Any] | None]] = [
+            (target, source, "", None)
+        ]
+        while stack:
+            node, new_node, node_key, path = stack.pop()
+            prefix = None if node_key is None else (node_key + KEYS_SEPARATOR if node_key else "")
+            for key, value in new_node.items():
+                child_key = None
+                if isinstance(key, str):
+                    if KEYS_SEPARATOR in key:  # dotted key - nested dictionaries
+                        key, rest = key.split(KEYS_SEPARATOR, 1)
+                        value = {rest: value}
+                    if prefix is not None:
+                        child_key = prefix + key
+
+                if key in node:
+                    value = self.__merge_existing(node, key, child_key, (path, key), value, strategy, stack)
+                    if value is MISSING:  # nested dictionaries - merged later
+                        continue
+
+                # new nested dictionary is referenced, if it has dotted keys - copied (expanding them)
+                if isinstance(value, dict) and not _index_new_dict(index, child_key, value):
+                    child = self.__new_node()
+                    stack.append((child, value, child_key, (path, key)))
+                    value = child
+                node[key] = value
+                if child_key is not None:
+                    index[child_key] = value
+
+    def __merge_existing(self, node, key, child_key, path, value, strategy, stack):
+        """Merges value into the existing key of the node: nested dictionaries are scheduled for merging
+        (returns MISSING), for other values returns result of the conflict resolution."""
+        old = node[key]
+        if isinstance(old, dict) and isinstance(value, dict):
+            child = self.__writable(old)
+            if child is not old:
+                self.__attach(node, key, child_key, child)
+            stack.append((child, value, child_key, path))
+            return MISSING
+        value = resolve_conflict(strategy, _path_keys(path), old, value)
+        _unindex_value(self.__index, child_key, old)
+        return value
+
+    def __new_node(self):
+        """Returns new empty dictionary, which can be modified in place (until the next publishing)."""
+        node: dict[Any, Any] = {}
+        if self.__snapshot is not None:
+            self.__owned[id(node)] = node
+        return node
+
+    def __attach(self, node, key, index_key, value):
+        """Sets value for the key in the node and in the index (value isn't indexed recursively)."""
+        node[key] = value
+        if index_key is not None:
+            self.__index[index_key] = value
+
+    def merge_env(self, prefix="", separator=None):
+        """Adds environment variables to this config instance: environment overrides current values and
+        values, merged with merge_dict(). Values, set after this call (set(), append_dict()), override
+        the environment. Environment is consulted lazily on lookups and isn't copied into config_dict.
+        :param prefix: prefix of environment variables for the config (other variables are ignored)
+        :param separator: separator of nested levels in the environment variables names, e.g. with
+            prefix "APP__" and separator "__" variable APP__DB__HOST is mapped to the key "db.host"
         """
-        if isinstance(dict2, dict) and isinstance(dict1, dict):
-            for key in dict2.keys():
-                if key in dict1.keys():
-                    sep = "."
-                    if current_key == "":
-                        sep = ""
-                    self.__add_entity__(dict1[key], dict2[key], f"{current_key}{sep}{key}")
-                else:
-                    dict1[key] = dict2[key]
-        else:
-            raise ConfigError(f"Attempt of overwriting old {dict1} with new {dict2} to key {current_key}!")
-        return dict1
-
-    def merge_env(self):
-        """Adds environment variables to this config instance"""
-        self.log.debug("merge_env() is working.")
-        for item in os.environ:
-            self.config_dict[item.lower()] = os.environ[item]
+        self.log.debug("merge_env() is working. Prefix [%s], separator [%s].", prefix, separator)
+        with self.__write_lock:
+            self.__env = EnvironmentOverlay(prefix, separator)
+            self.__invalidate()
+            self.__publish()
+
+    def refresh_env(self):
+        """Re-reads environment variables on the next lookup (if environment is merged)."""
+        with self.__write_lock:
+            if self.__env is not None:
+                self.__env = self.__env.refreshed()
+                self.__invalidate()
+                self.__publish()
 
     def get(self, key, default=None):
         """Retrieves config value for given key.
@@ -179,72 +704,125 @@ class Configuration:
         :type default: Any
         :rtype: Any
         """
-        try:
-            result = self.__get_value(key, self.config_dict)
-            return result
-        except KeyError:
+        value = self.__raw_get(key) if self.__templates is None else self.__templates.get(key)
+        if value is MISSING:
             if default is not None:
                 return default
             raise ConfigError(f"Configuration entry [{key}] not found!")
+        return value
+
+    def keys(self):
+        """Returns top-level keys of the configuration, including keys from the environment (if merged)."""
+        keys = list(self.__config_dict)
+        if self.__env is not None:
+            known = set(keys)
+            for env_key in self.__env.keys():
+                top_key = env_key.split(KEYS_SEPARATOR, 1)[0]
+                if top_key not in known:
+                    known.add(top_key)
+                    keys.append(top_key)
+        return keys
+
+    def accessors(self, schema=None):
+        """Returns accessors (see ConfigAccessors) - objects of generated classes with __slots__ for the
+        configuration, so values are plain attributes: config.accessors(schema).root.db.primary.port.
+        Accessors are rebuilt after the configuration changes.
+        :param schema: optional nested dictionary of the types/converters for the configuration keys
+        :raises ConfigError: if configuration doesn't match the schema
+        """
+        return ConfigAccessors(self, schema)
+
+    def get_many(self, keys, default=None):
+        """Retrieves config values for several keys at once.
+        :param keys: iterable of (complex) keys
+        :return: dictionary {key: value}, see get() for the missing keys/default value
+        """
+        index, env, templates = self.__index, self.__env, self.__templates  # consistent state for all keys
+        values = {}
+        for key in keys:
+            if templates is not None:
+                value = templates.get(key)
+            else:
+                value = index.get(key, MISSING)
+                if env is not None:
+                    value = env.overlay(key, value)
+            if value is MISSING:
+                if default is None:
+                    raise ConfigError(f"Configuration entry [{key}] not found!")
+                value = default
+            values[key] = value
+        return values
+
+    def view(self, prefix):
+        """Returns view (see ConfigView) of the configuration subtree with the given (complex) prefix, lookups
+        through the view start from the subtree node.
+        :raises ConfigError: if there is no dictionary for the prefix
+        """
+        return ConfigView(self, prefix)
+
+    def __raw_get(self, key):
+        """Returns value for the key (with environment overlay, without templates resolution) or MISSING."""
+        value = self.__index.get(key, MISSING)
+        if self.__env is not None:
+            value = self.__env.overlay(key, value)
+        return value
 
     def set(self, key, value):
         """Sets config value, creating all the nested levels if necessary
         :type key: str
         :type value: Any
         """
-        keys = key.split(".")
-        values = self.config_dict
-        while len(keys) > 1:
-            cur = keys.pop(0)
-            if cur not in values:
-                values[cur] = {}
-            values = values[cur]
-        values[keys[0]] = value
+        with self.__write_lock:
+            if self.__env is not None:
+                self.__env = self.__env.shadowed(key)
+            self.__set(key, value)
+            self.__invalidate((key,))
+            self.__publish()
+
+    def __set(self, key, value):
+        keys = key.split(KEYS_SEPARATOR)
+        values = self.__writable_root()
+        index_key = ""
+        for cur in keys[:-1]:
+            index_key = _index_key(index_key, cur)
+            child = self.__writable(values[cur]) if cur in values else self.__new_node()
+            if cur not in values or child is not values[cur]:
+                values[cur] = child
+                self.__index[index_key] = child
+            values = child
+        self.__store(values, keys[-1], _index_key(index_key, keys[-1]), self.__ingest(value))
+
+    def __store(self, values, key, index_key, value):
+        """Stores value by the key into the given (nested) dictionary and updates the flat index:
+        nested values of the replaced value are dropped, nested values of the new one are added."""
+        if index_key is not None and key in values:
+            _unindex_value(self.__index, index_key, values[key])
+        values[key] = value
+        _index_value(self.__index, index_key, value)
 
     def resolve_and_set(self, key, value):
         """Performs template substitution in "value" using mapping from config (only top-level), then sets
-        it in config.
+        it in config. Substitution is eager, for the lazy resolution of the ${...} references (including
+        dotted keys) in all values use resolve_templates=True.
         :param key: key to assign value to (could be multi-level)
         :type key: str
         :param value: value with substitution patterns e.g. "system-$env" (see string.Template)
         :type value: str
         """
         template = Template(value)
-        resolved = template.substitute(self.config_dict)
+        mapping = dict(self.__config_dict)
+        if self.__env is not None:
+            mapping.update(self.__env.top_level())
+        resolved = template.substitute(mapping)
         self.set(key, resolved)
 
-    def __get_value(self, key, values):
-        """Internal method for using in "get", recursively search for dictionaries by key parts
-        and retrieves value.
-        :type key: str
-        :param values: dictionary to search in
-        :type values: dict
-        :rtype: Any
-        """
-        if not values:
-            raise KeyError
-
-        keys = key.split(".", 1)
-        if len(keys) < 2:
-            return values[keys[0]]
-
-        return self.__get_value(keys[1], values[keys[0]])
-
-    def __contains_key(self, key, values):
-        if not values:
-            return False
-        keys = key.split(".", 1)
-
-        if len(keys) < 2:
-            return keys[0] in values
-
-        return self.__contains_key(keys[1], values[keys[0]])
-
     def contains_key(self, key):
-        return self.__contains_key(key, self.config_dict)
+        if self.__env is not None:
+            return self.__raw_get(key) is not MISSING
+        return key in self.__index
 
     def __str__(self):
-        return str(self.config_dict)
+        return str(self.__config_dict)
 
 
 # numbers of name/value columns in excel config sheet
@@ -296,9 +874,12 @@ class ConfigurationXls(Configuration):
             is_merge_env=is_merge_env,
         )
 
-    def load_dict_from_xls(self, path_to_xls, config_sheet_name):
-        self.log.debug("load_dict_from_xls() is working.")
-        self.log.debug("Excel file [%s], config sheet [%s].", path_to_xls, config_sheet_name)
+    @classmethod
+    def load_dict_from_xls(cls, path_to_xls, config_sheet_name):
+        """Loads dictionary from the excel config sheet (without creating the configuration instance, e.g.
+        for the layer of LayeredConfiguration - see add_xls())."""
+        log.debug("load_dict_from_xls() is working.")
+        log.debug("Excel file [%s], config sheet [%s].", path_to_xls, config_sheet_name)
 
         # some preliminary checks (fast-fail)
         if not path_to_xls or not path_to_xls.strip():
@@ -308,38 +889,56 @@ class ConfigurationXls(Configuration):
 
         dictionary = {}  # dictionary loaded from excel file
 
-        # loading xls/xlsx workbook
+        # loading xls/xlsx workbook, config is loaded up to the first empty row
         if path_to_xls.endswith("xls"):  # load from excel file - format xls
-            excel_book = xlrd.open_workbook(path_to_xls, encoding_override=DEFAULT_ENCODING)
-            excel_sheet = excel_book.sheet_by_name(config_sheet_name)
-            self.log.debug("Loaded XLS config. Found [%s] row(s). Loading.", excel_sheet.nrows)
-            # loading dictionary from xls file
-            for rownumber in range(excel_sheet.nrows):
-                name = excel_sheet.cell_value(rownumber, NAMES_COLUMN)
-                value = excel_sheet.cell_value(rownumber, VALUES_COLUMN)
-                self.log.debug("XLS: loaded config parameter: %s = %s", name, value)
-                dictionary[name] = value
-
+            rows = cls.__xls_rows(path_to_xls, config_sheet_name)
         elif path_to_xls.endswith("xlsx"):  # load from excel file - format xlsx
-            # load workbook by the given path
-            excel_book = openpyxl.load_workbook(path_to_xls)  # type: ignore
-            excel_sheet = excel_book[config_sheet_name]  # specified sheet by name
-            self.log.debug("Loaded XLSX config. Found [%s] row(s). Loading.", excel_sheet.max_row)
-            for rownumber in range(excel_sheet.max_row):
-                name = excel_sheet.cell(row=rownumber + 1, column=NAMES_COLUMN + 1).value
-                value = excel_sheet.cell(row=rownumber + 1, column=VALUES_COLUMN + 1).value
-                self.log.debug("XLSX: loaded config parameter: %s = %s", name, value)
-                dictionary[name] = value
-
+            rows = cls.__xlsx_rows(path_to_xls, config_sheet_name)
         else:  # unknown extension of excel file - raise an issue
             raise ConfigError(f"Provided unknown excel file extension [{path_to_xls}]!")
 
-        self.log.info("Loaded dictionary from xls config:\n\t%s", dictionary)
-        return dictionary
+        try:
+            for name, value in rows:
+                if name in (None, "") and value in (None, ""):  # empty row - end of config
+                    break
+                dictionary[name] = value
+        finally:
+            rows.close()  # workbook is closed immediately, even if not all rows were read
 
+        log.info("Loaded [%s] config parameter(s) from xls config.", len(dictionary))
+        log.debug("Loaded dictionary from xls config:\n\t%s", dictionary)
+        return dictionary
 
-class ConfigError(Exception):
-    """Invalid configuration error"""
+    @staticmethod
+    def __xls_rows(path_to_xls, config_sheet_name):
+        """Yields (name, value) rows of the xls config sheet. Workbook is opened on demand - only the config
+        sheet is loaded."""
+        excel_book = xlrd.open_workbook(path_to_xls, encoding_override=DEFAULT_ENCODING, on_demand=True)
+        try:
+            excel_sheet = excel_book.sheet_by_name(config_sheet_name)
+            log.debug("Loaded XLS config. Found [%s] row(s). Loading.", excel_sheet.nrows)
+            for rownumber in range(excel_sheet.nrows):
+                name = excel_sheet.cell_value(rownumber, NAMES_COLUMN)
+                yield name, excel_sheet.cell_value(rownumber, VALUES_COLUMN)
+        finally:
+            excel_book.release_resources()
+
+    @staticmethod
+    def __xlsx_rows(path_to_xls, config_sheet_name):
+        """Yields (name, value) rows of the xlsx config sheet. Workbook is opened in read-only mode - rows are
+        streamed from the file, cells aren't kept in memory."""
+        excel_book = openpyxl.load_workbook(path_to_xls, read_only=True, data_only=True)  # type: ignore
+        try:
+            excel_sheet = excel_book[config_sheet_name]  # specified sheet by name
+            log.debug("Loaded XLSX config. Loading.")
+            first_column, last_column = sorted((NAMES_COLUMN, VALUES_COLUMN))
+            for row in excel_sheet.iter_rows(
+                min_col=first_column + 1, max_col=last_column + 1, values_only=True
+            ):
+                row = row + (None,) * (last_column - first_column + 1 - len(row))  # trailing empty cells
+                yield row[NAMES_COLUMN - first_column], row[VALUES_COLUMN - first_column]
+        finally:
+            excel_book.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+Environment overlay for the Configuration class. Environment variables aren't copied into the
+configuration dictionary - the overlay is consulted on lookups and overrides configuration values.
+Environment variable name is mapped to the configuration key: prefix is removed, the rest is split
+by the separator (if any) and lower-cased, e.g. with prefix "APP__" and separator "__" variable
+APP__DB__HOST -> key "db.host". Without prefix/separator variable PATH -> key "path".
+
+Environment is read on the first lookup, resolution of each key is memoized (use refreshed() to
+get the overlay, which re-reads the environment).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import logging
+import os
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+MISSING: Any = object()  # marker for the missing value (None is a valid configuration value)
+_HIDDEN: Any = object()  # marker for the key, hidden by the environment value of its parent key
+
+
+def _ancestors(key: str):
+    """Yields the key itself and all its parent keys: a.b.c -> a.b.c, a.b, a."""
+    while key:
+        yield key
+        key = key.rpartition(".")[0]
+
+
+class EnvironmentOverlay:
+    """Lazily consulted environment layer on top of the configuration values."""
+
+    def __init__(
+        self,
+        prefix: str = "",
+        separator: str | None = None,
+        shadowed: FrozenSet[str] = frozenset(),
+        values: Dict[str, str] | None = None,
+    ) -> None:
+        self.prefix = prefix
+        self.separator = separator
+        self.__values: Dict[str, str] | None = values  # configuration key -> environment value
+        self.__memo: Dict[str, Tuple[Any, Dict[str, str]]] = {}  # key -> (env value, nested env values)
+        self.__shadowed = shadowed  # keys, set in the configuration after the environment
+        self.__has_nested = values is not None and any("." in key for key in values)
+
+    def env_key(self, name: str) -> str | None:
+        """Maps environment variable name to the configuration key (None - variable is skipped)."""
+        if self.prefix:
+            prefix_length = len(self.prefix)
+            if not name.upper().startswith(self.prefix.upper()):
+                return None
+            name = name[prefix_length:]
+        if not self.separator:
+            return name.lower() or None
+        parts = [part.lower() for part in name.split(self.separator)]
+        return ".".join(parts) if all(parts) else None
+
+    def __load(self) -> Dict[str, str]:
+        values = {}
+        for name, value in os.environ.items():
+            key = self.env_key(name)
+            if key is not None:
+                values[key] = value
+        log.debug("Environment overlay: loaded %s variable(s).", len(values))
+        self.__has_nested = any("." in key for key in values)
+        self.__values = values
+        return values
+
+    def refreshed(self) -> "EnvironmentOverlay":
+        """Returns new overlay (with the same settings) which will re-read environment on the first lookup."""
+        return EnvironmentOverlay(self.prefix, self.separator, self.__shadowed)
+
+    def shadowed(self, *keys: str) -> "EnvironmentOverlay":
+        """Returns new overlay with the keys (and all nested keys) marked as set in the configuration after
+        the environment, so configuration values have priority over the environment for them. Overlay
+        itself isn't changed - it can be shared by the configuration snapshots."""
+        return EnvironmentOverlay(self.prefix, self.separator, self.__shadowed.union(keys), self.__values)
+
+    def __resolve(self, key: str) -> Tuple[Any, Dict[str, str]]:
+        values = self.__values if self.__values is not None else self.__load()
+        if any(ancestor in self.__shadowed for ancestor in _ancestors(key)):
+            return MISSING, {}
+
+        for ancestor in _ancestors(key):  # the nearest value from the environment wins
+            if ancestor in values:
+                return (values[ancestor] if ancestor == key else _HIDDEN), {}
+        if not self.__has_nested:
+            return MISSING, {}
+
+        prefix = key + "."
+        nested = {
+            env_key.removeprefix(prefix): value
+            for env_key, value in values.items()
+            if env_key.startswith(prefix) and not any(a in self.__shadowed for a in _ancestors(env_key))
+        }
+        return MISSING, nested
+
+    def overlay(self, key: str, value: Any) -> Any:
+        """Returns value for the key with the environment applied on top of the configuration value.
+        :param value: configuration value for the key or MISSING
+        :return: resulting value or MISSING
+        """
+        try:
+            env_value, nested = self.__memo[key]
+        except KeyError:
+            env_value, nested = self.__memo[key] = self.__resolve(key)
+
+        if env_value is _HIDDEN:
+            return MISSING
+        if env_value is not MISSING:
+            return env_value
+        if not nested or (value is not MISSING and not isinstance(value, dict)):
+            return value
+
+        result = _copy_dict(value) if value is not MISSING else {}
+        for nested_key, nested_value in nested.items():
+            *parents, last = nested_key.split(".")
+            node = result
+            for part in parents:
+                if not isinstance(node.get(part), dict):
+                    node[part] = {}
+                node = node[part]
+            node[last] = nested_value
+        return result
+
+    def keys(self) -> List[str]:
+        """Returns configuration keys of the environment values which aren't shadowed by the configuration."""
+        values = self.__values if self.__values is not None else self.__load()
+        return [key for key in values if not any(a in self.__shadowed for a in _ancestors(key))]
+
+    def top_level(self) -> Dict[str, str]:
+        """Returns top-level (not nested) environment values which aren't shadowed by the configuration."""
+        values = self.__values if self.__values is not None else self.__load()
+        return {key: value for key, value in values.items() if "." not in key and key not in self.__shadowed}
+
+
+def _copy_dict(dictionary: Dict[str, Any]) -> Dict[str, Any]:
+    """Copies nested dictionaries (not the leaf values)."""
+    return {key: _copy_dict(value) if isinstance(value, dict) else value for key, value in dictionary.items()}
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
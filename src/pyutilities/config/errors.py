@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+"""
+Exceptions of the configuration package.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+
+class ConfigError(Exception):
+    """Invalid configuration error"""
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Layered configuration: stack of separate configuration sources (YAML files, dictionaries, environment),
+which aren't merged into one dictionary. Lookup resolves the key through the layers by precedence (the
+last added layer has the highest precedence):
+    - the highest layer with a non-dictionary value for the key wins;
+    - dictionary values from the layers are deep merged (higher layers override lower ones);
+    - non-dictionary value of the parent key in a higher layer hides the key in lower layers.
+Resolved values are cached per key, cache is dropped when a layer is added/removed/replaced, so these
+operations are O(1) (no re-merging). Layers aren't copied - after modification of the layer dictionary
+call invalidate(). Dictionary values are returned as read-only views (see ReadOnlyDict), so callers can't
+modify the layers or the cached merged values.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Tuple
+
+from pyutilities.config.configuration import Configuration, ConfigurationXls
+from pyutilities.config.environment import MISSING, EnvironmentOverlay, _ancestors
+from pyutilities.config.errors import ConfigError
+from pyutilities.config.snapshot import ReadOnlyDict, thaw_value
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+RUNTIME_LAYER = "runtime"  # layer for the values, set by LayeredConfiguration.set()
+_HIDDEN: Any = object()  # marker: key is hidden by the non-dictionary value of its parent
+
+
+class DictLayer:
+    """Configuration layer, backed by the (nested) dictionary."""
+
+    def __init__(self, name: str, values: Dict[str, Any]) -> None:
+        self.name = name
+        self.values = values
+
+    def lookup(self, key: str) -> Any:
+        """Returns value for the key, MISSING (no value) or _HIDDEN (parent key has non-dictionary value)."""
+        value: Any = self.values
+        for part in key.split("."):
+            if not isinstance(value, dict):
+                return _HIDDEN
+            value = value.get(part, MISSING)
+            if value is MISSING:
+                return MISSING
+        return value
+
+    def keys(self) -> List[str]:
+        """Returns top-level keys of the layer."""
+        return list(self.values)
+
+
+class EnvLayer:
+    """Configuration layer, backed by the environment variables (see EnvironmentOverlay)."""
+
+    def __init__(self, name: str, prefix: str = "", separator: str | None = None) -> None:
+        self.name = name
+        self.overlay = EnvironmentOverlay(prefix, separator)
+
+    def lookup(self, key: str) -> Any:
+        """Returns value for the key, MISSING or _HIDDEN (see DictLayer.lookup())."""
+        for ancestor in _ancestors(key.rpartition(".")[0]):
+            parent = self.overlay.overlay(ancestor, MISSING)
+            if parent is not MISSING and not isinstance(parent, dict):
+                return _HIDDEN
+        return self.overlay.overlay(key, MISSING)
+
+    def keys(self) -> List[str]:
+        """Returns top-level keys of the layer."""
+        return list(dict.fromkeys(key.split(".", 1)[0] for key in self.overlay.keys()))
+
+
+def _deep_merge(values: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Deep merges dictionaries (from the highest precedence to the lowest) into the new dictionary."""
+    result: Dict[str, Any] = {}
+    # the lowest precedence dictionary is on top of the stack - it is merged first (with all nested ones)
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(result, value) for value in values]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                if not isinstance(target.get(key), dict):
+                    target[key] = {}
+                stack.append((target[key], value))
+            else:
+                target[key] = value
+    return result
+
+
+class LayeredConfiguration:
+    """Stack of configuration layers with per-key resolution cache."""
+
+    def __init__(self) -> None:
+        self.log = logging.getLogger(__name__)
+        self.log.addHandler(logging.NullHandler())
+        self.__layers: List[Any] = []  # from the lowest precedence to the highest, replaced on changes
+        self.__cache: Dict[str, Any] = {}
+        self.__lock = threading.RLock()
+
+    @property
+    def layers(self) -> List[str]:
+        """Names of the layers, from the lowest precedence to the highest."""
+        return [layer.name for layer in self.__layers]
+
+    def __find(self, name: str) -> int:
+        for position, layer in enumerate(self.__layers):
+            if layer.name == name:
+                return position
+        raise ConfigError(f"Configuration layer [{name}] not found!")
+
+    def add_layer(self, layer) -> None:
+        """Adds the layer (object with [name] attribute and lookup(key) method) on top of the stack. Runtime
+        layer (see set()) stays on top."""
+        with self.__lock:
+            if layer.name in self.layers:
+                raise ConfigError(f"Configuration layer [{layer.name}] already exists!")
+            layers = list(self.__layers)
+            if layers and layers[-1].name == RUNTIME_LAYER:
+                layers.insert(len(layers) - 1, layer)
+            else:
+                layers.append(layer)
+            self.__update(layers)
+
+    def add_dict(self, name: str, values: Dict[str, Any]) -> None:
+        """Adds the dictionary as a layer (dictionary isn't copied)."""
+        if not isinstance(values, dict):
+            raise ConfigError(f"Provided unknown type [{type(values)}] of dictionary for layer [{name}]!")
+        self.add_layer(DictLayer(name, values))
+
+    def add_yaml(self, path: str, name: str | None = None) -> None:
+        """Adds YAML file (or all YAML files from the directory, see Configuration.load()) as a layer."""
+        config = Configuration(is_merge_env=False)
+        config.load(path, is_merge_env=False)
+        self.add_dict(name or path, config.config_dict)
+
+    def add_xls(self, path: str, sheet_name: str, name: str | None = None) -> None:
+        """Adds excel config sheet (see ConfigurationXls) as a layer."""
+        self.add_dict(name or path, ConfigurationXls.load_dict_from_xls(path, sheet_name))
+
+    def add_env(self, prefix: str = "", separator: str | None = None, name: str = "env") -> None:
+        """Adds environment variables (with the optional prefix/nested keys separator) as a layer."""
+        self.add_layer(EnvLayer(name, prefix, separator))
+
+    def remove_layer(self, name: str) -> None:
+        """Removes the layer by name."""
+        with self.__lock:
+            layers = list(self.__layers)
+            del layers[self.__find(name)]
+            self.__update(layers)
+
+    def replace_layer(self, layer) -> None:
+        """Replaces the layer with the same name (keeping its precedence)."""
+        with self.__lock:
+            layers = list(self.__layers)
+            layers[self.__find(layer.name)] = layer
+            self.__update(layers)
+
+    def __update(self, layers: List[Any]) -> None:
+        """Replaces the layers list (readers iterate over the old list without locks)."""
+        self.__layers = layers
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drops resolved values (should be called after modification of the layer dictionary)."""
+        self.__cache = {}
+
+    def set(self, key: str, value: Any) -> None:
+        """Sets value in the runtime layer, which has the highest precedence."""
+        with self.__lock:
+            if not self.__layers or self.__layers[-1].name != RUNTIME_LAYER:
+                self.__update(self.__layers + [DictLayer(RUNTIME_LAYER, {})])
+            node = self.__layers[-1].values
+            *parents, last = key.split(".")
+            for part in parents:
+                if not isinstance(node.get(part), dict):
+                    node[part] = {}
+                node = node[part]
+            node[last] = value
+            self.invalidate()
+
+    def __resolve(self, key: str) -> Any:
+        dictionaries: List[Dict[Any, Any]] = []  # dictionary values from the highest precedence to the lowest
+        for layer in reversed(self.__layers):  # from the highest precedence
+            value = layer.lookup(key)
+            if value is MISSING:
+                continue
+            if value is _HIDDEN or not isinstance(value, dict):
+                if not dictionaries:
+                    return MISSING if value is _HIDDEN else value
+                break  # lower layers are hidden
+            dictionaries.append(value)
+        if not dictionaries:
+            return MISSING
+        return dictionaries[0] if len(dictionaries) == 1 else _deep_merge(dictionaries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieves config value for the key, see Configuration.get()."""
+        cache = self.__cache
+        try:
+            value = cache[key]
+        except KeyError:
+            value = cache[key] = self.__resolve(key)
+        if value is MISSING:
+            if default is not None:
+                return default
+            raise ConfigError(f"Configuration entry [{key}] not found!")
+        return ReadOnlyDict(value) if isinstance(value, dict) else value
+
+    def contains_key(self, key: str) -> bool:
+        """Checks if the key is present in any of the layers (and isn't hidden)."""
+        return self.get(key, MISSING) is not MISSING
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns merged dictionary of all layers (mutable copy)."""
+        keys = dict.fromkeys(key for layer in self.__layers for key in layer.keys())
+        return {key: thaw_value(self.get(key)) for key in keys if self.contains_key(key)}
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+Conflict resolution strategies for the Configuration.merge_dict(). Nested dictionaries are always merged
+key by key, strategy is used for the conflicting values (key exists in both dictionaries and at least one
+of the values isn't a dictionary):
+    - MERGE_ERROR: raise ConfigError (default, no overwrites)
+    - MERGE_OVERRIDE: new value replaces the old one
+    - MERGE_APPEND: lists are concatenated (old + new), other conflicts raise ConfigError
+Strategy can be also a callable (dotted key, old value, new value) -> resulting value, which can raise
+ConfigError to reject the conflict.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+from typing import Any, Callable, Tuple
+
+from pyutilities.config.errors import ConfigError
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+MERGE_ERROR = "error"
+MERGE_OVERRIDE = "override"
+MERGE_APPEND = "append"
+MERGE_STRATEGIES = (MERGE_ERROR, MERGE_OVERRIDE, MERGE_APPEND)
+
+
+def check_strategy(strategy: str | Callable[[str, Any, Any], Any]) -> None:
+    """Fast-fail check of the strategy (before any changes are made)."""
+    if not callable(strategy) and strategy not in MERGE_STRATEGIES:
+        raise ConfigError(
+            f"Unknown merge strategy [{strategy}], expected one of {MERGE_STRATEGIES} or callable!"
+        )
+
+
+def resolve_conflict(
+    strategy: str | Callable[[str, Any, Any], Any], path: Tuple[Any, ...], old: Any, new: Any
+) -> Any:
+    """Returns resulting value for the conflicting values old/new for the key with the given path."""
+    key = ".".join(str(part) for part in path)
+    if callable(strategy):
+        return strategy(key, old, new)
+    if strategy == MERGE_OVERRIDE:
+        return new
+    if strategy == MERGE_APPEND and isinstance(old, list) and isinstance(new, list):
+        return old + new
+    raise ConfigError(f"Attempt of overwriting old {old} with new {new} to key {key}!")
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Immutable snapshots of the Configuration. Snapshot shares nested dictionaries with the configuration
+(structural sharing), configuration never modifies shared dictionaries after the snapshot is published
+(copy-on-write), so snapshot can be read from any number of threads without synchronization.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, cast
+
+from pyutilities.config.environment import MISSING, EnvironmentOverlay
+from pyutilities.config.errors import ConfigError
+from pyutilities.config.templates import TemplateResolver
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+
+def freeze_value(value: Any) -> Any:
+    """Returns read-only view of the value: dictionaries are wrapped into ReadOnlyDict, lists are
+    converted to tuples, other values are returned as is."""
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return tuple(freeze_value(item) for item in value)
+    return value
+
+
+def thaw_value(value: Any) -> Any:
+    """Returns mutable deep copy of the (frozen) value: mappings -> dicts, tuples/lists -> lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_value(item) for item in value]
+    return value
+
+
+class ReadOnlyDict(Mapping[Any, Any]):
+    """Read-only view of the (nested) dictionary, nested values are wrapped on access."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[Any, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: Any) -> Any:
+        return freeze_value(self._data[key])
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+
+class ConfigSnapshot:
+    """Immutable state of the Configuration at the moment of publishing. Resolved values are memoized,
+    so repeated lookups of the same key are a single dictionary lookup."""
+
+    def __init__(
+        self,
+        config_dict: Dict[Any, Any],
+        env: EnvironmentOverlay | None,
+        version: int,
+        resolve_templates: bool = False,
+    ) -> None:
+        self.__config_dict = config_dict
+        self.__env = env
+        self.__cache: Dict[str, Any] = {}
+        self.__templates = TemplateResolver(self.__raw_lookup) if resolve_templates else None
+        self.version = version
+
+    def __raw_lookup(self, key: str) -> Any:
+        value: Any = self.__config_dict
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                value = MISSING
+                break
+            value = value[part]
+        if self.__env is not None:
+            value = self.__env.overlay(key, value)
+        return value
+
+    def __lookup(self, key: str) -> Any:
+        value = self.__raw_lookup(key) if self.__templates is None else self.__templates.get(key)
+        return freeze_value(value) if value is not MISSING else MISSING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieves config value for the given (dotted) key, see Configuration.get()."""
+        try:
+            value = self.__cache[key]
+        except KeyError:
+            value = self.__cache[key] = self.__lookup(key)
+        if value is MISSING:
+            if default is not None:
+                return default
+            raise ConfigError(f"Configuration entry [{key}] not found!")
+        return value
+
+    def contains_key(self, key: str) -> bool:
+        if self.__templates is not None:  # don't resolve templates just for the check
+            return self.__raw_lookup(key) is not MISSING
+        try:
+            value = self.__cache[key]
+        except KeyError:
+            value = self.__cache[key] = self.__lookup(key)
+        return value is not MISSING
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """Returns mutable deep copy of the snapshot configuration dictionary (without environment)."""
+        return cast(Dict[Any, Any], thaw_value(self.__config_dict))
+
+    def __str__(self) -> str:
+        return str(self.__config_dict)
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lazy resolution of the ${...} references in the configuration values. Reference contains (dotted) key of
+another configuration value, e.g. "http://${db.host}:${db.port}/", "$$" is an escaped "$". Value, which is
+a single reference (e.g. "${db}"), is replaced with the referenced value as is (keeps its type), in other
+cases the referenced values are converted to strings. References are resolved recursively in the nested
+dictionaries and lists.
+
+Values are resolved on the first lookup and memoized. Resolver tracks dependencies (referenced keys,
+including the transitive ones), so change of the key invalidates only values which depend on it.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Set
+
+from pyutilities.config.environment import MISSING, _ancestors
+from pyutilities.config.errors import ConfigError
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+_REFERENCE = re.compile(r"\$(?:(\$)|\{([^${}]+)\})")  # $$ or ${key}
+
+
+def substitute(value: Any, reference: Callable[[str], Any]) -> Any:
+    """Substitutes references in the value (recursively for dictionaries and lists). Values without
+    references are returned as is (not copied).
+    :param reference: callable, returns (resolved) value for the referenced key
+    """
+    if isinstance(value, str):
+        if "$" not in value:
+            return value
+        match = _REFERENCE.fullmatch(value.strip())
+        if match is not None and match.group(2) is not None:  # single reference - keep the type
+            return reference(match.group(2).strip())
+        return _REFERENCE.sub(lambda m: "$" if m.group(1) else str(reference(m.group(2).strip())), value)
+    if isinstance(value, dict):
+        resolved = {key: substitute(item, reference) for key, item in value.items()}
+        return value if all(resolved[key] is item for key, item in value.items()) else resolved
+    if isinstance(value, list):
+        items = [substitute(item, reference) for item in value]
+        return value if all(new is old for new, old in zip(items, value)) else items
+    return value
+
+
+class TemplateResolver:
+    """Memoized resolver of the references for the configuration values."""
+
+    def __init__(self, lookup: Callable[[str], Any]) -> None:
+        """:param lookup: callable, returns raw (not resolved) value for the key or MISSING"""
+        self.__lookup = lookup
+        self.__cache: Dict[str, Any] = {}  # key -> resolved value
+        self.__deps: Dict[str, FrozenSet[str]] = {}  # key -> key itself + all referenced keys
+        self.__dependents: Dict[str, Set[str]] = {}  # key -> resolved keys, which depend on it
+        self.__nested_dependents: Dict[str, Set[str]] = {}  # key -> resolved keys, depending on nested keys
+        self.__lock = threading.RLock()
+
+    def get(self, key: str) -> Any:
+        """Returns resolved value for the key or MISSING."""
+        try:
+            return self.__cache[key]
+        except KeyError:
+            with self.__lock:
+                return self.__resolve(key, [])
+
+    def __resolve(self, key: str, stack: List[str]) -> Any:
+        if key in self.__cache:
+            return self.__cache[key]
+        if key in stack:
+            start = stack.index(key)
+            cycle = " -> ".join(stack[start:] + [key])
+            raise ConfigError(f"Cyclic reference in configuration: {cycle}!")
+
+        deps = {key}
+
+        def reference(ref: str) -> Any:
+            ref_value = self.__resolve(ref, stack)
+            deps.update(self.__deps[ref])
+            if ref_value is MISSING:
+                raise ConfigError(f"Configuration entry [{ref}], referenced by [{key}], not found!")
+            return ref_value
+
+        stack.append(key)
+        try:
+            value = self.__lookup(key)
+            if value is not MISSING:
+                value = substitute(value, reference)
+        finally:
+            stack.pop()
+
+        self.__cache[key] = value
+        self.__deps[key] = frozenset(deps)
+        for dep in deps:
+            self.__dependents.setdefault(dep, set()).add(key)
+            for ancestor in _ancestors(dep.rpartition(".")[0]):
+                self.__nested_dependents.setdefault(ancestor, set()).add(key)
+        return value
+
+    def invalidate(self, keys: Iterable[str] | None = None) -> None:
+        """Drops resolved values, which depend on the changed keys (on the key itself, its parent or nested
+        keys). Without keys - drops all resolved values."""
+        with self.__lock:
+            if keys is None:
+                self.__cache.clear()
+                self.__deps.clear()
+                self.__dependents.clear()
+                self.__nested_dependents.clear()
+                return
+            affected: Set[str] = set()
+            for key in keys:
+                for ancestor in _ancestors(key):
+                    affected.update(self.__dependents.get(ancestor, ()))
+                affected.update(self.__nested_dependents.get(key, ()))
+            for key in affected:
+                self.__forget(key)
+
+    def __forget(self, key: str) -> None:
+        self.__cache.pop(key, None)
+        for dep in self.__deps.pop(key, ()):
+            self.__dependents.get(dep, set()).discard(key)
+            for ancestor in _ancestors(dep.rpartition(".")[0]):
+                self.__nested_dependents.get(ancestor, set()).discard(key)
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
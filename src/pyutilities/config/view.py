@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+Prefix-scoped view of the Configuration (see Configuration.view()). View is bound to the subtree node of
+the configuration (with environment overlay and resolved templates applied), lookups through the view
+start from this node. Typed accessors (get_int(), get_bool() etc.) memoize converted values. Node and
+memoized values are dropped, when the configuration is changed (configuration version is increased).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, cast
+
+from pyutilities.config.environment import MISSING
+from pyutilities.config.errors import ConfigError
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+TRUE_VALUES = frozenset(("true", "yes", "y", "on", "1"))
+FALSE_VALUES = frozenset(("false", "no", "n", "off", "0"))
+
+T = TypeVar("T")
+
+
+def to_bool(value: Any) -> bool:
+    """Converts config value to bool: bool/int values as is, strings - true/yes/y/on/1 or false/no/n/off/0
+    (case-insensitive)."""
+    if isinstance(value, (bool, int)):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"Can't convert [{value}] to bool!")
+
+
+def to_list(value: Any) -> List[Any]:
+    """Converts config value to list: lists/tuples as is, strings are split by comma."""
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return [value]
+
+
+class ConfigView:
+    """Read-only view of the configuration subtree with the given (dotted) prefix."""
+
+    __slots__ = ("__config", "__prefix", "__state")
+
+    def __init__(self, config, prefix: str) -> None:
+        self.__config = config
+        self.__prefix = prefix
+        # (config version, subtree node, memoized typed values) - replaced as a whole
+        self.__state: Tuple[int, Dict[Any, Any], Dict[Tuple[str, Callable[[Any], Any]], Any]] = self.__load()
+
+    @property
+    def prefix(self) -> str:
+        return self.__prefix
+
+    def __load(self):
+        version = self.__config.version
+        node = self.__config.get(self.__prefix, MISSING)
+        if node is MISSING:
+            raise ConfigError(f"Configuration entry [{self.__prefix}] not found!")
+        if not isinstance(node, dict):
+            raise ConfigError(f"Configuration entry [{self.__prefix}] isn't a dictionary!")
+        return version, node, {}
+
+    def __current(self):
+        state = self.__state
+        if state[0] != self.__config.version:  # configuration changed - re-bind to the new node
+            state = self.__state = self.__load()
+        return state
+
+    def __lookup(self, node: Dict[Any, Any], key: str) -> Any:
+        if "." not in key:  # fast path - direct child of the node
+            return node.get(key, MISSING)
+        value: Any = node
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return MISSING
+            value = value[part]
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieves value for the key (relative to the view prefix), see Configuration.get()."""
+        value = self.__lookup(self.__current()[1], key)
+        if value is MISSING:
+            if default is not None:
+                return default
+            raise ConfigError(f"Configuration entry [{self.__prefix}.{key}] not found!")
+        return value
+
+    def get_many(self, keys, default: Any = None) -> Dict[str, Any]:
+        """Retrieves values for several keys (relative to the view prefix): {key: value}."""
+        return {key: self.get(key, default) for key in keys}
+
+    def contains_key(self, key: str) -> bool:
+        return self.__lookup(self.__current()[1], key) is not MISSING
+
+    def __contains__(self, key: str) -> bool:
+        return self.contains_key(key)
+
+    def view(self, prefix: str) -> "ConfigView":
+        """Returns view of the nested subtree (prefix is relative to this view)."""
+        return ConfigView(self.__config, f"{self.__prefix}.{prefix}")
+
+    def get_typed(self, key: str, converter: Callable[[Any], T], default: T | None = None) -> T:
+        """Retrieves value for the key, converted by the converter. Converted values are memoized (until
+        the configuration is changed), default value isn't converted."""
+        _, node, converted = self.__current()
+        try:
+            return cast(T, converted[(key, converter)])
+        except KeyError:
+            pass
+        value = self.__lookup(node, key)
+        if value is MISSING:
+            if default is not None:
+                return default
+            raise ConfigError(f"Configuration entry [{self.__prefix}.{key}] not found!")
+        try:
+            result = converted[(key, converter)] = converter(value)
+        except (TypeError, ValueError) as e:
+            raise ConfigError(
+                f"Invalid value [{value}] of the configuration entry [{self.__prefix}.{key}]!"
+            ) from e
+        return result
+
+    def get_str(self, key: str, default: str | None = None) -> str:
+        return self.get_typed(key, str, default)
+
+    def get_int(self, key: str, default: int | None = None) -> int:
+        return self.get_typed(key, int, default)
+
+    def get_float(self, key: str, default: float | None = None) -> float:
+        return self.get_typed(key, float, default)
+
+    def get_bool(self, key: str, default: bool | None = None) -> bool:
+        return self.get_typed(key, to_bool, default)
+
+    def get_list(self, key: str, default: List[Any] | None = None) -> List[Any]:
+        return self.get_typed(key, to_list, default)
+
+    def __repr__(self) -> str:
+        return f"ConfigView({self.__prefix!r})"
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
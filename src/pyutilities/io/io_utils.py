@@ -4,7 +4,7 @@
 IO Utilities module.
 
 Created:  Dmitrii Gusev, 04.04.2017
-Modified: Dmitrii Gusev, 17.04.2026
+Modified: Dmitrii Gusev, 18.10.2026
 """
 
 import errno
@@ -27,6 +27,28 @@ log = logging.getLogger(__name__)
 # to avoid errors like 'no handlers' for libraries it's necessary/convenient to add NullHandler.
 log.addHandler(logging.NullHandler())
 
+# YAML loaders: C loader (based on libyaml) is much faster, but it is available only if PyYAML was
+# built with libyaml, pure python loader is available always
+YAML_LOADER_AUTO = "auto"  # C loader if it is available, otherwise - pure python loader
+YAML_LOADER_C = "c"
+YAML_LOADER_PYTHON = "python"
+YAML_C_LOADER_AVAILABLE: bool = hasattr(yaml, "CSafeLoader")
+
+
+class _NoTabsReader:
+    """File-like wrapper that checks the content for 'tab' characters while YAML parser reads it,
+    so the check doesn't need a separate pass through the file content."""
+
+    def __init__(self, stream, file_path):
+        self.stream = stream
+        self.name = file_path
+
+    def read(self, size=-1):
+        chunk = self.stream.read(size)
+        if "\t" in chunk:  # no tabs allowed in file content
+            raise IOError(f"Config file [{self.name}] contains 'tab' character!")
+        return chunk
+
 
 def _list_files(path, files_buffer, out_to_console=False):
     """Internal function for listing (recursively) all files in specified directory. Don't use it directly,
@@ -97,9 +119,10 @@ def file_2_str(filename: str, encoding: str = DEFAULT_ENCODING) -> str:
         return infile.read()
 
 
-def read_yaml(file_path: str, encoding: str = DEFAULT_ENCODING):
+def read_yaml(file_path: str, encoding: str = DEFAULT_ENCODING, loader: str = YAML_LOADER_AUTO):
     """Parses single YAML file and return its contents as object (dictionary).
     :param file_path: path to YAML file to load settings from
+    :param loader: YAML loader to use: auto (C loader if available, fallback to pure python one), c, python
     :return python object with YAML file contents
     """
 
@@ -108,11 +131,18 @@ def read_yaml(file_path: str, encoding: str = DEFAULT_ENCODING):
     if not file_path or not file_path.strip():  # fail-fast check
         raise IOError("Empty path to YAML file!")
 
-    with open(file_path, "r", encoding=encoding) as cfg_file:  # reading file
-        cfg_file_content = cfg_file.read()
-        if "\t" in cfg_file_content:  # no tabs allowed in file content
-            raise IOError(f"Config file [{file_path}] contains 'tab' character!")
-        return yaml.safe_load(cfg_file_content)
+    yaml_loader: type[yaml.CSafeLoader] | type[yaml.SafeLoader]
+    if loader == YAML_LOADER_C or (loader == YAML_LOADER_AUTO and YAML_C_LOADER_AVAILABLE):
+        if not YAML_C_LOADER_AVAILABLE:
+            raise PyUtilitiesException("YAML C loader isn't available (PyYAML is built without libyaml)!")
+        yaml_loader = yaml.CSafeLoader
+    elif loader in (YAML_LOADER_PYTHON, YAML_LOADER_AUTO):
+        yaml_loader = yaml.SafeLoader
+    else:
+        raise PyUtilitiesException(f"Unknown YAML loader [{loader}]!")
+
+    with open(file_path, "r", encoding=encoding) as cfg_file:  # reading + parsing file in one pass
+        return yaml.load(_NoTabsReader(cfg_file, file_path), Loader=yaml_loader)
 
 
 def compress_file(input_file, output_file):
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Asyncio HTTP client module, based on aiohttp module. Client has the same constructor parameters and
+the same retry/timeout semantics as HttpClient (see http_client module): retry strategy (statuses for
+retry, backoff, Retry-After header) is the urllib3 Retry object, created by create_retry_strategy(),
+error HTTP statuses (4xx, 5xx) raise aiohttp.ClientResponseError.
+
+Many requests are performed concurrently on one event loop - see request_many()/get_many(), number of
+connections (in total and per host) is limited by the client connector.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, NamedTuple, Tuple
+
+import aiohttp
+from urllib3.exceptions import MaxRetryError
+from urllib3.util import Retry
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+from pyutilities.web.http_client import (
+    HTTP_DEFAULT_CONCURRENCY,
+    HTTP_DEFAULT_POOL_SIZE,
+    HTTP_DEFAULT_RETRIES,
+    HTTP_DEFAULT_TIMEOUT,
+    HttpClient,
+    HttpClientException,
+    create_retry_strategy,
+)
+from pyutilities.web.rate_limiter import RateLimiter
+from pyutilities.web.user_agents import DEFAULT_USER_AGENTS
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+HTTP_DEFAULT_CONNECTIONS_LIMIT = 100  # default max number of connections (for all hosts)
+
+
+class AsyncBatchResult(NamedTuple):
+    """Result of one request of the batch: response or error, see BatchResult (http_client module)."""
+
+    url: str
+    response: aiohttp.ClientResponse | None
+    error: Exception | None
+
+
+class AsyncHttpClient:
+    """Asyncio HttpClient class, based on the [aiohttp] module. If user_agent specified - use it,
+    if not - generate it randomly. Client session is created on the first request (inside the running
+    event loop), client should be closed by close() or used as an async context manager.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        headers: Dict[str, str] | None = None,
+        cookies: Dict[str, str] | None = None,
+        auth=None,
+        user_agent: str = "",
+        allow_redirects: bool = True,
+        redirects_count: int = 0,
+        timeout: int = HTTP_DEFAULT_TIMEOUT,
+        retries: int = HTTP_DEFAULT_RETRIES,
+        limit_per_host: int = HTTP_DEFAULT_POOL_SIZE,
+        limit: int = HTTP_DEFAULT_CONNECTIONS_LIMIT,
+        rate_limiter: RateLimiter | None = None,
+        rotate_user_agent: bool = False,
+    ) -> None:
+        log.debug("AsyncHttpClient :: initializing AsyncHttpClient instance.")
+
+        self.__headers = dict(headers) if headers else {}
+        self.__headers["user-agent"] = user_agent if user_agent else HttpClient.random_user_agent()
+        self.__cookies = dict(cookies) if cookies else {}
+        # auth: aiohttp.BasicAuth or tuple (login, password) - like for the requests module
+        self.__auth = aiohttp.BasicAuth(*auth) if isinstance(auth, tuple) else auth
+        self.__allow_redirects = allow_redirects
+        self.__redirects_count = redirects_count
+        self.__timeout = aiohttp.ClientTimeout(total=timeout)
+        self.__retry = create_retry_strategy(retries)
+        self.__limit_per_host = limit_per_host
+        self.__limit = limit
+        self.__rate_limiter = rate_limiter  # throttling of requests per host (optional)
+        self.__user_agents = DEFAULT_USER_AGENTS if rotate_user_agent else None  # user agent per request
+        self.__session: aiohttp.ClientSession | None = None
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.__limit, limit_per_host=self.__limit_per_host)
+            self.__session = aiohttp.ClientSession(
+                headers=self.__headers,
+                cookies=self.__cookies,
+                auth=self.__auth,
+                timeout=self.__timeout,
+                connector=connector,
+            )
+            log.debug("AsyncHttpClient :: session object created.")
+        return self.__session
+
+    async def close(self) -> None:
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def __send(
+        self, method: str, url: str, retry: Retry, kwargs: Dict[str, Any]
+    ) -> Tuple[aiohttp.ClientResponse, Retry]:
+        """Sends the request, retries on connection errors/timeouts."""
+        while True:
+            if self.__rate_limiter is not None:
+                await self.__rate_limiter.acquire_async(url)
+            try:
+                response = await self.__get_session().request(method, url, **kwargs)
+                await response.read()  # release the connection
+                if self.__rate_limiter is not None:
+                    self.__rate_limiter.update(url, response.headers)
+                return response, retry
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                try:
+                    retry = retry.increment(method, url, error=e)
+                except MaxRetryError:
+                    raise e from None
+                log.debug("AsyncHttpClient: %s %s failed (%s), retrying...", method, url, e)
+                await asyncio.sleep(retry.get_backoff_time())
+
+    async def request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Perform HTTP request with retry (if necessary). Response body is read before return, so
+        response.text()/json() don't use the connection.
+        :param kwargs: request parameters (params, data, json, headers, etc.) - see aiohttp request()
+        :raises aiohttp.ClientResponseError: for error HTTP status codes (4xx, 5xx)
+        """
+        kwargs.setdefault("allow_redirects", self.__allow_redirects)
+        if self.__user_agents is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **{"user-agent": self.__user_agents.next()})
+        if self.__redirects_count > 0:
+            kwargs.setdefault("max_redirects", self.__redirects_count)
+        method = method.upper()
+
+        retry = self.__retry
+        while True:
+            response, retry = await self.__send(method, url, retry, kwargs)
+            has_retry_after = "Retry-After" in response.headers
+            if not retry.is_retry(method, response.status, has_retry_after):
+                break
+            try:
+                retry = retry.increment(method, url)
+            except MaxRetryError:
+                break  # retries are exhausted - report the last response status (below)
+            delay = retry.get_backoff_time()
+            if retry.respect_retry_after_header and has_retry_after:
+                delay = retry.parse_retry_after(response.headers["Retry-After"])
+            log.debug("AsyncHttpClient: %s %s -> %s, retry in %s sec.", method, url, response.status, delay)
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        return response
+
+    async def get(self, url: str, params: Dict[str, str] | None = None) -> aiohttp.ClientResponse:
+        """Perform HTTP GET request with retry (if necessary).
+        :param params: request parameters -> will be added to the URL
+        """
+        log.debug("AsyncHttpClient.get(): %s. Params: %s.", url, params)
+        return await self.request("GET", url, params=params)
+
+    async def post(
+        self, url: str, data: Dict[str, str] | None = None, params: Dict[str, str] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Perform HTTP POST request with retry (if necessary).
+        :param data: request data -> will be added to the request body (HTTP POST)
+        :param params: request parameters -> will be added to the URL
+        """
+        log.debug("AsyncHttpClient.post(): %s. Params: %s. Data: %s.", url, params, data)
+        return await self.request("POST", url, data=data, params=params)
+
+    async def put(
+        self, url: str, data: Dict[str, str] | None = None, params: Dict[str, str] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Perform HTTP PUT request with retry (if necessary), see post()."""
+        log.debug("AsyncHttpClient.put(): %s. Params: %s. Data: %s.", url, params, data)
+        return await self.request("PUT", url, data=data, params=params)
+
+    async def delete(
+        self, url: str, data: Dict[str, str] | None = None, params: Dict[str, str] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Perform HTTP DELETE request with retry (if necessary), see post()."""
+        log.debug("AsyncHttpClient.delete(): %s. Params: %s. Data: %s.", url, params, data)
+        return await self.request("DELETE", url, data=data, params=params)
+
+    async def head(
+        self, url: str, data: Dict[str, str] | None = None, params: Dict[str, str] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Perform HTTP HEAD request with retry (if necessary), see post()."""
+        log.debug("AsyncHttpClient.head(): %s. Params: %s. Data: %s.", url, params, data)
+        return await self.request("HEAD", url, data=data, params=params)
+
+    async def options(
+        self, url: str, data: Dict[str, str] | None = None, params: Dict[str, str] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Perform HTTP OPTIONS request with retry (if necessary), see post()."""
+        log.debug("AsyncHttpClient.options(): %s. Params: %s. Data: %s.", url, params, data)
+        return await self.request("OPTIONS", url, data=data, params=params)
+
+    async def __request(self, method: str, url: str, kwargs: Dict[str, Any]) -> AsyncBatchResult:
+        try:
+            return AsyncBatchResult(url, await self.request(method, url, **kwargs), None)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log.debug("AsyncHttpClient.%s(): %s failed: %s.", method.lower(), url, e)
+            return AsyncBatchResult(url, None, e)
+
+    async def request_many(
+        self,
+        method: str,
+        urls: Iterable[str | Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = HTTP_DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[AsyncBatchResult]:
+        """Perform HTTP requests for the URLs concurrently, see HttpClient.request_many(). Number of
+        connections per host is additionally limited by the [limit_per_host] of the client.
+        """
+        if max_concurrency < 1:
+            raise HttpClientException(f"Invalid max concurrency: {max_concurrency}!")
+        log.debug("AsyncHttpClient.request_many(): %s, max concurrency %s.", method, max_concurrency)
+
+        requests_iter = iter(urls)
+        pending: Dict[asyncio.Task[AsyncBatchResult], None] = {}  # running requests, in order of the URLs
+
+        def schedule() -> None:
+            for item in requests_iter:
+                url, url_kwargs = (item, kwargs) if isinstance(item, str) else (item[0], kwargs | item[1])
+                pending[asyncio.create_task(self.__request(method, url, url_kwargs))] = None
+                if len(pending) >= max_concurrency:
+                    break
+
+        try:
+            schedule()
+            while pending:
+                if ordered:
+                    task = next(iter(pending))
+                    del pending[task]
+                    yield await task
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        del pending[task]
+                        yield task.result()
+                schedule()
+        finally:  # iteration stopped by the caller - cancel running requests
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)  # wait for the cancelled requests
+
+    def get_many(
+        self,
+        urls: Iterable[str | Tuple[str, Dict[str, Any]]],
+        params: Dict[str, str] | None = None,
+        max_concurrency: int = HTTP_DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[AsyncBatchResult]:
+        """Perform HTTP GET requests concurrently, see request_many().
+        :param params: request parameters -> will be added to all URLs
+        """
+        return self.request_many("GET", urls, max_concurrency, ordered, params=params)
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-host circuit breaker for the HttpClient. Each host (host:port) has its own circuit:
+    - closed: requests are sent, outcomes of the last [window] requests are collected; when there are
+      at least [min_calls] of them and the rate of failures (connection errors, timeouts, 5xx statuses)
+      or slow requests (longer than [latency_threshold]) reaches its threshold - circuit opens
+    - open: requests fail fast with CircuitOpenError (without connecting, retries and backoff sleeps)
+      for [open_timeout] seconds, then the circuit becomes half-open
+    - half-open: [half_open_calls] trial requests are sent, if all of them succeed - circuit closes,
+      the first failed (or slow) trial opens it again for [open_timeout] seconds
+In HttpClient the breaker is checked before each request (see TimeoutHTTPAdapter), failed attempts
+are recorded by the retry strategy (see CircuitBreakerRetry) - it also stops retrying as soon as the
+circuit is open, responses (status, elapsed time) are recorded by the client response hook.
+
+Breaker state is observable: state(), states() (per host snapshot) and the on_state_change listener.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half-open"
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class CircuitOpenError(RequestsConnectionError):
+    """Request is rejected without sending: circuit of the host is open (retry_in - seconds until the
+    trial requests are allowed)."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit for [{host}] is open, retry in {retry_in:.1f} sec.")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def host_key(url: str) -> str:
+    """Returns circuit key of the URL - host:port (default port for the scheme, if not specified)."""
+    parts = urlsplit(url)
+    return f"{parts.hostname or ''}:{parts.port or _DEFAULT_PORTS.get(parts.scheme, 80)}"
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "failures", "slow", "opened_at", "trials", "trial_started", "counters")
+
+    def __init__(self, window: int) -> None:
+        self.state = CIRCUIT_CLOSED
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (failure, slow) of the requests
+        self.failures = self.slow = 0  # in the outcomes
+        self.opened_at = 0.0
+        self.trials = 0  # trial requests allowed in the half-open state
+        self.trial_started = 0.0
+        self.counters = {"rejected": 0, "opened": 0}
+
+    def add(self, failure: bool, slow: bool) -> None:
+        if len(self.outcomes) == self.outcomes.maxlen:
+            old_failure, old_slow = self.outcomes[0]
+            self.failures -= old_failure
+            self.slow -= old_slow
+        self.outcomes.append((failure, slow))
+        self.failures += failure
+        self.slow += slow
+
+    def reset(self, state: str, now: float) -> None:
+        self.state = state
+        self.outcomes.clear()
+        self.failures = self.slow = self.trials = 0
+        if state == CIRCUIT_OPEN:
+            self.opened_at = now
+            self.counters["opened"] += 1
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker (thread-safe), see module docstring.
+    :param failure_rate: rate of failed requests in the window, which opens the circuit
+    :param latency_threshold: requests longer than it (seconds) are slow, None - latency isn't checked
+    :param slow_rate: rate of slow requests in the window, which opens the circuit
+    :param window: number of the last requests (per host), which rates are calculated for
+    :param min_calls: min number of requests in the window to calculate rates
+    :param open_timeout: seconds in the open state before the trial requests
+    :param half_open_calls: number of successful trial requests, which close the circuit
+    :param on_state_change: listener, called with (host, old state, new state) on each transition
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        failure_rate: float = 0.5,
+        latency_threshold: float | None = None,
+        slow_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        on_state_change: Callable[[str, str, str], None] | None = None,
+    ) -> None:
+        if not 0 < failure_rate <= 1 or not 0 < slow_rate <= 1:
+            raise ValueError(f"Invalid failure rate [{failure_rate}] or slow rate [{slow_rate}]!")
+        if window < 1 or not 1 <= min_calls <= window or half_open_calls < 1 or open_timeout < 0:
+            raise ValueError(
+                f"Invalid window [{window}], min calls [{min_calls}], half-open calls [{half_open_calls}] "
+                f"or open timeout [{open_timeout}]!"
+            )
+        self.__failure_rate = failure_rate
+        self.__latency_threshold = latency_threshold
+        self.__slow_rate = slow_rate
+        self.__window = window
+        self.__min_calls = min_calls
+        self.__open_timeout = open_timeout
+        self.__half_open_calls = half_open_calls
+        self.__on_state_change = on_state_change
+        self.__circuits: Dict[str, _Circuit] = {}
+        self.__lock = threading.Lock()
+
+    def __circuit(self, host: str) -> _Circuit:
+        circuit = self.__circuits.get(host)
+        if circuit is None:
+            circuit = self.__circuits[host] = _Circuit(self.__window)
+        return circuit
+
+    def allow(self, url: str) -> None:
+        """Checks that request to the URL host is allowed (closed circuit or the trial request).
+        :raises CircuitOpenError: circuit is open (or all trial requests are in progress)
+        """
+        host = host_key(url)
+        now = time.monotonic()
+        transitions: List[Tuple[str, str, str]] = []
+        with self.__lock:
+            circuit = self.__circuit(host)
+            if circuit.state == CIRCUIT_CLOSED:
+                return
+            retry_in = circuit.opened_at + self.__open_timeout - now
+            if circuit.state == CIRCUIT_OPEN and retry_in <= 0:
+                self.__transition(host, circuit, CIRCUIT_HALF_OPEN, now, transitions)
+            # trial request, which didn't finish in the open timeout, doesn't block the others
+            stalled = now - circuit.trial_started >= self.__open_timeout
+            allowed = circuit.state == CIRCUIT_HALF_OPEN and (
+                circuit.trials < self.__half_open_calls or stalled
+            )
+            if allowed:
+                circuit.trials += 1
+                circuit.trial_started = now
+            else:
+                circuit.counters["rejected"] += 1
+        self.__notify(transitions)
+        if not allowed:
+            raise CircuitOpenError(host, max(retry_in, 0.0))
+
+    def record(self, url: str, success: bool, duration: float = 0.0) -> None:
+        """Records outcome of the request to the URL host: success (False - connection error, timeout,
+        5xx status) and duration (seconds)."""
+        host = host_key(url)
+        failure = not success
+        slow = self.__latency_threshold is not None and duration > self.__latency_threshold
+        now = time.monotonic()
+        transitions: List[Tuple[str, str, str]] = []
+        with self.__lock:
+            circuit = self.__circuit(host)
+            if circuit.state == CIRCUIT_HALF_OPEN:
+                circuit.add(failure, slow)
+                if failure or slow:
+                    self.__transition(host, circuit, CIRCUIT_OPEN, now, transitions)
+                elif len(circuit.outcomes) >= self.__half_open_calls:
+                    self.__transition(host, circuit, CIRCUIT_CLOSED, now, transitions)
+            elif (
+                circuit.state == CIRCUIT_CLOSED
+            ):  # outcomes of the requests, sent before opening, are ignored
+                circuit.add(failure, slow)
+                if self.__should_open(circuit):
+                    self.__transition(host, circuit, CIRCUIT_OPEN, now, transitions)
+        self.__notify(transitions)
+
+    def is_open(self, url: str) -> bool:
+        """Returns True if requests to the URL host are rejected now (circuit is open, not timed out)."""
+        with self.__lock:
+            circuit = self.__circuits.get(host_key(url))
+            if circuit is None or circuit.state != CIRCUIT_OPEN:
+                return False
+            return time.monotonic() - circuit.opened_at < self.__open_timeout
+
+    def state(self, url: str) -> str:
+        """Returns circuit state of the URL host (closed, open or half-open)."""
+        with self.__lock:
+            circuit = self.__circuits.get(host_key(url))
+            return circuit.state if circuit is not None else CIRCUIT_CLOSED
+
+    def states(self) -> Dict[str, Dict[str, Any]]:
+        """Returns per host snapshot: state, calls (in the window), failure_rate, slow_rate, opened (number
+        of openings), rejected (fast-failed requests), retry_in (seconds until the trial, open state)."""
+        now = time.monotonic()
+        with self.__lock:
+            result = {}
+            for host, circuit in self.__circuits.items():
+                calls = len(circuit.outcomes)
+                result[host] = dict(
+                    circuit.counters,
+                    state=circuit.state,
+                    calls=calls,
+                    failure_rate=circuit.failures / calls if calls else 0.0,
+                    slow_rate=circuit.slow / calls if calls else 0.0,
+                    retry_in=max(circuit.opened_at + self.__open_timeout - now, 0.0),
+                )
+                if circuit.state != CIRCUIT_OPEN:
+                    result[host]["retry_in"] = 0.0
+            return result
+
+    def reset(self) -> None:
+        """Closes all circuits and clears statistics."""
+        with self.__lock:
+            self.__circuits.clear()
+
+    def __should_open(self, circuit: _Circuit) -> bool:
+        calls = len(circuit.outcomes)
+        if calls < self.__min_calls:
+            return False
+        too_slow = self.__latency_threshold is not None and circuit.slow / calls >= self.__slow_rate
+        return too_slow or circuit.failures / calls >= self.__failure_rate
+
+    def __transition(
+        self, host: str, circuit: _Circuit, state: str, now: float, transitions: List[Tuple[str, str, str]]
+    ) -> None:
+        transitions.append((host, circuit.state, state))
+        circuit.reset(state, now)
+
+    def __notify(self, transitions: List[Tuple[str, str, str]]) -> None:
+        for host, old_state, new_state in transitions:
+            level = logging.WARNING if new_state == CIRCUIT_OPEN else logging.INFO
+            log.log(level, "CircuitBreaker: circuit for [%s]: %s -> %s.", host, old_state, new_state)
+            if self.__on_state_change is not None:
+                try:
+                    self.__on_state_change(host, old_state, new_state)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    log.warning("CircuitBreaker: state change listener failed: %s", e)
+
+
+class CircuitBreakerRetry(Retry):
+    """Retry strategy, which records failed attempts (errors, 5xx statuses) into the circuit breaker and
+    stops retrying (raises MaxRetryError) as soon as the circuit of the host is open."""
+
+    breaker: CircuitBreaker | None = None  # kept by the new (incremented) Retry objects, see new()
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.breaker = self.breaker
+        return retry
+
+    def increment(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None
+    ):
+        breaker = self.breaker
+        failure = error is not None or (response is not None and response.status >= 500)
+        if breaker is not None and failure:
+            host_url = f"{_pool.scheme}://{_pool.host}:{_pool.port}" if _pool is not None else url or ""
+            breaker.record(host_url, success=False)
+            if breaker.is_open(host_url):
+                raise MaxRetryError(_pool, url or "", CircuitOpenError(host_key(host_url), 0.0))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP response cache for the HttpClient (GET requests): in-memory LRU tier + optional on-disk tier
+with size-based eviction (least recently used files are removed first).
+
+Freshness of the cached response is calculated from the Cache-Control (no-store, no-cache, max-age)
+and Expires response headers. Stale responses with validators (ETag, Last-Modified) are revalidated
+with the conditional request (If-None-Match, If-Modified-Since): on 304 Not Modified the cached body
+is returned and its freshness is updated. Responses without freshness info and validators aren't
+cached, as well as responses with "Vary: *" and non-200 responses.
+
+Disk entries are stored in the marshal form (see marshal module), one file per URL. Disk tier is treated
+as a shared cache (files outlive the client and may be used by other processes): "Cache-Control: private"
+responses and responses to the requests with credentials (Authorization header), which aren't explicitly
+public, are kept only in the memory tier. Cache key doesn't include credentials - HttpCache instance should
+be shared only by clients with the same credentials.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple
+
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+HTTP_CACHE_DEFAULT_ENTRIES = 256  # default max number of responses in the memory tier
+HTTP_CACHE_DEFAULT_DISK_SIZE = 100 * 1024 * 1024  # default max size of the disk tier (bytes)
+HTTP_CACHE_FORMAT_VERSION = 1  # increase it in case of the disk entry format changes
+
+# hop-by-hop headers and content encoding (body is stored decoded) aren't stored
+_SKIPPED_HEADERS = frozenset(("connection", "keep-alive", "transfer-encoding", "content-encoding"))
+# headers of the 304 response, which don't describe the stored body
+_NOT_UPDATED_HEADERS = _SKIPPED_HEADERS | {"content-length", "content-type"}
+
+
+class CacheEntry(NamedTuple):
+    """Cached response: status, headers, body (decoded), time of storing and freshness deadline (epoch
+    seconds, 0 - response should be revalidated before use)."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    stored: float
+    expires: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Returns headers for the conditional request."""
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def to_response(self) -> Response:
+        """Creates requests.Response object for the cached response."""
+        response = Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body  # pylint: disable=protected-access
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = self.url
+        response.reason = "OK"
+        return response
+
+
+def _cache_control(headers) -> Dict[str, str]:
+    directives = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def _shared(headers, request) -> bool:
+    """Checks if the response can be stored by the shared (disk) tier (see RFC 9111, 3.5)."""
+    directives = _cache_control(headers)
+    if "private" in directives:
+        return False
+    authorized = request is not None and "Authorization" in request.headers
+    return not authorized or not directives.keys().isdisjoint(("public", "s-maxage", "must-revalidate"))
+
+
+def _stored_headers(headers, skipped: FrozenSet[str]) -> Dict[str, str]:
+    return {name.lower(): value for name, value in headers.items() if name.lower() not in skipped}
+
+
+def _parse_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_deadline(headers, now: float) -> float | None:
+    """Returns time (epoch seconds) until the response is fresh, 0 - response should be revalidated,
+    None - response shouldn't be cached (no-store, Vary: *, no freshness info and no validators)."""
+    directives = _cache_control(headers)
+    if "no-store" in directives or headers.get("Vary", "").strip() == "*":
+        return None
+    has_validators = "ETag" in headers or "Last-Modified" in headers
+    if "no-cache" in directives:
+        return 0 if has_validators else None
+
+    age_value = headers.get("Age", "")
+    age = int(age_value) if age_value.isdigit() else 0
+    max_age = directives.get("max-age", "")
+    if max_age.isdigit():
+        deadline = now + int(max_age) - age
+    elif "Expires" in headers:  # invalid Expires value means "already expired"
+        expires = _parse_date(headers["Expires"])
+        deadline = now + expires - (_parse_date(headers.get("Date")) or now) if expires is not None else 0
+    else:
+        deadline = 0
+    if deadline <= now:  # stale response is useful only for revalidation
+        return 0 if has_validators else None
+    return deadline
+
+
+class HttpCache:
+    """Two-tier HTTP responses cache: in-memory LRU (max_entries responses) + optional disk tier
+    (directory cache_dir, max_disk_size bytes). Counters: hits (fresh cached response), misses
+    (no cached response or it was replaced by the new one), revalidations (304 Not Modified)."""
+
+    def __init__(
+        self,
+        max_entries: int = HTTP_CACHE_DEFAULT_ENTRIES,
+        cache_dir: str | None = None,
+        max_disk_size: int = HTTP_CACHE_DEFAULT_DISK_SIZE,
+    ) -> None:
+        self.__max_entries = max_entries
+        self.__cache_dir = cache_dir
+        self.__max_disk_size = max_disk_size
+        self.__memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__counters = {"hits": 0, "misses": 0, "revalidations": 0}
+        self.__disk: Dict[str, int] = {}  # disk files (least recently used first) -> size
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            files = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".cache")]
+            for entry in sorted(files, key=lambda file: file.stat().st_mtime):
+                self.__disk[entry.name] = entry.stat().st_size
+            log.debug("HttpCache: %s response(s) found in [%s].", len(self.__disk), cache_dir)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns copy of the cache counters."""
+        with self.__lock:
+            return dict(self.__counters, entries=len(self.__memory), disk_size=sum(self.__disk.values()))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__memory.clear()
+            for name in self.__disk:
+                self.__remove_file(name)
+            self.__disk.clear()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns cached response (fresh or stale) for the key."""
+        with self.__lock:
+            entry = self.__memory.get(key)
+            if entry is not None:
+                self.__memory.move_to_end(key)
+                return entry
+        entry = self.__read(key)
+        if entry is not None:
+            self.__remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry, shared: bool = True) -> None:
+        """Stores response in the memory tier and (if shared - see module docstring) in the disk tier."""
+        self.__remember(key, entry)
+        if shared:
+            self.__write(key, entry)
+        else:
+            self.__discard(key)
+
+    def fetch(self, key: str, send: Callable[[Dict[str, str]], Response]) -> Response:
+        """Returns response for the key from the cache or performs the request.
+        :param key: cache key (request URL with parameters)
+        :param send: function, which performs the request with additional headers (for revalidation)
+        """
+        now = time.time()
+        entry = self.get(key)
+        if entry is not None and entry.is_fresh(now):
+            self.__count("hits")
+            return entry.to_response()
+
+        response = send(entry.validators() if entry is not None else {})
+        if response.status_code == 304 and entry is not None:
+            self.__count("revalidations")
+            headers = dict(entry.headers)
+            headers.update(_stored_headers(response.headers, _NOT_UPDATED_HEADERS))
+            expires = freshness_deadline(CaseInsensitiveDict(headers), now)
+            entry = entry._replace(headers=headers, stored=now, expires=expires or 0)
+            self.put(key, entry, _shared(CaseInsensitiveDict(headers), response.request))
+            return entry.to_response()
+
+        self.__count("misses")
+        expires = freshness_deadline(response.headers, now) if response.status_code == 200 else None
+        if expires is not None:
+            headers = _stored_headers(response.headers, _SKIPPED_HEADERS)
+            entry = CacheEntry(response.url, 200, headers, response.content, now, expires)
+            self.put(key, entry, _shared(response.headers, response.request))
+        return response
+
+    def __count(self, name: str) -> None:
+        with self.__lock:
+            self.__counters[name] += 1
+
+    def __remember(self, key: str, entry: CacheEntry) -> None:
+        with self.__lock:
+            self.__memory[key] = entry
+            self.__memory.move_to_end(key)
+            while len(self.__memory) > self.__max_entries:
+                self.__memory.popitem(last=False)
+
+    @staticmethod
+    def __file_name(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + ".cache"
+
+    def __read(self, key: str) -> CacheEntry | None:
+        if not self.__cache_dir:
+            return None
+        name = HttpCache.__file_name(key)
+        with self.__lock:
+            if name not in self.__disk:
+                return None
+            self.__disk[name] = self.__disk.pop(name)  # most recently used
+        path = os.path.join(self.__cache_dir, name)
+        try:
+            with open(path, "rb") as cache_file:
+                version, stored_key, values = marshal.load(cache_file)
+            os.utime(path)  # keeps LRU order after restart
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            log.warning("HttpCache: can't read cached response [%s]: %s", path, e)
+            return None
+        if version != HTTP_CACHE_FORMAT_VERSION or stored_key != key:
+            return None
+        return CacheEntry(*values)
+
+    def __write(self, key: str, entry: CacheEntry) -> None:
+        if not self.__cache_dir:
+            return
+        data = marshal.dumps((HTTP_CACHE_FORMAT_VERSION, key, tuple(entry)))
+        if len(data) > self.__max_disk_size:
+            return
+        name = HttpCache.__file_name(key)
+        fd, tmp_file = tempfile.mkstemp(dir=self.__cache_dir, prefix=".http_cache_")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_file, os.path.join(self.__cache_dir, name))
+        except OSError as e:
+            log.warning("HttpCache: can't write cached response for [%s]: %s", key, e)
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+            return
+
+        with self.__lock:
+            self.__disk.pop(name, None)
+            self.__disk[name] = len(data)
+            total = sum(self.__disk.values())
+            while total > self.__max_disk_size:  # evict the least recently used files
+                evicted, size = next(iter(self.__disk.items()))
+                del self.__disk[evicted]
+                self.__remove_file(evicted)
+                total -= size
+
+    def __discard(self, key: str) -> None:
+        """Removes the disk entry for the key (if any)."""
+        if not self.__cache_dir:
+            return
+        name = HttpCache.__file_name(key)
+        with self.__lock:
+            if self.__disk.pop(name, None) is None:
+                return
+        self.__remove_file(name)
+
+    def __remove_file(self, name: str) -> None:
+        try:
+            os.unlink(os.path.join(self.__cache_dir, name))  # type: ignore[arg-type]
+        except OSError as e:
+            log.warning("HttpCache: can't remove cached response [%s]: %s", name, e)
+
+
+def cache_key(url: str, params: Dict[str, Any] | None) -> str:
+    """Returns cache key for the GET request - URL with the encoded parameters."""
+    return Request("GET", url, params=params).prepare().url or url
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
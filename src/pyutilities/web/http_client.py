@@ -5,19 +5,44 @@
 HTTP client module, based on requests module.
 
 Created:  Dmitrii Gusev, 01.06.2021
-Modified: Dmitrii Gusev, 24.11.2025
+Modified: Dmitrii Gusev, 18.10.2026
 """
 
+import hashlib
 import logging
-from typing import Dict, List
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
 
 import requests
-from fake_useragent import UserAgent
 from requests import Response
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import FullPoolError, MaxRetryError, ProtocolError, ReadTimeoutError
+from urllib3.poolmanager import PoolManager
 
 from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
 from pyutilities.utils.common_utils import threadsafe_function
+from pyutilities.web.circuit_breaker import CircuitBreaker, CircuitBreakerRetry
+from pyutilities.web.http_cache import HttpCache, cache_key
+from pyutilities.web.http_timing import (
+    RequestTimer,
+    TimedHTTPConnection,
+    TimedHTTPSConnection,
+    TimedRetry,
+    active_timing,
+)
+from pyutilities.web.rate_limiter import RateLimiter
+from pyutilities.web.single_flight import SingleFlight
+from pyutilities.web.user_agents import DEFAULT_USER_AGENTS, UserAgentPool
+
+if TYPE_CHECKING:
+    from urllib3._base_connection import BaseHTTPConnection
 
 # init module logger
 log = logging.getLogger(__name__)
@@ -28,10 +53,111 @@ log.debug("Logging for module [%s] is configured.", __name__)
 HTTP_DEFAULT_TIMEOUT = 20  # default HTTP requests timeout (seconds)
 HTTP_DEFAULT_BACKOFF = 1  # default back off factor (it is better to not touch this value!)
 HTTP_DEFAULT_RETRIES = 4  # default retries num for HTTP requests (+1 for the original request!)
+HTTP_DEFAULT_POOL_SIZE = 10  # default max number of kept connections per host (see HTTPAdapter)
+HTTP_DEFAULT_POOL_CONNECTIONS = 10  # default max number of cached connection pools (one pool per host)
+HTTP_DEFAULT_CONCURRENCY = 10  # default max number of concurrent requests for the batch requests
+HTTP_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # default buffer size for the file download (bytes)
+HTTP_DOWNLOAD_PART_SUFFIX = ".part"  # suffix of the file, which is being downloaded
+HTTP_DOWNLOAD_SEGMENTS = 4  # default number of concurrent segments for the segmented download
+
+
+class PoolStats:
+    """Connection pool statistics (thread-safe counters), shared by all pools of the adapter:
+    - created: new connections (sockets) opened by the pools (including re-opened dropped ones)
+    - reused: requests, sent over the already open pooled connection
+    - discarded: connections closed because the pool was full (pool size is too small)
+    - waiting: threads waiting for a free connection right now (blocking pools only)
+    - waits: total number of waits for a free connection (blocking pools only)
+    """
+
+    FIELDS = ("created", "reused", "discarded", "waiting", "waits")
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__counters = dict.fromkeys(PoolStats.FIELDS, 0)
+
+    def add(self, name: str, value: int = 1) -> None:
+        with self.__lock:
+            self.__counters[name] += value
+
+    def snapshot(self) -> Dict[str, int]:
+        """Returns copy of the current counters."""
+        with self.__lock:
+            return dict(self.__counters)
+
+
+class _StatsPoolMixin(HTTPConnectionPool):
+    """Connection pool mixin, which collects pool statistics (see PoolStats)."""
+
+    stats: PoolStats | None = None  # set by the pool manager
+
+    def _get_conn(self, timeout: float | None = None) -> "BaseHTTPConnection":
+        stats = self.stats
+        waiting = stats is not None and self.block and self.pool is not None and self.pool.empty()
+        if stats is not None and waiting:
+            stats.add("waits")
+            stats.add("waiting")
+        try:
+            conn = super()._get_conn(timeout)
+        finally:
+            if stats is not None and waiting:
+                stats.add("waiting", -1)
+        if stats is not None:
+            stats.add(
+                "reused" if getattr(conn, "sock", None) is not None else "created"
+            )  # socket is opened on request
+        return conn
+
+    def _put_conn(self, conn: "BaseHTTPConnection | None") -> None:
+        pool = self.pool
+        if self.stats is None or conn is None or pool is None:
+            super()._put_conn(conn)
+            return
+        try:
+            pool.put(conn, block=False)
+        except queue.Full:  # connection is closed and discarded (as by the base class)
+            conn.close()
+            self.stats.add("discarded")
+            if self.block:
+                raise FullPoolError(
+                    self, "Pool reached maximum size and no more connections are allowed."
+                ) from None
+            log.warning("Connection pool is full, discarding connection: %s.", self.host)
+
+
+class StatsHTTPConnectionPool(_StatsPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class StatsHTTPSConnectionPool(_StatsPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _StatsPoolManager(PoolManager):
+    """Pool manager, which creates connection pools with statistics (and with timed connections - see
+    RequestTimer, if timed)."""
+
+    def __init__(self, stats: PoolStats, timed: bool, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+        self.timed = timed
+        self.pool_classes_by_scheme = {"http": StatsHTTPConnectionPool, "https": StatsHTTPSConnectionPool}
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        if isinstance(pool, _StatsPoolMixin):
+            pool.stats = self.stats
+        if self.timed:
+            pool.ConnectionCls = TimedHTTPSConnection if scheme == "https" else TimedHTTPConnection
+        return pool
 
 
 class TimeoutHTTPAdapter(HTTPAdapter):
-    """Timeout adapter based on the HTTPAdapter."""
+    """Timeout adapter based on the HTTPAdapter. Collects connection pool statistics (see PoolStats),
+    pool parameters - see HTTPAdapter (pool_connections, pool_maxsize, pool_block). Optional rate limiter
+    (see RateLimiter) throttles requests per host, optional user agents pool sets agent per request,
+    optional timer (see RequestTimer) records timings of the requests, optional circuit breaker (see
+    CircuitBreaker) rejects requests to the failing hosts."""
 
     def __init__(self, *args, **kwargs):
         log.debug("Initializing TimeoutHTTPAdapter.")
@@ -41,21 +167,82 @@ class TimeoutHTTPAdapter(HTTPAdapter):
             self.timeout = kwargs["timeout"]
             del kwargs["timeout"]
 
+        self.rate_limiter: RateLimiter | None = kwargs.pop("rate_limiter", None)
+        self.user_agents: UserAgentPool | None = kwargs.pop("user_agents", None)
+        self.timer: RequestTimer | None = kwargs.pop("timer", None)
+        self.circuit_breaker: CircuitBreaker | None = kwargs.pop("circuit_breaker", None)
+        self.stats = PoolStats()  # should be created before the pool manager (see init_poolmanager())
         super().__init__(*args, **kwargs)
 
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _StatsPoolManager(
+            self.stats,
+            self.timer is not None,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
     # pylint: disable=arguments-differ
     def send(self, request, **kwargs):  # type: ignore
         timeout = kwargs.get("timeout")
         if timeout is None:
             kwargs["timeout"] = self.timeout
 
-        return super().send(request, **kwargs)
+        if self.user_agents is not None:  # rotated user agents
+            request.headers["User-Agent"] = self.user_agents.next()
+        if self.circuit_breaker is not None:  # fail fast - before the rate limiter, retries and timing
+            self.circuit_breaker.allow(request.url)
+        if self.timer is None:
+            return self.__send(request, **kwargs)
+
+        timing = self.timer.start(request.method, request.url)
+        try:
+            response = self.__send(request, **kwargs)
+            timing.status = response.status_code
+            if not kwargs.get("stream"):  # read the body here (instead of the session) to time it
+                start = time.perf_counter()
+                _ = response.content
+                timing.body = time.perf_counter() - start
+            return response
+        except Exception as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            self.timer.finish(timing)
+
+    def __send(self, request, **kwargs):
+        if self.rate_limiter is None:
+            return super().send(request, **kwargs)
+        wait = self.rate_limiter.acquire(request.url)
+        timing = active_timing() if self.timer is not None else None
+        if timing is not None:
+            timing.throttle = wait
+        response = super().send(request, **kwargs)
+        self.rate_limiter.update(request.url, response.headers)
+        return response
+
+
+class _TimedCircuitBreakerRetry(CircuitBreakerRetry, TimedRetry):
+    """Retry strategy for the client with both the timer and the circuit breaker."""
 
 
 class HttpClientException(Exception):
     """Proprietary (for this module) Http Client Exception for various internal exceptions."""
 
 
+class BatchResult(NamedTuple):
+    """Result of one request of the batch: response or error (exception, raised by the request)."""
+
+    url: str
+    response: Response | None
+    error: Exception | None
+
+
 def expanded_raise_for_status(response, exclude_statuses: List[int] | None):
     """Expanded version of requests.raise_for_status() method. Raises exception only if
     exclude statuses list is not empty and contains the provided response status.
@@ -67,25 +254,96 @@ def expanded_raise_for_status(response, exclude_statuses: List[int] | None):
         response.raise_for_status()
 
 
+def create_retry_strategy(retries: int = HTTP_DEFAULT_RETRIES, retry_class: type[Retry] = Retry) -> Retry:
+    """Creates retry strategy for the HTTP clients (HttpClient, AsyncHttpClient).
+    :param retry_class: Retry or its subclass (e.g. TimedRetry - records sleeping between the attempts)
+    """
+    return retry_class(  # create retry strategy
+        total=retries,  # total # of retries, see HTTP codes that will be retried -> status_forcelist
+        backoff_factor=HTTP_DEFAULT_BACKOFF,  # backoff: 1 -> [0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256] sec
+        # for these HTTP error status codes will be applied the Retry strategy, in case the retry limit
+        # will be reached without success - TooMaxRetries(?) issue will be raised, otherwise the
+        # success status/response (1xx, 2xx, 3xx) will be returned.
+        status_forcelist=[429, 500, 502, 503, 504],  # statuses for retry
+        # using 'allowed_methods' instead of 'method_whitelist' (deprecated and will be removed in v2.0)
+        allowed_methods=["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "TRACE", "PATCH"],
+    )
+
+
+def _checksum_hasher(checksum: str | None) -> Tuple[Any, str]:
+    """Returns hash object and expected hex digest for the checksum "<algorithm>:<hex digest>"."""
+    if not checksum:
+        return None, ""
+    algorithm, _, digest = checksum.partition(":")
+    try:
+        return hashlib.new(algorithm.lower()), digest.lower()
+    except ValueError as e:
+        raise HttpClientException(f"Invalid checksum [{checksum}]: {e}") from e
+
+
+def _content_range(value: str) -> Tuple[int | None, int | None]:
+    """Parses Content-Range header value "bytes <start>-<end>/<total>" (or "bytes */<total>")."""
+    unit, _, value = value.partition(" ")
+    byte_range, _, total = value.partition("/")
+    start = byte_range.partition("-")[0]
+    if unit != "bytes":
+        return None, None
+    return int(start) if start.isdigit() else None, int(total) if total.isdigit() else None
+
+
+def _hash_file(path: str, hasher, buffer: memoryview) -> None:
+    """Updates hash object with the file content (read with the buffer)."""
+    if hasher is None:
+        return
+    with open(path, "rb") as file:
+        while read := file.readinto(buffer):
+            hasher.update(buffer[:read])
+
+
+def _pwrite_all(fd: int, data: memoryview, offset: int) -> None:
+    """Writes all data at the offset of the file (os.pwrite() may write only part of the data)."""
+    while data:
+        written = os.pwrite(fd, data, offset)
+        data, offset = data[written:], offset + written
+
+
+def _write_stream(response: Response, path: str, offset: int, hasher, buffer: memoryview) -> None:
+    """Writes streamed response body to the file (appends if offset > 0) through the buffer."""
+    try:
+        with open(path, "ab" if offset else "wb") as file:
+            while read := response.raw.readinto(buffer):
+                file.write(buffer[:read])
+                if hasher is not None:
+                    hasher.update(buffer[:read])
+    except (ProtocolError, ReadTimeoutError) as e:
+        raise HttpClientException(f"Download of [{response.url}] interrupted (can be resumed): {e}") from e
+
+
 class HttpClient:
     """Simple HttpClient class, based on the [requests] module. If user_agent specified - use it,
-    if not - generate it randomly.
+    if not - generate it randomly (fake user agents dataset is loaded on the first use). With the
+    rotate_user_agent option each request gets the next agent of the pre-sampled pool. With the timer
+    (see RequestTimer) timings of all requests are recorded (phases, attempts, per host histograms).
+    With the single_flight (see SingleFlight) concurrent identical GET requests share one request.
+    With the circuit_breaker (see CircuitBreaker) requests to the failing host fail fast (CircuitOpenError).
     """
 
     # class (not instance!) variable - when we create multiple instances of this class - we need
     # to update the user agents data only once (for all instances)
     __user_agent_info_updated: bool = False
 
-    # class-level variable for storing the fake User Agent info
-    __ua: UserAgent = UserAgent()
-
     @threadsafe_function
     def __update_user_agent_info(self):
         if not HttpClient.__user_agent_info_updated:
             log.info("Fake User Agent -> cached info updating...")
-            # HttpClient.__ua.update()
+            # DEFAULT_USER_AGENTS is sampled once from the fake_useragent dataset (on the first use)
             HttpClient.__user_agent_info_updated = True
 
+    @staticmethod
+    def random_user_agent() -> str:
+        """Returns random (fake) User Agent string (the next one from the pre-sampled pool)."""
+        return DEFAULT_USER_AGENTS.next()
+
     def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
         headers: Dict[str, str] | None = None,
@@ -97,6 +355,15 @@ class HttpClient:
         timeout: int = HTTP_DEFAULT_TIMEOUT,
         retries: int = HTTP_DEFAULT_RETRIES,
         update_user_agents_info: bool = False,
+        pool_size: int = HTTP_DEFAULT_POOL_SIZE,
+        pool_connections: int = HTTP_DEFAULT_POOL_CONNECTIONS,
+        pool_block: bool = False,
+        cache: HttpCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        rotate_user_agent: bool = False,
+        timer: RequestTimer | None = None,
+        single_flight: SingleFlight | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
 
         log.debug("HttpClient :: initializing HttpClient instance.")
@@ -112,13 +379,21 @@ class HttpClient:
         self.__allow_redirects = allow_redirects
         log.debug("HttpClient :: allowing redirects [%s].", self.__allow_redirects)
 
+        self.__cache = cache  # responses cache for the GET requests (optional)
+        self.__single_flight = single_flight  # coalescing of the concurrent GET requests (optional)
+
         # - setup requests hooks - raise HTTPError for error HTTP status codes 4xx, 5xx, except
         # - the statuses specified in status_forcelist parameter of the Retry strategy
         # -   option I -> raise for all error status codes (4xx, 5xx) except statuses from
         # -               [status_forcelist] list
         # -   option II: -> raise for all error status codes (4xx, 5xx) except statuses from
         # -                 [status_forcelist] list and [dont_raise_for] list
+        # - circuit breaker (if any) gets outcome of each response before raising: 5xx - failure, outcome
+        #   is recorded for the host of the request (each redirect hop - for its own host)
         def assert_status_hook(response, *args, **kwargs):  # pylint: disable=unused-argument
+            if circuit_breaker is not None:
+                elapsed = response.elapsed.total_seconds()
+                circuit_breaker.record(response.request.url, response.status_code < 500, elapsed)
             # expanded_raise_for_status(response, dont_raise_for)
             response.raise_for_status()
 
@@ -126,19 +401,35 @@ class HttpClient:
         log.debug("HttpClient :: session hooks installed.")
 
         # setup retries strategy for the session - see mounting it below
-        retry_strategy = Retry(  # create retry strategy
-            total=retries,  # total # of retries, see HTTP codes that will be retried -> status_forcelist
-            backoff_factor=HTTP_DEFAULT_BACKOFF,  # backoff: 1 -> [0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256] sec
-            # for these HTTP error status codes will be applied the Retry strategy, in case the retry limit
-            # will be reached without success - TooMaxRetries(?) issue will be raised, otherwise the
-            # success status/response (1xx, 2xx, 3xx) will be returned.
-            status_forcelist=[429, 500, 502, 503, 504],  # statuses for retry
-            # using 'allowed_methods' instead of 'method_whitelist' (deprecated and will be removed in v2.0)
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "TRACE", "PATCH"],
+        # (retry strategy records sleeps for the timer and failed attempts for the circuit breaker)
+        retry_class = {
+            (False, False): Retry,
+            (True, False): TimedRetry,
+            (False, True): CircuitBreakerRetry,
+            (True, True): _TimedCircuitBreakerRetry,
+        }[(timer is not None, circuit_breaker is not None)]
+        retry_strategy = create_retry_strategy(retries, retry_class)
+        if isinstance(retry_strategy, CircuitBreakerRetry):
+            retry_strategy.breaker = circuit_breaker
+
+        # create TimeoutHTTPAdapter (based on HTTPAdapter) and mount it to prefixes, pool parameters:
+        # - pool_size - max number of connections, kept for reuse per host (should be not less than the
+        #   number of concurrent requests, otherwise extra connections are closed after the request)
+        # - pool_connections - max number of cached per host pools (number of hosts)
+        # - pool_block - True: limit number of connections per host by pool_size, requests wait for
+        #   a free connection; False: open extra connections (they are discarded after the request)
+        adapter = TimeoutHTTPAdapter(
+            timeout=timeout,
+            max_retries=retry_strategy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_size,
+            pool_block=pool_block,
+            rate_limiter=rate_limiter,  # throttling of requests per host (optional)
+            user_agents=DEFAULT_USER_AGENTS if rotate_user_agent else None,  # user agent per request
+            timer=timer,  # timings of the requests (optional)
+            circuit_breaker=circuit_breaker,  # fast fail of the requests to the failing hosts (optional)
         )
-
-        # create TimeoutHTTPAdapter (based on HTTPAdapter) and mount it to prefixes
-        adapter = TimeoutHTTPAdapter(timeout=timeout, max_retries=retry_strategy)
+        self.__adapter = adapter
         self.__session.mount("https://", adapter)  # mount to HTTPS (timeout+retries)
         self.__session.mount("http://", adapter)  # mount to HTTP (timeout+retries)
         log.debug("HttpClient :: retry strategy + timeouts installed for Session object.")
@@ -156,7 +447,7 @@ class HttpClient:
             log.debug("HttpClient :: set up redirects count: %s.", redirects_count)
 
         if not user_agent:  # set User Agent header
-            user_agent = HttpClient.__ua.random
+            user_agent = HttpClient.random_user_agent()
 
         self.__session.headers.update({"user-agent": user_agent})  # header also may be "User-Agent"
 
@@ -171,12 +462,51 @@ class HttpClient:
             self.__session.cookies,
         )
 
+    def pool_stats(self) -> Dict[str, int]:
+        """Returns connection pool statistics (see PoolStats)."""
+        return self.__adapter.stats.snapshot()
+
+    @property
+    def timer(self) -> RequestTimer | None:
+        """Requests timer of the client (see RequestTimer, its export() - per host timings)."""
+        return self.__adapter.timer
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """Requests coalescing of the client (see SingleFlight, its stats() - coalescing rate)."""
+        return self.__single_flight
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Circuit breaker of the client (see CircuitBreaker, its states() - per host circuits)."""
+        return self.__adapter.circuit_breaker
+
+    @property
+    def cache(self) -> HttpCache | None:
+        """Responses cache of the client (see HttpCache, its stats() - cache counters)."""
+        return self.__cache
+
     def get(self, url: str, params: Dict[str, str] | None = None) -> Response:
-        """Perform HTTP GET request with retry (if necessary).
+        """Perform HTTP GET request with retry (if necessary). If client has the responses cache - fresh
+        cached response is returned without request, stale one is revalidated. If client has the single
+        flight - concurrent requests for the same URL and params share one request (and cache lookup).
         :param params: request parameters -> will be added to the URL
         """
         log.debug("WebClient.get(): %s. Params: %s.", url, params)
-        return self.__session.get(url, params=params, allow_redirects=self.__allow_redirects)
+        if self.__single_flight is None:
+            return self.__get(url, params)
+        return self.__single_flight.do(cache_key(url, params), lambda: self.__get(url, params))
+
+    def __get(self, url: str, params: Dict[str, str] | None) -> Response:
+        if self.__cache is None:
+            return self.__session.get(url, params=params, allow_redirects=self.__allow_redirects)
+
+        def send(headers: Dict[str, str]) -> Response:
+            return self.__session.get(
+                url, params=params, headers=headers, allow_redirects=self.__allow_redirects
+            )
+
+        return self.__cache.fetch(cache_key(url, params), send)
 
     def post(
         self, url: str, data: Dict[str, str] | None = None, params: Dict[str, str] | None = None
@@ -228,24 +558,288 @@ class HttpClient:
         log.debug("WebClient.options(): %s. Params: %s. Data: %s.", url, params, data)
         return self.__session.options(url, data=data, params=params, allow_redirects=self.__allow_redirects)
 
-    # def get_text_2_files(self, urls: Dict[str, str], dir: str, allow_redicrects: bool,
-    #                      fail_on_error: bool) -> None:
-    #     log.debug(f'get_text_2_files(): saving multiple urls to dir: {dir}.')
-
-    #     if not urls:
-    #         raise ScraperException('Provided empty URLs dictionary!')
+    def __request(self, method: str, url: str, kwargs: Dict[str, Any]) -> BatchResult:
+        try:
+            plain_get = method == "GET" and set(kwargs) <= {"params"}
+            if plain_get and (self.__cache is not None or self.__single_flight is not None):
+                return BatchResult(url, self.get(url, kwargs.get("params")), None)  # cached/coalesced
+            response = self.__session.request(method, url, allow_redirects=self.__allow_redirects, **kwargs)
+            return BatchResult(url, response, None)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log.debug("WebClient.%s(): %s failed: %s.", method.lower(), url, e)
+            return BatchResult(url, None, e)
+
+    def request_many(
+        self,
+        method: str,
+        urls: Iterable[str | Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = HTTP_DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+        **kwargs,
+    ) -> Iterator[BatchResult]:
+        """Perform HTTP requests (with retry, if necessary) for the URLs concurrently. Requests share the
+        session (connection pool, headers, cookies). Failed request doesn't cancel the batch - its error
+        is returned in the result. URLs are consumed lazily, not more than 2 * max_concurrency requests
+        are scheduled at once.
+        :param method: HTTP method (GET, POST, etc.)
+        :param urls: URLs or tuples (URL, request parameters for the URL, e.g. {"data": ...})
+        :param max_concurrency: max number of concurrent requests (see also pool_size of the client)
+        :param ordered: True - results are returned in order of the URLs, False - as they complete
+        :param kwargs: request parameters for all URLs (params, data, etc.)
+        :return: iterator over results of the requests
+        """
+        if max_concurrency < 1:  # checked here (not in the generator) - fails on the call, not on iteration
+            raise HttpClientException(f"Invalid max concurrency: {max_concurrency}!")
+        log.debug("WebClient.request_many(): %s, max concurrency %s.", method, max_concurrency)
+        return self.__request_many(method, urls, max_concurrency, ordered, kwargs)
 
-    #     if not dir:
-    #         raise ScraperException('Provided empty dir for saving urls!')
+    def __request_many(
+        self,
+        method: str,
+        urls: Iterable[str | Tuple[str, Dict[str, Any]]],
+        max_concurrency: int,
+        ordered: bool,
+        kwargs: Dict[str, Any],
+    ) -> Iterator[BatchResult]:
+        """Generator of the results of the concurrent requests, see request_many()."""
+        requests_iter = iter(urls)
+        pending: deque[Future[BatchResult]] = deque()  # scheduled requests, in order of the URLs
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="HttpClient") as executor:
+
+            def schedule() -> None:
+                for item in requests_iter:
+                    url, url_kwargs = (item, kwargs) if isinstance(item, str) else (item[0], kwargs | item[1])
+                    pending.append(executor.submit(self.__request, method, url, url_kwargs))
+                    if len(pending) >= 2 * max_concurrency:
+                        break
+
+            try:
+                schedule()
+                while pending:
+                    if ordered:
+                        yield pending.popleft().result()
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            pending.remove(future)
+                            yield future.result()
+                    schedule()
+            finally:  # iteration stopped by the caller - don't start the rest of scheduled requests
+                for future in pending:
+                    future.cancel()
+
+    def get_many(
+        self,
+        urls: Iterable[str | Tuple[str, Dict[str, Any]]],
+        params: Dict[str, str] | None = None,
+        max_concurrency: int = HTTP_DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Perform HTTP GET requests concurrently, see request_many().
+        :param params: request parameters -> will be added to all URLs
+        """
+        return self.request_many("GET", urls, max_concurrency, ordered, params=params)
 
-    #     os.makedirs(dir, exist_ok=True)  # if all is OK - create dir for the ship data
+    def post_many(
+        self,
+        urls: Iterable[str | Tuple[str, Dict[str, Any]]],
+        data: Dict[str, str] | None = None,
+        params: Dict[str, str] | None = None,
+        max_concurrency: int = HTTP_DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Perform HTTP POST requests concurrently, see request_many().
+        :param data: request data -> will be added to all requests (per-URL data - see request_many())
+        :param params: request parameters -> will be added to all URLs
+        """
+        return self.request_many("POST", urls, max_concurrency, ordered, data=data, params=params)
 
-    #     # check existence of files with additional info and request if missing
-    #     for key in urls:
-    #         file = dir + "/" + key + ".html"
-    #         if not Path(file).exists():  # if file doesn't exist - request it
-    #             # HTTP GET request + save to file
-    #             self.get_text_2_file(urls[key], file, allow_redicrects, fail_on_error)
+    def download(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        url: str,
+        path: str,
+        params: Dict[str, str] | None = None,
+        checksum: str | None = None,
+        chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+        resume: bool = True,
+    ) -> str:
+        """Download file via HTTP GET request (with retry, if necessary) in chunks: response body is
+        streamed through one preallocated buffer, so memory usage doesn't depend on the file size. File
+        is written to the temporary [path].part file, which is renamed to [path] after the verification.
+        Interrupted download keeps the .part file, next download of the same path resumes it with the
+        Range request (if server doesn't support ranges - file is downloaded from the beginning).
+        :param path: local path to save the file (missing dirs are created)
+        :param params: request parameters -> will be added to the URL
+        :param checksum: expected checksum "<algorithm>:<hex digest>", e.g. "sha256:0a1b...", optional
+        :param chunk_size: size of the buffer for reading the response
+        :param resume: False - ignore existing .part file (download from the beginning)
+        :return: path to the downloaded file
+        :raises HttpClientException: download was interrupted, size or checksum doesn't match
+        """
+        log.debug("WebClient.download(): %s -> %s. Params: %s.", url, path, params)
+        if not url or not url.strip():  # fail-fast check for provided url
+            raise HttpClientException("Provided empty URL!")
+        hasher, expected_digest = _checksum_hasher(checksum)
+
+        target_dir = os.path.dirname(path)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)  # create necessary parent dirs in path
+        part_path = path + HTTP_DOWNLOAD_PART_SUFFIX
+        offset = os.path.getsize(part_path) if resume and os.path.exists(part_path) else 0
+
+        buffer = memoryview(bytearray(chunk_size))  # the only buffer for the whole download
+        response, total = self.__open_download(url, params, offset)
+        if response is None:  # .part file is already complete
+            _hash_file(part_path, hasher, buffer)
+        else:
+            with response:
+                if response.status_code != 206:  # server ignored the Range header - from the beginning
+                    offset = 0
+                if offset:
+                    _hash_file(part_path, hasher, buffer)
+                _write_stream(response, part_path, offset, hasher, buffer)
+
+        size = os.path.getsize(part_path)
+        if total is not None and size != total:
+            os.unlink(part_path)
+            raise HttpClientException(
+                f"Downloaded size [{size}] of [{url}] doesn't match expected [{total}]!"
+            )
+        if hasher is not None and hasher.hexdigest() != expected_digest:
+            os.unlink(part_path)
+            raise HttpClientException(f"Checksum of [{url}] doesn't match: [{hasher.hexdigest()}]!")
+        os.replace(part_path, path)
+        log.info("Downloaded file: %s and put here: %s", url, path)
+        return path
+
+    def __open_download(
+        self, url: str, params: Dict[str, str] | None, offset: int
+    ) -> Tuple[Response | None, int | None]:
+        """Starts the download from the offset: returns streamed response (None - the file is already
+        downloaded) and expected file size (None - unknown)."""
+        headers = {"Accept-Encoding": "identity"}  # exact bytes of the file (for ranges and checksum)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            response = self.__session.get(
+                url, params=params, headers=headers, stream=True, allow_redirects=self.__allow_redirects
+            )
+        except requests.HTTPError as e:
+            if offset == 0 or e.response is None or e.response.status_code != 416:
+                raise
+            e.response.close()
+            total = _content_range(e.response.headers.get("Content-Range", ""))[1]
+            if total == offset:  # range is not satisfiable - .part file is complete
+                return None, total
+            return self.__open_download(url, params, 0)
+
+        if response.status_code == 206:
+            start, total = _content_range(response.headers.get("Content-Range", ""))
+            if start != offset:
+                response.close()
+                raise HttpClientException(f"Server returned invalid range for [{url}]: start [{start}]!")
+            return response, total
+        length = response.headers.get("Content-Length", "")
+        return response, int(length) if length.isdigit() else None
+
+    def download_segmented(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        url: str,
+        path: str,
+        segments: int = HTTP_DOWNLOAD_SEGMENTS,
+        params: Dict[str, str] | None = None,
+        checksum: str | None = None,
+        chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+    ) -> str:
+        """Download large file with several concurrent Range requests (segments) over the pooled session.
+        File size and ranges support are probed with HEAD request, each segment is written at its offset
+        into the preallocated temporary file (os.pwrite), failed segment is retried separately (from the
+        failed position) according to the client retry strategy. If the server doesn't support ranges,
+        file size is unknown (or os.pwrite isn't available) - falls back to the single stream download().
+        Segmented download isn't resumed after the failure (temporary file is removed).
+        :param segments: number of concurrent segments (see also pool_size of the client)
+        :return: path to the downloaded file
+        :raises HttpClientException: download failed, checksum doesn't match
+        """
+        log.debug("WebClient.download_segmented(): %s -> %s, segments: %s.", url, path, segments)
+        size = self.__probe_ranges(url, params) if segments > 1 and hasattr(os, "pwrite") else None
+        if not size or size < segments * chunk_size:  # ranges aren't supported or file is too small
+            return self.download(url, path, params, checksum, chunk_size)
+        hasher, expected_digest = _checksum_hasher(checksum)
+
+        target_dir = os.path.dirname(path)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)  # create necessary parent dirs in path
+        fd, tmp_file = tempfile.mkstemp(dir=target_dir or None, prefix=".download_")
+        try:
+            os.ftruncate(fd, size)  # preallocate the file
+            bounds = [size * number // segments for number in range(segments + 1)]
+            with ThreadPoolExecutor(max_workers=segments, thread_name_prefix="HttpDownload") as executor:
+                futures = [
+                    executor.submit(self.__download_range, url, params, fd, start, end, chunk_size)
+                    for start, end in zip(bounds, bounds[1:])
+                ]
+                for future in futures:
+                    future.result()  # re-raises error of the segment
+            os.close(fd)
+            fd = -1
+            _hash_file(tmp_file, hasher, memoryview(bytearray(chunk_size)))
+            if hasher is not None and hasher.hexdigest() != expected_digest:
+                raise HttpClientException(f"Checksum of [{url}] doesn't match: [{hasher.hexdigest()}]!")
+            os.replace(tmp_file, path)
+        except BaseException:
+            if fd >= 0:
+                os.close(fd)
+            os.unlink(tmp_file)
+            raise
+        log.info("Downloaded file: %s (%s segments) and put here: %s", url, segments, path)
+        return path
+
+    def __probe_ranges(self, url: str, params: Dict[str, str] | None) -> int | None:
+        """Returns file size if the server supports byte ranges for the URL, otherwise - None."""
+        try:
+            response = self.__session.head(
+                url,
+                params=params,
+                headers={"Accept-Encoding": "identity"},
+                allow_redirects=self.__allow_redirects,
+            )
+        except requests.HTTPError as e:  # HEAD request isn't supported
+            log.debug("HEAD request for [%s] failed: %s", url, e)
+            return None
+        length = response.headers.get("Content-Length", "")
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes" or not length.isdigit():
+            return None
+        return int(length)
+
+    def __download_range(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self, url: str, params: Dict[str, str] | None, fd: int, start: int, end: int, chunk_size: int
+    ) -> None:
+        """Downloads bytes [start, end) of the file and writes them at the same offset of the file."""
+        retry = self.__adapter.max_retries
+        buffer = memoryview(bytearray(chunk_size))
+        while start < end:
+            headers = {"Accept-Encoding": "identity", "Range": f"bytes={start}-{end - 1}"}
+            try:
+                with self.__session.get(
+                    url, params=params, headers=headers, stream=True, allow_redirects=self.__allow_redirects
+                ) as response:
+                    range_start = _content_range(response.headers.get("Content-Range", ""))[0]
+                    if response.status_code != 206 or range_start != start:
+                        raise HttpClientException(f"Server doesn't return the requested range of [{url}]!")
+                    while start < end and (read := response.raw.readinto(buffer)):
+                        chunk = buffer[: min(read, end - start)]
+                        _pwrite_all(fd, chunk, start)
+                        start += len(chunk)
+                if start < end:
+                    raise ProtocolError(f"Incomplete range: {end - start} byte(s) missing")
+            except (ProtocolError, ReadTimeoutError) as e:  # body read failed (request is retried by adapter)
+                try:
+                    retry = retry.increment("GET", url, error=e)
+                except MaxRetryError:
+                    raise HttpClientException(f"Segment of [{url}] failed at [{start}]: {e}") from e
+                log.debug("Segment of [%s] failed at [%s] (%s), retrying...", url, start, e)
+                time.sleep(retry.get_backoff_time())
 
 
 # def http_get_request(url: str, request_params: dict, retry_count: int = 0) -> str:
@@ -327,47 +921,5 @@ class HttpClient:
 #     return ""  # return empty string if got an empty answer
 
 
-# def perform_file_download_over_http(url: str, target_dir: str, target_file: str = None) -> str:
-#     """Downloads file via HTTP protocol.
-#     :param url: URL for file download, shouldn't be empty.
-#     :param target_dir: local dir to save file, if empty - save to the current dir
-#     :param target_file: local file name to save, if empty - file name will be derived from URL
-#     :return: path to locally saved file, that was downloaded
-#     """
-#     log.debug(
-#         f"perform_file_download_over_http(): downloading link: {url}, target dir: {target_dir}, "
-#         f"target_file: {target_file}."
-#     )
-
-#     if not url or len(url.strip()) == 0:  # fail-fast check for provided url
-#         raise ValueError("Provided empty URL!")
-
-#     # check target dir name - if not empty we will create all missing dirs in the path
-#     if target_dir is not None and len(target_dir.strip()) > 0:
-#         Path(target_dir).mkdir(parents=True, exist_ok=True)  # create necessary parent dirs in path
-#         log.debug(f"Created all missing dirs in path: {target_dir}")
-#     else:
-#         log.debug("Provided empty target dir - file will be saved in the current directory.")
-
-#     # pick a target file name
-#     local_file_name: str = ''
-#     if target_file is None or len(target_file.strip()) == 0:
-#         local_file_name = Path(url).name
-#     else:
-#         local_file_name = target_file
-#     log.debug(f"Target file name: {local_file_name}")
-
-#     # construct the full local target path
-#     local_path: str = target_dir + "/" + local_file_name
-#     log.debug(f"Generated local full path: {local_path}")
-
-#     # download the file from the provided `url` and save it locally under certain `file_name`:
-#     with request.urlopen(url) as my_response, open(local_path, "wb") as out_file:
-#         shutil.copyfileobj(my_response, out_file)
-#     log.info(f"Downloaded file: {url} and put here: {local_path}")
-
-#     return local_path
-
-
 if __name__ == "__main__":
     print(MSG_MODULE_ISNT_RUNNABLE)
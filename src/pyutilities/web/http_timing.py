@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-request timing instrumentation for the HttpClient. RequestTimer, passed to the client, records for
+each request (each hop of the redirects) the breakdown of its time (seconds):
+    - throttle: waiting for the rate limiter (see RateLimiter)
+    - connect: opening the TCP connection (0 - pooled connection was reused)
+    - tls: TLS handshake
+    - ttfb: time to the first byte - from sending the request till the response headers
+    - body: reading of the response body (0 for the streamed responses - body is read by the caller)
+    - retry_sleep: sleeping between attempts of the retry strategy (urllib3 Retry)
+    - total: the whole request, including all attempts
+Connect, tls and ttfb are summed over all attempts, attempts - number of requests sent to the server
+(1 + retries made by the retry strategy).
+
+Timings are passed to the hooks (callables, see RequestTimer.add_hook()) and are aggregated per host:
+counters, phase totals and latency histogram (fixed buckets), see RequestTimer.export(). Instrumented
+connection classes are installed only into clients with the timer, so clients without it have no
+overhead. Phases are measured in the thread of the request (state is kept in the thread local).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import bisect
+import logging
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.response import BaseHTTPResponse, HTTPResponse
+from urllib3.util.retry import Retry
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# default upper bounds of the latency histogram buckets (seconds), the last bucket - +Inf
+HTTP_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TIMING_PHASES = ("throttle", "connect", "tls", "ttfb", "body", "retry_sleep")
+
+_active = threading.local()  # timing of the request, performed by the current thread
+
+
+class RequestTiming:
+    """Timing of one request (see module docstring for the phases)."""
+
+    FIELDS = ("method", "url", "host", "status", "error", "attempts") + TIMING_PHASES + ("total",)
+    __slots__ = FIELDS + ("sent", "connected")
+
+    def __init__(self, method: str, url: str) -> None:
+        self.method = method
+        self.url = url
+        self.host = urlsplit(url).netloc
+        self.status: int | None = None
+        self.error: str | None = None  # exception type, if request failed
+        self.attempts = 0
+        self.throttle = self.connect = self.tls = self.ttfb = self.body = self.retry_sleep = 0.0
+        self.total = 0.0
+        self.sent = self.connected = 0.0  # moments of the last attempt (time.perf_counter())
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in RequestTiming.FIELDS}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{name}={getattr(self, name):.4f}" for name in TIMING_PHASES + ("total",))
+        attempts = f"status={self.status}, attempts={self.attempts}"
+        return f"RequestTiming({self.method} {self.url}, {attempts}, {phases})"
+
+
+def active_timing() -> RequestTiming | None:
+    """Returns timing of the request, performed by the current thread (None - request isn't timed)."""
+    return getattr(_active, "timing", None)
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed buckets (upper bounds, seconds) + count, sum, min and max."""
+
+    def __init__(self, bounds: Tuple[float, ...] = HTTP_LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last one - above the last bound
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Returns estimation of the quantile (upper bound of its bucket, not more than max)."""
+        if not self.count:
+            return 0.0
+        rank, cumulative = q * self.count, 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = [[bound, count] for bound, count in zip(self.bounds, self.counts)]
+        return {
+            "buckets": buckets + [["+Inf", self.counts[-1]]],
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _HostTimings:
+    __slots__ = ("requests", "attempts", "errors", "phases", "histogram")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.requests = self.attempts = self.errors = 0
+        self.phases = dict.fromkeys(TIMING_PHASES, 0.0)
+        self.histogram = LatencyHistogram(bounds)
+
+    def add(self, timing: RequestTiming) -> None:
+        self.requests += 1
+        self.attempts += timing.attempts
+        self.errors += timing.error is not None
+        for name in TIMING_PHASES:
+            self.phases[name] += getattr(timing, name)
+        self.histogram.add(timing.total)
+
+
+class RequestTimer:
+    """Collects timings of the requests (thread-safe): passes them to the hooks and aggregates per host.
+    :param hooks: callables, called with RequestTiming after each request (in the thread of the request)
+    :param bounds: upper bounds (seconds) of the latency histogram buckets
+    """
+
+    def __init__(
+        self,
+        hooks: List[Callable[[RequestTiming], None]] | None = None,
+        bounds: Tuple[float, ...] = HTTP_LATENCY_BUCKETS,
+    ) -> None:
+        if list(bounds) != sorted(bounds):
+            raise ValueError(f"Histogram bounds should be sorted: {bounds}!")
+        self.__hooks = list(hooks) if hooks else []
+        self.__bounds = tuple(bounds)
+        self.__hosts: Dict[str, _HostTimings] = {}
+        self.__lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[RequestTiming], None]) -> None:
+        self.__hooks.append(hook)
+
+    def start(self, method: str, url: str) -> RequestTiming:
+        """Starts timing of the request in the current thread."""
+        timing = RequestTiming(method, url)
+        timing.total = time.perf_counter()  # start moment, replaced by the duration in finish()
+        _active.timing = timing
+        return timing
+
+    def finish(self, timing: RequestTiming) -> None:
+        """Finishes timing of the request: aggregates it and calls the hooks (errors are logged)."""
+        timing.total = time.perf_counter() - timing.total
+        _active.timing = None
+        with self.__lock:
+            host = self.__hosts.get(timing.host)
+            if host is None:
+                host = self.__hosts[timing.host] = _HostTimings(self.__bounds)
+            host.add(timing)
+        for hook in self.__hooks:
+            try:
+                hook(timing)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                log.warning("RequestTimer: hook %r failed: %s", hook, e)
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """Returns copies of the per host latency histograms."""
+        with self.__lock:
+            return {name: _copy_histogram(host.histogram) for name, host in self.__hosts.items()}
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """Returns per host statistics (JSON-serializable): requests, attempts, errors, phases (totals,
+        seconds) and histogram (see LatencyHistogram.to_dict())."""
+        with self.__lock:
+            return {
+                name: {
+                    "requests": host.requests,
+                    "attempts": host.attempts,
+                    "errors": host.errors,
+                    "phases": dict(host.phases),
+                    "histogram": host.histogram.to_dict(),
+                }
+                for name, host in self.__hosts.items()
+            }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__hosts.clear()
+
+
+def _copy_histogram(histogram: LatencyHistogram) -> LatencyHistogram:
+    copy = LatencyHistogram(histogram.bounds)
+    copy.counts = list(histogram.counts)
+    copy.count, copy.sum, copy.min, copy.max = histogram.count, histogram.sum, histogram.min, histogram.max
+    return copy
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTP connection, which records connect time, attempts and TTFB into the active timing."""
+
+    def _new_conn(self) -> socket.socket:
+        timing = active_timing()
+        if timing is None:
+            return super()._new_conn()
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            timing.connected = time.perf_counter()
+            timing.connect += timing.connected - start
+
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        timing = active_timing()
+        if timing is not None:
+            timing.attempts += 1
+            timing.sent = time.perf_counter()
+        super().request(*args, **kwargs)
+
+    def getresponse(self) -> HTTPResponse:  # type: ignore[override]  # as in urllib3 HTTPConnection
+        response = super().getresponse()
+        timing = active_timing()
+        if timing is not None:  # plain HTTP connection is opened lazily - after the request start
+            timing.ttfb += time.perf_counter() - max(timing.sent, timing.connected)
+        return response
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """HTTPS connection, which records also TLS handshake time into the active timing."""
+
+    def connect(self) -> None:
+        timing = active_timing()
+        if timing is None:
+            super().connect()
+            return
+        start, connect = time.perf_counter(), timing.connect
+        try:
+            super().connect()
+        finally:
+            timing.connected = time.perf_counter()
+            timing.tls += timing.connected - start - (timing.connect - connect)  # without TCP connect
+
+
+class TimedRetry(Retry):
+    """Retry strategy, which records sleeping between attempts into the active timing."""
+
+    def sleep(self, response: BaseHTTPResponse | None = None) -> None:
+        timing = active_timing()
+        if timing is None:
+            super().sleep(response)
+            return
+        start = time.perf_counter()
+        try:
+            super().sleep(response)
+        finally:
+            timing.retry_sleep += time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-host token bucket rate limiter for the HTTP clients (HttpClient, AsyncHttpClient). Each host has
+its own bucket: [rate] requests per second with bursts up to [burst] requests. Requests reserve tokens
+under the lock and wait (outside of the lock) for their turn, so waiting requests are served in order
+of their arrival, both from threads (acquire()) and from coroutines (acquire_async()).
+
+Limiter adapts to the server hints in responses (see update()): Retry-After header and exhausted quota
+(X-RateLimit-Remaining: 0 + X-RateLimit-Reset) pause all requests to the host until the given time.
+Wait statistics per host are available by stats().
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+_EPOCH_THRESHOLD = 1_000_000_000  # X-RateLimit-Reset values above it are epoch seconds, not a delay
+
+
+class _Bucket:
+    __slots__ = ("rate", "burst", "tokens", "updated", "paused_until", "stats")
+
+    def __init__(self, rate: float, burst: float, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+        self.paused_until = 0.0
+        self.stats = {"requests": 0, "waits": 0, "wait_time": 0.0, "max_wait": 0.0}
+
+    def reserve(self, now: float) -> float:
+        """Takes the token and returns time to wait for it (tokens may go negative - reserved ones)."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = max(-self.tokens / self.rate if self.tokens < 0 else 0.0, self.paused_until - now)
+        self.stats["requests"] += 1
+        if wait > 0:
+            self.stats["waits"] += 1
+            self.stats["wait_time"] += wait
+            self.stats["max_wait"] = max(self.stats["max_wait"], wait)
+        return wait
+
+
+class RateLimiter:
+    """Per-host token bucket rate limiter.
+    :param rate: default number of requests per second for the host
+    :param burst: default max number of requests without waiting (bucket size), default - max(rate, 1)
+    :param hosts: limits for the specific hosts: host (netloc, e.g. "api.host.com:8080") -> (rate, burst)
+    """
+
+    def __init__(
+        self, rate: float, burst: float | None = None, hosts: Dict[str, Tuple[float, float]] | None = None
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}!")
+        self.__rate = rate
+        self.__burst = burst if burst is not None else max(rate, 1.0)
+        self.__hosts = dict(hosts) if hosts else {}
+        self.__buckets: Dict[str, _Bucket] = {}
+        self.__lock = threading.Lock()
+
+    def __reserve(self, url: str) -> float:
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        with self.__lock:
+            bucket = self.__buckets.get(host)
+            if bucket is None:
+                rate, burst = self.__hosts.get(host, (self.__rate, self.__burst))
+                bucket = self.__buckets[host] = _Bucket(rate, burst, now)
+            return bucket.reserve(now)
+
+    def acquire(self, url: str) -> float:
+        """Waits (blocks the thread) for the permission to send request to the URL host.
+        :return: waiting time (seconds)
+        """
+        wait = self.__reserve(url)
+        if wait > 0:
+            log.debug("RateLimiter: waiting %.3f sec for [%s].", wait, url)
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Waits (without blocking the event loop) for the permission to send request to the URL host."""
+        wait = self.__reserve(url)
+        if wait > 0:
+            log.debug("RateLimiter: waiting %.3f sec for [%s].", wait, url)
+            await asyncio.sleep(wait)
+        return wait
+
+    def update(self, url: str, headers) -> None:
+        """Adapts to the rate limiting headers of the response (Retry-After, X-RateLimit-*): requests to the
+        host are paused until the time given by the server."""
+        delay = _retry_after(headers.get("Retry-After"))
+        if headers.get("X-RateLimit-Remaining", "").strip() == "0":
+            delay = max(delay or 0.0, _reset_delay(headers.get("X-RateLimit-Reset", "")) or 0.0)
+        if not delay:
+            return
+        host = urlsplit(url).netloc
+        with self.__lock:
+            bucket = self.__buckets.get(host)
+            if bucket is not None:
+                bucket.paused_until = max(bucket.paused_until, time.monotonic() + delay)
+        log.debug("RateLimiter: requests to [%s] are paused for %.3f sec.", host, delay)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Returns per host statistics: requests, waits (requests, which waited), wait_time (total, seconds),
+        max_wait (seconds)."""
+        with self.__lock:
+            return {host: dict(bucket.stats) for host, bucket in self.__buckets.items()}
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parses Retry-After header value: delay in seconds or HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _reset_delay(value: str) -> float | None:
+    """Parses X-RateLimit-Reset header value: delay in seconds or epoch seconds of the reset."""
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    return max(0.0, reset - time.time()) if reset > _EPOCH_THRESHOLD else reset
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
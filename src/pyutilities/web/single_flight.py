@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Single-flight coalescing of the identical concurrent requests for the HttpClient (GET requests): while
+the request for the key (URL with parameters) is in flight, other threads requesting the same key don't
+send their own requests - they wait for the result of the first one (or its error). Result isn't kept
+after the request is completed (it isn't a cache, see HttpCache), so only simultaneous requests are
+coalesced - e.g. the "thundering herd" after the expiration of the cached response.
+
+By default (copy_responses=True) each waiting thread gets its own copy of the response: headers,
+cookies and history are copied, the body (immutable bytes) is shared without copying, so callers can't
+affect each other. With copy_responses=False all threads get the same Response object (callers should
+treat it as read-only). SingleFlight can be shared by several clients only if their requests are
+interchangeable (same headers, credentials, etc.) - the key doesn't include them.
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import copy
+import logging
+import threading
+from typing import Callable, Dict, cast
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class _Call:
+    __slots__ = ("done", "response", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Response | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+def copy_response(response: Response) -> Response:
+    """Returns copy of the (not streamed) response, which shares the body with the original one."""
+    copied = copy.copy(response)  # see Response.__getstate__(): body is loaded, connection isn't copied
+    copied.headers = CaseInsensitiveDict(response.headers)
+    copied.cookies = response.cookies.copy()
+    copied.history = list(response.history)
+    return copied
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one call (thread-safe). Counters: calls (all
+    calls), executions (calls, performed the request), coalesced (calls, which got the result of the
+    other call), errors (failed executions), rate (coalesced / calls), in_flight (executions right now).
+    :param copy_responses: True - each coalesced call gets its own copy of the response (body is shared)
+    """
+
+    def __init__(self, copy_responses: bool = True) -> None:
+        self.__copy_responses = copy_responses
+        self.__calls: Dict[str, _Call] = {}
+        self.__lock = threading.Lock()
+        self.__counters = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0}
+
+    def stats(self) -> Dict[str, float]:
+        """Returns copy of the counters, coalescing rate and number of the requests in flight."""
+        with self.__lock:
+            calls = self.__counters["calls"]
+            rate = self.__counters["coalesced"] / calls if calls else 0.0
+            return dict(self.__counters, rate=rate, in_flight=len(self.__calls))
+
+    def do(self, key: str, send: Callable[[], Response]) -> Response:
+        """Returns response of the request for the key: performs it or waits for the same one in flight.
+        :param key: request key (e.g. URL with parameters, see cache_key())
+        :param send: function, which performs the request
+        :raises: error of the request (the same exception object is raised in all coalesced calls)
+        """
+        with self.__lock:
+            self.__counters["calls"] += 1
+            call = self.__calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.__calls[key] = _Call()
+                self.__counters["executions"] += 1
+            else:
+                self.__counters["coalesced"] += 1
+                call.waiters += 1
+        if leader:
+            return self.__execute(key, call, send)
+
+        log.debug("SingleFlight: waiting for the request [%s] in flight.", key)
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        response = cast(Response, call.response)
+        return copy_response(response) if self.__copy_responses else response
+
+    def __execute(self, key: str, call: _Call, send: Callable[[], Response]) -> Response:
+        try:
+            response = send()
+        except BaseException as e:
+            call.error = e
+            with self.__lock:
+                self.__counters["errors"] += 1
+            raise
+        else:
+            call.response = response
+        finally:
+            with self.__lock:  # new calls for the key will perform the new request
+                del self.__calls[key]
+            call.done.set()
+        if call.waiters and self.__copy_responses:  # the original stays untouched for the waiting calls
+            return copy_response(response)
+        return response
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pool of fake User Agent strings for the HTTP clients. The fake_useragent dataset is loaded lazily - on
+the first request for the agent (importing the HTTP client modules doesn't load it, clients with the
+fixed user agent never load it). Pool samples [size] random agents once, next() rotates them in O(1).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import itertools
+import logging
+import threading
+from typing import List
+
+from pyutilities.defaults import MSG_MODULE_ISNT_RUNNABLE
+
+# init module logger
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+HTTP_USER_AGENTS_POOL_SIZE = 32  # default number of pre-sampled user agents
+
+
+class UserAgentPool:
+    """Pre-sampled random (fake) user agents, rotated by next() (thread-safe)."""
+
+    def __init__(self, size: int = HTTP_USER_AGENTS_POOL_SIZE) -> None:
+        if size < 1:
+            raise ValueError(f"Invalid user agents pool size: {size}!")
+        self.__size = size
+        self.__agents: List[str] | None = None
+        self.__counter = itertools.count()  # next() of the counter is atomic
+        self.__lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.__agents is not None
+
+    def __load(self) -> List[str]:
+        with self.__lock:
+            if self.__agents is None:
+                from fake_useragent import UserAgent  # pylint: disable=import-outside-toplevel
+
+                user_agent = UserAgent()
+                self.__agents = [user_agent.random for _ in range(self.__size)]
+                log.debug("UserAgentPool: sampled %s user agent(s).", self.__size)
+        return self.__agents
+
+    def next(self) -> str:
+        """Returns the next user agent of the pool (pool is sampled on the first call)."""
+        agents = self.__agents if self.__agents is not None else self.__load()
+        return agents[next(self.__counter) % self.__size]
+
+
+DEFAULT_USER_AGENTS = UserAgentPool()  # pool, shared by all HTTP clients
+
+
+if __name__ == "__main__":
+    print(MSG_MODULE_ISNT_RUNNABLE)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for generated configuration accessors (ConfigAccessors + Configuration.accessors()).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.accessors import ConfigNode, attribute_name
+from pyutilities.config.configuration import ConfigError, Configuration
+
+
+@pytest.fixture
+def config():
+    return Configuration(
+        dict_to_merge={
+            "db": {"primary": {"host": "h1", "port": "5432", "ssl": "off"}, "replicas": "r1,r2"},
+            "name": "app",
+            "class": {"max-size": 10},
+        },
+        is_merge_env=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("name", "name"),
+        ("max-size", "max_size"),
+        ("class", "_class"),
+        ("1st", "_1st"),
+        ("__x", "k__x"),
+        (5, "_5"),
+    ],
+)
+def test_attribute_name(key, expected):
+    assert attribute_name(key) == expected
+
+
+def test_accessors_without_schema(config):
+    root = config.accessors().root
+    assert root.db.primary.port == "5432"
+    assert root.name == "app"
+    assert root._class.max_size == 10
+    assert isinstance(root.db, ConfigNode)
+    assert type(root.db).__slots__ == ("primary", "replicas")
+    assert not hasattr(root.db, "__dict__")
+    with pytest.raises(AttributeError):
+        root.name = "other"
+
+
+def test_accessors_with_schema(config):
+    schema = {"db": {"primary": {"host": str, "port": int, "ssl": bool}, "replicas": list}}
+    root = config.accessors(schema).root
+    assert root.db.primary.port == 5432
+    assert root.db.primary.ssl is False
+    assert root.db.replicas == ["r1", "r2"]
+    assert not hasattr(root, "name")  # only keys from the schema
+
+
+def test_accessors_schema_errors_reported_up_front(config):
+    schema = {"db": {"primary": {"host": int, "timeout": float}, "replicas": {"x": str}}, "name": {"y": str}}
+    with pytest.raises(ConfigError) as error:
+        config.accessors(schema)
+    message = str(error.value)
+    for key in ("db.primary.host", "db.primary.timeout", "db.replicas", "name"):
+        assert f"[{key}]" in message
+
+
+def test_accessors_rebuilt_after_changes(config):
+    accessors = config.accessors({"db": {"primary": {"port": int}}})
+    root = accessors.root
+    assert accessors.root is root  # no changes - the same object
+
+    config.set("db.primary.port", "6432")
+    new_root = accessors.root
+    assert new_root.db.primary.port == 6432
+    assert root.db.primary.port == 5432  # old accessors aren't changed
+    assert type(new_root) is type(root)  # the same structure - classes are reused
+
+
+def test_accessors_rebuilt_on_reload(tmp_path):
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("db:\n  port: 1\n")
+    config = Configuration(is_merge_env=False)
+    config.load(str(tmp_path), is_merge_env=False, reloadable=True)
+    accessors = config.accessors({"db": {"port": int}})
+
+    config_file.write_text("db:\n  port: 22\n")
+    config.reload()
+    assert accessors.root.db.port == 22
+
+    config_file.write_text("db:\n  port: invalid\n")
+    config.reload()  # rebuilding error is reported by the root property
+    with pytest.raises(ConfigError):
+        accessors.root  # pylint: disable=W0104
+    accessors.close()
+
+
+def test_accessors_attribute_names_collision():
+    config = Configuration(dict_to_merge={"a-b": 1, "a_b": 2}, is_merge_env=False)
+    with pytest.raises(ConfigError, match="the same attribute name"):
+        config.accessors()
+
+
+def test_accessors_with_environment(monkeypatch):
+    monkeypatch.setenv("ACC_ENV_ONLY", "env")
+    monkeypatch.setenv("ACC-NAME", "skipped")  # the same attribute name as the config key
+    config = Configuration(dict_to_merge={"acc_name": "app"}, is_merge_env=False)
+    config.merge_env()
+    assert "acc_env_only" in config.keys()
+    root = config.accessors().root
+    assert root.acc_env_only == "env"
+    assert root.acc_name == "app"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for binary forms of the configuration (marshal form + memory mapped MappedConfig).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import datetime
+
+import pytest
+
+from pyutilities.config.binary import MappedConfig, dumps_config, loads_config, write_mapped_config
+from pyutilities.config.configuration import ConfigError, Configuration
+
+CONFIG = {
+    "db": {"host": "h1", "port": 5432, "opts": {"ssl": True, "list": [1, "a"]}, "empty": {}},
+    "db-x": "sibling",
+    "name": "app",
+    "weird": {1: "int key", "a.b": "dotted key"},
+    "unicode": {"ключ": "значение"},
+}
+
+
+@pytest.fixture
+def config():
+    return Configuration(dict_to_merge=CONFIG, is_merge_env=False)
+
+
+def test_bytes_roundtrip(config):
+    restored = Configuration.from_bytes(config.to_bytes())
+    assert restored.config_dict == config.config_dict
+    assert restored.get("db.opts.list") == [1, "a"]
+    assert restored.get("unicode.ключ") == "значение"
+
+
+def test_from_bytes_kwargs():
+    source = Configuration(dict_to_merge={"a": "${b}", "b": 1}, is_merge_env=False)
+    assert Configuration.from_bytes(source.to_bytes(), resolve_templates=True).get("a") == 1
+
+
+def test_bytes_invalid():
+    with pytest.raises(ConfigError):
+        dumps_config({"date": datetime.date(2026, 10, 18)})
+    with pytest.raises(ConfigError):
+        loads_config(b"garbage")
+    with pytest.raises(ConfigError):
+        loads_config(dumps_config({})[:-1])
+
+
+@pytest.fixture
+def mapped_file(config, tmp_path):
+    path = str(tmp_path / "config.bin")
+    config.write_mapped(path)
+    return path
+
+
+def test_mapped_lookups(config, mapped_file):
+    with MappedConfig(mapped_file) as mapped:
+        for key in ("db.host", "db.port", "db.opts.list", "db.empty", "db-x", "weird", "unicode.ключ", "db"):
+            assert mapped.get(key) == config.get(key), key
+        assert mapped.get("db.opts") == {"ssl": True, "list": [1, "a"]}
+        assert mapped.contains_key("db.opts.ssl")
+        assert not mapped.contains_key("db.missing")
+        assert not mapped.contains_key("weird.a.b")
+        assert mapped.get("missing", "default") == "default"
+        with pytest.raises(ConfigError):
+            mapped.get("db.h")
+        assert mapped.to_dict() == config.config_dict
+
+
+def test_mapped_invalid_file(tmp_path):
+    for content in (b"", b"short", b"x" * 100):
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(content)
+        with pytest.raises(ConfigError):
+            MappedConfig(str(path))
+
+
+def test_mapped_unsupported_value(tmp_path):
+    with pytest.raises(ConfigError, match=r"\[a.date\]"):
+        write_mapped_config({"a": {"date": datetime.date(2026, 10, 18)}}, str(tmp_path / "config.bin"))
+    assert list(tmp_path.iterdir()) == []  # no temporary files left
+
+
+@pytest.mark.parametrize("key", [1, "", "a.b"])
+def test_mapped_unaddressable_top_level_key(tmp_path, key):
+    with pytest.raises(ConfigError, match="can't be mapped"):
+        write_mapped_config({"a": 1, key: "value"}, str(tmp_path / "config.bin"))
+    assert list(tmp_path.iterdir()) == []
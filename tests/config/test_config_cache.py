@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for configuration cache (config_cache module + Configuration cache_file option).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+
+import pytest
+from mock import patch
+
+from pyutilities.config.config_cache import load_cached_config, save_cached_config, sources_fingerprint
+from pyutilities.config.configuration import Configuration
+from pyutilities.io.io_utils import read_yaml
+
+CONFIG_MODULE_MOCK_YAML = "pyutilities.config.configuration.read_yaml"
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "config1.yml").write_text("section1:\n  key1: value1\n")
+    (tmp_path / "config2.yaml").write_text("section2:\n  key2: value2\n")
+    return tmp_path
+
+
+def test_cold_and_warm_start(config_dir, tmp_path):
+    cache_file = str(tmp_path / "cache" / "config.cache")
+
+    with patch(CONFIG_MODULE_MOCK_YAML, wraps=read_yaml) as mock_read_yaml:
+        config = Configuration(str(config_dir), is_merge_env=False, cache_file=cache_file)
+        assert mock_read_yaml.call_count == 2
+    assert os.path.isfile(cache_file)
+    assert config.get("section1.key1") == "value1"
+
+    with patch(CONFIG_MODULE_MOCK_YAML, wraps=read_yaml) as mock_read_yaml:
+        config = Configuration(str(config_dir), is_merge_env=False, cache_file=cache_file)
+        assert mock_read_yaml.call_count == 0  # warm start - no YAML parsing
+    assert config.get("section1.key1") == "value1"
+    assert config.get("section2.key2") == "value2"
+
+
+def test_cache_invalidated_on_change(config_dir, tmp_path):
+    cache_file = str(tmp_path / "config.cache")
+    Configuration(str(config_dir), is_merge_env=False, cache_file=cache_file)
+
+    (config_dir / "config1.yml").write_text("section1:\n  key1: changed\n")
+    config = Configuration(str(config_dir), is_merge_env=False, cache_file=cache_file)
+    assert config.get("section1.key1") == "changed"
+
+    (config_dir / "config3.yml").write_text("section3: value3\n")
+    config = Configuration(str(config_dir), is_merge_env=False, cache_file=cache_file)
+    assert config.get("section3") == "value3"
+
+
+def test_broken_cache_file(config_dir, tmp_path):
+    cache_file = tmp_path / "config.cache"
+    cache_file.write_bytes(b"not a marshal data")
+    config = Configuration(str(config_dir), is_merge_env=False, cache_file=str(cache_file))
+    assert config.get("section1.key1") == "value1"
+    fingerprint = sources_fingerprint([str(config_dir / "config1.yml"), str(config_dir / "config2.yaml")])
+    assert load_cached_config(str(cache_file), fingerprint) == config.config_dict
+
+
+def test_non_cacheable_config(config_dir, tmp_path):
+    fingerprint = sources_fingerprint([str(config_dir / "config1.yml")])
+    cache_file = str(tmp_path / "config.cache")
+    assert not save_cached_config(cache_file, fingerprint, {"key": object()})
+    assert not os.path.exists(cache_file)
+    assert load_cached_config(cache_file, fingerprint) is None
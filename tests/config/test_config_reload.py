@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for configuration reload (config_diff module + Configuration.reload()).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+import time
+
+import pytest
+from mock import patch
+
+from pyutilities.config.config_diff import changed_keys, diff_trees
+from pyutilities.config.configuration import ConfigError, Configuration
+from pyutilities.config.environment import MISSING
+from pyutilities.io.io_utils import read_yaml
+
+CONFIG_MODULE_MOCK_YAML = "pyutilities.config.configuration.read_yaml"
+
+
+def write_config(path, content):
+    path.write_text(content)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))  # guarantee mtime change
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "db.yml").write_text("db:\n  host: localhost\n  port: 5432\n")
+    (tmp_path / "app.yml").write_text("app:\n  name: test\n  workers: 4\n")
+    return tmp_path
+
+
+@pytest.fixture
+def config(config_dir):
+    config = Configuration(is_merge_env=False)
+    config.load(str(config_dir), is_merge_env=False, reloadable=True)
+    return config
+
+
+def test_diff_trees():
+    old = {"a": {"b": 1, "c": {"d": 2}}, "e": 3, "f": [1]}
+    new = {"a": {"b": 1, "c": 5}, "f": [1, 2], "g": {"h": 4}}
+    changes = diff_trees(old, new)
+    assert changes == {("a", "c"): 5, ("e",): MISSING, ("f",): [1, 2], ("g",): {"h": 4}}
+    assert changed_keys(old, changes) == {"a.c", "a.c.d", "e", "f", "g", "g.h"}
+
+
+def test_reload_nothing_changed(config):
+    with patch(CONFIG_MODULE_MOCK_YAML, wraps=read_yaml) as mock_read_yaml:
+        assert config.reload() == set()
+        mock_read_yaml.assert_not_called()
+
+
+def test_reload_changed_file(config, config_dir):
+    notifications = []
+    config.subscribe(notifications.append)
+    write_config(config_dir / "db.yml", "db:\n  host: remote\n  port: 5432\n  user: admin\n")
+
+    with patch(CONFIG_MODULE_MOCK_YAML, wraps=read_yaml) as mock_read_yaml:
+        assert config.reload() == {"db.host", "db.user"}
+        mock_read_yaml.assert_called_once()  # only changed file is parsed
+    assert notifications == [{"db.host", "db.user"}]
+    assert config.get("db.host") == "remote"
+    assert config.get("db.user") == "admin"
+    assert config.get("db") == {"host": "remote", "port": 5432, "user": "admin"}
+    assert config.get("app.name") == "test"
+
+
+def test_reload_added_and_removed_files(config, config_dir):
+    os.remove(config_dir / "app.yml")
+    write_config(config_dir / "cache.yaml", "cache:\n  size: 100\n")
+    assert config.reload() == {"app", "app.name", "app.workers", "cache", "cache.size"}
+    assert not config.contains_key("app.name")
+    assert config.get("cache.size") == 100
+
+
+def test_reload_keeps_live_values(config, config_dir):
+    config.set("app.name", "live")
+    config.set("extra", "value")
+    write_config(config_dir / "db.yml", "db:\n  host: remote\n  port: 5432\n")
+    config.reload()
+    assert config.get("app.name") == "live"
+    assert config.get("extra") == "value"
+    assert config.get("db.host") == "remote"
+
+
+def test_reload_conflict(config, config_dir):
+    write_config(config_dir / "zzz.yml", "db:\n  host: conflict\n")
+    with pytest.raises(ConfigError):
+        config.reload()
+    assert config.get("db.host") == "localhost"  # nothing applied
+
+
+def test_auto_reload(config, config_dir):
+    notifications = []
+    config.subscribe(notifications.append)
+    config.start_auto_reload(interval=0.05)
+    try:
+        write_config(config_dir / "app.yml", "app:\n  name: test\n  workers: 8\n")
+        deadline = time.monotonic() + 5
+        while not notifications and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        config.stop_auto_reload()
+    assert notifications == [{"app.workers"}]
+    assert config.get("app.workers") == 8
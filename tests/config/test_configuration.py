@@ -5,7 +5,7 @@
     Unit tests for Configuration class.
 
     Created:  Gusev Dmitrii, 2017
-    Modified: Gusev Dmitrii, 02.01.2024
+    Modified: Dmitrii Gusev, 18.10.2026
 """
 
 import os
@@ -35,6 +35,32 @@ def test_load_invalid_path(config):
             config.load(invalid_path)
 
 
+@pytest.fixture
+def config_dir(tmp_path):
+    for i in range(20):
+        (tmp_path / f"config{i:02}.yml").write_text(f"section{i}:\n  key: value{i}\ncommon:\n  key{i}: {i}\n")
+    (tmp_path / "not_a_config.txt").write_text("section0: value")
+    return tmp_path
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_load_parallel(config, config_dir, use_processes):
+    config.load(str(config_dir), is_merge_env=False, workers=4, use_processes=use_processes)
+    sequential = Configuration(is_merge_env=False)
+    sequential.load(str(config_dir), is_merge_env=False)
+
+    assert config.config_dict == sequential.config_dict
+    assert list(config.config_dict) == list(sequential.config_dict)  # deterministic merge order
+    assert list(config.get("common")) == [f"key{i}" for i in range(20)]
+    assert config.get("section7.key") == "value7"
+
+
+def test_load_parallel_conflict(config, config_dir):
+    (config_dir / "config99.yml").write_text("section3:\n  key: other value\n")
+    with pytest.raises(ConfigError):
+        config.load(str(config_dir), is_merge_env=False, workers=4)
+
+
 class ConfigurationTest(unittest.TestCase):
     
     def setUp(self) -> None:
@@ -54,6 +80,29 @@ class ConfigurationTest(unittest.TestCase):
         self.config.merge_env()
         self.assertEqual(self.config.get("simple_key"), "env_value")
 
+    def test_append_dict_keeps_env_value(self):
+        os.environ["MYVAR_T"] = "env"
+        try:
+            config = Configuration(CONFIG_PATH, dict_to_merge={"myvar_t": "dict"}, is_override_config=False)
+            self.assertEqual(config.get("myvar_t"), "env")
+            config = Configuration(CONFIG_PATH, dict_to_merge={"myvar_t": "dict"}, is_override_config=True)
+            self.assertEqual(config.get("myvar_t"), "dict")
+        finally:
+            del os.environ["MYVAR_T"]
+
+    def test_merge_dict_env_conflict(self):
+        os.environ["MYVAR_T"] = "env"
+        try:
+            config = Configuration(CONFIG_PATH)
+            with self.assertRaises(ConfigError):
+                config.merge_dict({"myvar_t": "dict"})
+            with self.assertRaises(ConfigError):
+                config.merge_dict({"myvar_t": {"key": "dict"}})
+            config.merge_dict({"myvar_t": "dict"}, strategy="override")
+            self.assertEqual(config.get("myvar_t"), "env")  # environment has the priority
+        finally:
+            del os.environ["MYVAR_T"]
+
     # todo: add more test cases here
     def test_merge_dict_single_on_init(self):
         dict_to_merge = {"a": "b", "c": "d", "aa.bb": "eee"}
@@ -152,10 +201,10 @@ class ConfigurationTest(unittest.TestCase):
     def test_init_with_path(self, mock_load):
         # case 1 - merge with environment
         Configuration("some_path1", is_merge_env=True)
-        mock_load.assert_called_with("some_path1", True)
+        mock_load.assert_called_with("some_path1", True, cache_file=None)
         # case 2 - don't merge with environment
         Configuration("some_path2", is_merge_env=False)
-        mock_load.assert_called_with("some_path2", False)
+        mock_load.assert_called_with("some_path2", False, cache_file=None)
 
     def test_init_with_dict_override(self):
         config = Configuration(dict_to_merge={"key": "value"}, is_override_config=True)
@@ -178,13 +227,52 @@ class ConfigurationTest(unittest.TestCase):
         # assertions
         self.assertEqual(config.get("key"), "initial_value")
 
-    # todo: possible wrong behaviour: can't get multi-level key (a.b.c) after merge_dict()
-    def test_merge_dict_multi_level_key_issue(self):
-        new_dict = {"name.subname3": "subvalue3"}
+    def test_merge_dict_multi_level_key(self):
+        new_dict = {"name.subname3": "subvalue3", "other.a.b": {"c.d": "e"}}
 
         self.config.set("name", {"subname1": "subvalue1", "subname2": "subvalue2"})
         self.config.merge_dict(new_dict)
 
-        # line that generates issue
+        # multi-level keys are expanded to the nested dictionaries
+        self.assertEqual(self.config.get("name.subname3"), "subvalue3")
+        self.assertEqual(self.config.get("name.subname1"), "subvalue1")
+        self.assertEqual(self.config.get("other.a.b.c.d"), "e")
+        self.assertEqual(self.config.config_dict["other"], {"a": {"b": {"c": {"d": "e"}}}})
+
+    def test_index_replace_subtree(self):
+        self.config.set("a.b", {"c": "d", "e": {"f": "g"}})
+        self.assertEqual(self.config.get("a.b.e.f"), "g")
+        self.config.set("a.b", "plain")
+        self.assertEqual(self.config.get("a.b"), "plain")
+        self.assertFalse(self.config.contains_key("a.b.c"))
+        self.assertFalse(self.config.contains_key("a.b.e.f"))
         with self.assertRaises(ConfigError):
-            print(self.config.get("name.subname3"))
+            self.config.get("a.b.e")
+
+    def test_index_merge_dict(self):
+        self.config.merge_dict({"x": {"y": {"z": "100"}}})
+        self.config.merge_dict({"x": {"y": {"w": "200"}, "v": {"u": "300"}}})
+        self.assertEqual(self.config.get("x.y.z"), "100")
+        self.assertEqual(self.config.get("x.y.w"), "200")
+        self.assertEqual(self.config.get("x.v.u"), "300")
+        self.assertEqual(self.config.get("x.y"), {"z": "100", "w": "200"})
+        self.assertTrue(self.config.contains_key("x.v"))
+
+    def test_index_merge_env(self):
+        os.environ["PYUTILITIES_INDEX_KEY"] = "env_value"
+        self.config.set("pyutilities_index_key", {"nested": "value"})
+        self.config.merge_env()
+        self.assertEqual(self.config.get("pyutilities_index_key"), "env_value")
+        self.assertFalse(self.config.contains_key("pyutilities_index_key.nested"))
+
+    def test_index_config_dict_assignment(self):
+        self.config.config_dict = {"k1": {"k2": "v2"}}
+        self.assertEqual(self.config.get("k1.k2"), "v2")
+        self.assertFalse(self.config.contains_key("section1"))
+
+    def test_contains_key(self):
+        self.config.set("a.b.c", "d")
+        self.assertTrue(self.config.contains_key("a"))
+        self.assertTrue(self.config.contains_key("a.b.c"))
+        self.assertFalse(self.config.contains_key("a.b.c.d"))
+        self.assertFalse(self.config.contains_key("x.y"))
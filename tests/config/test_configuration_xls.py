@@ -5,11 +5,15 @@
     Unit tests for ConfigurationXls class.
 
     Created:  Gusev Dmitrii, XX.12.2018
-    Modified: Gusev Dmitrii, 27.11.2022
+    Modified: Dmitrii Gusev, 18.10.2026
 """
 
+import os
+import tempfile
 import unittest
 
+import openpyxl
+
 from pyutilities.config.configuration import ConfigError, ConfigurationXls
 
 XLSX_CONFIG_FILE = "tests/config/test_configs/xlsx_config.xlsx"  # xlsx format (Excel 2010)
@@ -48,6 +52,20 @@ class ConfigurationTest(unittest.TestCase):
         with self.assertRaises(ConfigError):
             ConfigurationXls(XLS_CONFIG_FILE, CONFIG_SHEET, dict_to_merge="sss")
 
+    def test_xls_keeps_env_value(self):
+        os.environ["NAME1XLS"] = "env"
+        try:
+            config = ConfigurationXls(
+                XLS_CONFIG_FILE,
+                CONFIG_SHEET,
+                path_to_yaml="tests/config/test_configs",
+                is_override_config=False,
+            )
+            self.assertEqual(config.get("name1xls"), "env")
+            self.assertEqual(config.get("name2xls"), "value2")
+        finally:
+            del os.environ["NAME1XLS"]
+
     def test_simple_xls_init(self):
         self.assertEqual(self.config_xls.get("name2xls"), "value2")
         self.assertEqual(self.config_xls.get("name1xls"), "value1")
@@ -115,3 +133,17 @@ class ConfigurationTest(unittest.TestCase):
         self.assertEqual(config_xls.get("c"), "d")
         self.assertEqual(config_xls.get("aa"), "bb")
         self.assertEqual(config_xls.get("cc"), "dd")
+
+    def test_xlsx_stops_at_first_empty_row(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "other_sheet"
+        sheet.append(["other", "value"])
+        sheet = workbook.create_sheet(CONFIG_SHEET)
+        for row in (["name1", "value1"], ["name2", None], ["name3", 3], [None, None], ["after", "empty"]):
+            sheet.append(row)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.xlsx")
+            workbook.save(path)
+            dictionary = self.config_xlsx.load_dict_from_xls(path, CONFIG_SHEET)
+        self.assertEqual(dictionary, {"name1": "value1", "name2": None, "name3": 3})
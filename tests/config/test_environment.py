@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for environment overlay (EnvironmentOverlay class + Configuration.merge_env()).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.configuration import ConfigError, Configuration
+from pyutilities.config.environment import MISSING, EnvironmentOverlay
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setenv("APP__DB__HOST", "env-host")
+    monkeypatch.setenv("APP__DB__PORT", "5432")
+    monkeypatch.setenv("APP__NAME", "env-name")
+    monkeypatch.setenv("PYU_SIMPLE_KEY", "simple")
+
+
+@pytest.mark.parametrize(
+    "prefix, separator, name, expected",
+    [
+        ("", None, "PATH", "path"),
+        ("APP__", "__", "APP__DB__HOST", "db.host"),
+        ("app__", "__", "APP__DB__HOST", "db.host"),
+        ("APP__", "__", "OTHER__DB__HOST", None),
+        ("APP__", "__", "APP__DB____HOST", None),
+        ("APP_", None, "APP_DB__HOST", "db__host"),
+    ],
+)
+def test_env_key(prefix, separator, name, expected):
+    assert EnvironmentOverlay(prefix, separator).env_key(name) == expected
+
+
+def test_overlay_lazy_and_memoized(env, monkeypatch):
+    overlay = EnvironmentOverlay("APP__", "__")
+    assert overlay.overlay("db.host", "file-host") == "env-host"
+
+    monkeypatch.setenv("APP__DB__HOST", "changed")
+    assert overlay.overlay("db.host", "file-host") == "env-host"  # memoized
+    overlay = overlay.refreshed()
+    assert overlay.overlay("db.host", "file-host") == "changed"
+    assert overlay.overlay("db.user", MISSING) is MISSING
+
+
+def test_configuration_env_default_mapping(env):
+    config = Configuration(dict_to_merge={"pyu_simple_key": "file"}, is_merge_env=False)
+    config.merge_env()
+    assert config.get("pyu_simple_key") == "simple"
+    assert config.config_dict["pyu_simple_key"] == "file"
+    assert "path" not in config.config_dict  # environment isn't copied
+
+
+def test_configuration_env_nested_mapping(env):
+    config = Configuration(is_merge_env=False, env_prefix="APP__", env_separator="__")
+    config.merge_dict({"db": {"host": "file-host", "user": "file-user"}, "name": {"first": "x"}})
+    config.merge_env("APP__", "__")
+
+    assert config.get("db.host") == "env-host"
+    assert config.get("db.port") == "5432"
+    assert config.get("db.user") == "file-user"
+    assert config.get("db") == {"host": "env-host", "user": "file-user", "port": "5432"}
+    assert config.config_dict["db"] == {"host": "file-host", "user": "file-user"}
+    assert config.get("name") == "env-name"
+    assert not config.contains_key("name.first")  # hidden by the environment value
+    with pytest.raises(ConfigError):
+        config.get("name.first")
+
+
+def test_configuration_set_overrides_env(env):
+    config = Configuration(is_merge_env=False)
+    config.merge_env("APP__", "__")
+    assert config.get("db.host") == "env-host"
+
+    config.set("db.host", "explicit")
+    assert config.get("db.host") == "explicit"
+    assert config.get("db.port") == "5432"
+
+    config.set("db", {"user": "explicit"})
+    assert config.get("db") == {"user": "explicit"}
+    assert not config.contains_key("db.port")
+
+
+def test_configuration_env_dict_to_merge_wins(env, tmp_path):
+    (tmp_path / "config.yml").write_text("pyu_simple_key: file\nother: value\n")
+    config = Configuration(str(tmp_path), dict_to_merge={"other": "dict"})
+    assert config.get("pyu_simple_key") == "simple"  # environment overrides YAML
+    assert config.get("other") == "dict"  # dictionary for merge overrides everything
+
+
+def test_resolve_and_set_with_env(env):
+    config = Configuration(dict_to_merge={"env": "dev"}, is_merge_env=False)
+    config.merge_env()
+    config.resolve_and_set("full", "$pyu_simple_key-$env")
+    assert config.get("full") == "simple-dev"
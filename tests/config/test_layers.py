@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for layered configuration (LayeredConfiguration).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.errors import ConfigError
+from pyutilities.config.layers import RUNTIME_LAYER, DictLayer, LayeredConfiguration
+
+
+@pytest.fixture
+def layered():
+    config = LayeredConfiguration()
+    config.add_dict(
+        "defaults", {"db": {"host": "localhost", "port": 5432, "opts": {"ssl": False}}, "name": "app"}
+    )
+    config.add_dict("site", {"db": {"host": "db1", "opts": {"ssl": True}}})
+    return config
+
+
+def test_layers_precedence(layered):
+    assert layered.layers == ["defaults", "site"]
+    assert layered.get("db.host") == "db1"
+    assert layered.get("db.port") == 5432
+    assert layered.get("name") == "app"
+    assert layered.get("db") == {"host": "db1", "port": 5432, "opts": {"ssl": True}}
+    assert layered.to_dict() == {"db": {"host": "db1", "port": 5432, "opts": {"ssl": True}}, "name": "app"}
+
+
+def test_layers_missing_key(layered):
+    assert layered.get("db.user", "default") == "default"
+    assert not layered.contains_key("db.user")
+    with pytest.raises(ConfigError):
+        layered.get("db.user")
+
+
+def test_layers_hidden_by_parent_value(layered):
+    layered.add_dict("flat", {"db": "sqlite://memory"})
+    assert layered.get("db") == "sqlite://memory"
+    assert not layered.contains_key("db.host")
+    layered.add_dict("top", {"db": {"user": "admin"}})
+    assert layered.get("db") == {"user": "admin"}  # lower layers are hidden by the "flat" layer
+
+
+def test_layers_changes_invalidate_cache(layered):
+    assert layered.get("db.host") == "db1"
+    layered.add_dict("local", {"db": {"host": "db2"}})
+    assert layered.get("db.host") == "db2"
+    layered.replace_layer(DictLayer("local", {"db": {"host": "db3"}}))
+    assert layered.get("db.host") == "db3"
+    layered.remove_layer("local")
+    assert layered.get("db.host") == "db1"
+    layered.remove_layer("site")
+    assert layered.get("db.host") == "localhost"
+
+
+def test_layers_not_copied(layered):
+    values = {"db": {"host": "db2"}}
+    layered.add_dict("local", values)
+    assert layered.get("db.host") == "db2"
+    values["db"]["host"] = "db3"
+    layered.invalidate()
+    assert layered.get("db.host") == "db3"
+
+
+def test_layers_set(layered):
+    layered.set("db.host", "runtime")
+    assert layered.get("db.host") == "runtime"
+    layered.add_dict("late", {"db": {"host": "late", "user": "u"}})
+    assert layered.layers == ["defaults", "site", "late", RUNTIME_LAYER]
+    assert layered.get("db") == {"host": "runtime", "port": 5432, "opts": {"ssl": True}, "user": "u"}
+
+
+def test_layers_errors(layered):
+    with pytest.raises(ConfigError):
+        layered.add_dict("site", {})
+    with pytest.raises(ConfigError):
+        layered.add_dict("invalid", ["a"])
+    with pytest.raises(ConfigError):
+        layered.remove_layer("unknown")
+    with pytest.raises(ConfigError):
+        layered.replace_layer(DictLayer("unknown", {}))
+
+
+def test_layers_env(layered, monkeypatch):
+    monkeypatch.setenv("LAYERS__DB__HOST", "env-host")
+    monkeypatch.setenv("LAYERS__MODE", "test")
+    layered.add_env("LAYERS__", "__")
+    assert layered.get("db.host") == "env-host"
+    assert layered.get("db.port") == 5432
+    assert layered.get("db")["host"] == "env-host"
+    assert layered.get("mode") == "test"
+    assert layered.to_dict()["mode"] == "test"
+    layered.set("mode", "runtime")
+    assert layered.get("mode") == "runtime"
+
+
+def test_layers_yaml(layered, tmp_path):
+    (tmp_path / "config.yml").write_text("db:\n  port: 6432\n")
+    layered.add_yaml(str(tmp_path), name="yaml")
+    assert layered.get("db.port") == 6432
+    assert layered.get("db.host") == "db1"
+
+
+def test_layers_read_only_values(layered):
+    for key in ("db.opts", "db"):  # value of the single layer and merged (cached) value
+        with pytest.raises(TypeError):
+            layered.get(key)["ssl"] = False
+    assert layered.get("db.opts.ssl") is True
+    result = layered.to_dict()
+    result["db"]["host"] = "changed"
+    assert layered.get("db.host") == "db1"
+
+
+def test_layers_xls(layered):
+    layered.add_xls("tests/config/test_configs/xlsx_config.xlsx", "config_sheet", name="xlsx")
+    assert layered.layers == ["defaults", "site", "xlsx"]
+    assert layered.get("name2xlsx") == "value2"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for Configuration.merge_dict() merge engine and conflict strategies.
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.configuration import ConfigError, Configuration
+from pyutilities.config.merge import MERGE_APPEND, MERGE_ERROR, MERGE_OVERRIDE
+
+
+@pytest.fixture
+def config():
+    return Configuration(
+        dict_to_merge={"a": {"b": 1, "list": [1, 2], "c": {"d": "e"}}, "x": "y"}, is_merge_env=False
+    )
+
+
+def test_merge_error_strategy(config):
+    with pytest.raises(ConfigError, match="to key a.b!"):
+        config.merge_dict({"a": {"b": 2}})
+    with pytest.raises(ConfigError, match="to key a.c!"):
+        config.merge_dict({"a": {"c": "plain"}}, MERGE_ERROR)
+    assert config.get("a.b") == 1
+
+
+def test_merge_override_strategy(config):
+    config.merge_dict({"a": {"b": 2, "c": "plain", "new": 3}, "x": {"z": 1}}, MERGE_OVERRIDE)
+    assert config.get("a.b") == 2
+    assert config.get("a.c") == "plain"
+    assert not config.contains_key("a.c.d")  # replaced subtree is removed from the index
+    assert config.get("x.z") == 1
+    assert config.get("a.new") == 3
+
+
+def test_merge_append_strategy(config):
+    config.merge_dict({"a": {"list": [3]}}, MERGE_APPEND)
+    assert config.get("a.list") == [1, 2, 3]
+    with pytest.raises(ConfigError):
+        config.merge_dict({"a": {"b": 2}}, MERGE_APPEND)
+
+
+def test_merge_callable_strategy(config):
+    conflicts = []
+
+    def strategy(key, old, new):
+        conflicts.append(key)
+        return old + new
+
+    config.merge_dict({"a": {"b": 10, "c": {"d": "f"}}}, strategy)
+    assert config.get("a.b") == 11
+    assert config.get("a.c.d") == "ef"
+    assert sorted(conflicts) == ["a.b", "a.c.d"]
+
+
+def test_merge_unknown_strategy(config):
+    with pytest.raises(ConfigError, match="Unknown merge strategy"):
+        config.merge_dict({"new": 1}, "unknown")
+    assert not config.contains_key("new")
+
+
+def test_merge_not_dict(config):
+    with pytest.raises(ConfigError, match=r"Can't merge \[list\]"):
+        config.merge_dict(["a"])
+
+
+def test_merge_dotted_keys(config):
+    config.merge_dict({"a.c.f": "g", "n.m": {"k.l": 1}, "a": {"c.h": 2}})
+    assert config.get("a.c") == {"d": "e", "f": "g", "h": 2}
+    assert config.get("n.m.k.l") == 1
+    with pytest.raises(ConfigError, match="to key a.b!"):  # a.b is a leaf value
+        config.merge_dict({"a.b.z": 1})
+
+
+def test_merge_source_dictionaries(config):
+    source = {"s": {"t": {"u": 1}}, "d": {"t": {"u.v": 1}}}
+    config.merge_dict(source)
+    assert config.get("s.t") is source["s"]["t"]  # referenced (as before the merge engine)
+    assert config.get("s.t.u") == 1
+    assert config.get("d.t") == {"u": {"v": 1}}  # copied - dotted keys are expanded
+    assert config.get("d.t.u.v") == 1
+    assert source["d"] == {"t": {"u.v": 1}}
+
+
+def test_merge_deep_dictionary():
+    depth = 5_000  # deeper than the default recursion limit
+    deep = value = {}
+    for _ in range(depth):
+        value["n"] = {}
+        value = value["n"]
+    value["leaf"] = "value"
+
+    config = Configuration(is_merge_env=False)
+    config.merge_dict(deep)
+    assert config.get(".".join(["n"] * depth + ["leaf"])) == "value"
+
+
+def test_merge_with_snapshot(config):
+    snapshot = config.freeze()
+    config.merge_dict({"a.c.new": 1, "a": {"c": {"other": 2}}})
+    assert config.get("a.c") == {"d": "e", "new": 1, "other": 2}
+    assert not snapshot.contains_key("a.c.new")
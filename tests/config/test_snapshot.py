@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for immutable configuration snapshots (ConfigSnapshot + Configuration.freeze()).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.configuration import ConfigError, Configuration
+from pyutilities.config.snapshot import ReadOnlyDict, thaw_value
+
+
+@pytest.fixture
+def config():
+    return Configuration(
+        dict_to_merge={
+            "db": {"host": "h1", "opts": {"ssl": True}},
+            "other": {"x": 1},
+            "items": [1, {"a": 2}],
+        },
+        is_merge_env=False,
+    )
+
+
+def test_snapshot_get(config):
+    snapshot = config.freeze()
+    assert snapshot.get("db.host") == "h1"
+    assert snapshot.get("db.opts.ssl") is True
+    assert snapshot.get("missing", "default") == "default"
+    assert snapshot.contains_key("db.opts")
+    assert not snapshot.contains_key("db.host.x")
+    with pytest.raises(ConfigError):
+        snapshot.get("db.port")
+
+
+def test_snapshot_is_read_only(config):
+    snapshot = config.freeze()
+    db = snapshot.get("db")
+    assert isinstance(db, ReadOnlyDict)
+    with pytest.raises(TypeError):
+        db["host"] = "changed"  # type: ignore[index]
+    assert snapshot.get("items") == (1, {"a": 2})
+    assert thaw_value(db) == {"host": "h1", "opts": {"ssl": True}}
+
+
+def test_snapshot_unchanged_after_updates(config):
+    snapshot = config.freeze()
+    config.set("db.host", "h2")
+    config.set("db.opts.timeout", 10)
+    config.merge_dict({"other": {"y": 2}, "new": 1})
+    config.append_dict({"added": "value"}, True)
+
+    assert snapshot.get("db.host") == "h1"
+    assert not snapshot.contains_key("db.opts.timeout")
+    assert snapshot.to_dict()["other"] == {"x": 1}
+    assert not snapshot.contains_key("new")
+    assert not snapshot.contains_key("added")
+
+    latest = config.freeze()
+    assert latest is not snapshot and latest.version > snapshot.version
+    assert latest.get("db.host") == "h2"
+    assert latest.get("db.opts.timeout") == 10
+    assert latest.get("other") == {"x": 1, "y": 2}
+    assert config.get("db.host") == "h2"
+    assert config.get("db.opts.timeout") == 10
+
+
+def test_snapshot_structural_sharing(config):
+    snapshot = config.freeze()
+    other = config.config_dict["other"]
+    config.set("db.host", "h2")
+    assert config.config_dict["other"] is other  # untouched branch is shared
+    assert config.freeze().get("other")._data is snapshot.get("other")._data  # pylint: disable=W0212
+
+
+def test_user_dict_not_modified_after_freeze():
+    source = {"a": {"b": 1}}
+    config = Configuration(is_merge_env=False)
+    config.config_dict = source
+    config.freeze()
+    config.set("a.b", 2)
+    assert source == {"a": {"b": 1}}
+    assert config.get("a.b") == 2
+
+
+def test_snapshot_not_changed_by_caller_dicts():
+    merged, stored = {"a": {"b": 1}}, {"d": [1]}
+    config = Configuration(dict_to_merge=merged, is_merge_env=False)
+    snapshot = config.freeze()
+    merged["a"]["b"] = 2
+    assert snapshot.get("a.b") == 1
+    assert config.get("a.b") == 1
+
+    later = {"x": {"y": 1}}
+    config.merge_dict({"n": later})
+    config.set("c", stored)
+    snapshot = config.freeze()
+    later["y"] = 2
+    stored["d"].append(2)
+    assert snapshot.get("n.x.y") == 1
+    assert snapshot.get("c.d") == (1,)
+    assert config.get("n.x.y") == 1
+
+
+def test_freeze_without_updates_returns_same_snapshot(config):
+    assert config.freeze() is config.freeze()
+
+
+def test_failed_merge_keeps_snapshot(config):
+    snapshot = config.freeze()
+    with pytest.raises(ConfigError):
+        config.merge_dict({"db": {"host": {"nested": 1}}})
+    assert snapshot.get("db.host") == "h1"
+
+
+def test_snapshot_with_env(monkeypatch):
+    monkeypatch.setenv("APP__DB__HOST", "env-host")
+    config = Configuration(dict_to_merge={"db": {"host": "file"}}, is_merge_env=False)
+    config.merge_env("APP__", "__")
+    snapshot = config.freeze()
+    assert snapshot.get("db.host") == "env-host"
+
+    config.set("db.host", "explicit")
+    assert snapshot.get("db.host") == "env-host"
+    assert config.freeze().get("db.host") == "explicit"
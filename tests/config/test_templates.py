@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for lazy resolution of ${...} references (TemplateResolver + Configuration templates mode).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.configuration import ConfigError, Configuration
+from pyutilities.config.environment import MISSING
+from pyutilities.config.templates import TemplateResolver, substitute
+
+
+@pytest.fixture
+def config():
+    return Configuration(
+        dict_to_merge={
+            "db": {"host": "localhost", "port": 5432, "url": "pg://${db.host}:${db.port}/${name}"},
+            "name": "app",
+            "copy": "${db}",
+            "price": "$$10",
+            "items": ["${name}", "${db.port}"],
+        },
+        is_merge_env=False,
+        resolve_templates=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("no refs", "no refs"),
+        ("${a}", 1),
+        (" ${a.b} ", {"c": 2}),
+        ("x-${a}-${a.b.c}", "x-1-2"),
+        ("$$${a}", "$1"),
+        ("$a ${}", "$a ${}"),
+        ({"k": ["${a}", 3]}, {"k": [1, 3]}),
+    ],
+)
+def test_substitute(value, expected):
+    values = {"a": 1, "a.b": {"c": 2}, "a.b.c": 2}
+    assert substitute(value, values.__getitem__) == expected
+
+
+def test_substitute_doesnt_copy_values_without_refs():
+    value = {"a": [1, "x"], "b": {"c": "d"}}
+    assert substitute(value, lambda key: pytest.fail("unexpected reference")) is value
+
+
+def test_lazy_resolution(config):
+    assert config.get("db.url") == "pg://localhost:5432/app"
+    assert config.get("copy") == {"host": "localhost", "port": 5432, "url": "pg://localhost:5432/app"}
+    assert config.get("price") == "$10"
+    assert config.get("items") == ["app", 5432]
+    assert config.config_dict["db"]["url"] == "pg://${db.host}:${db.port}/${name}"  # raw value isn't changed
+
+
+def test_resolution_is_memoized_and_lazy():
+    raw = {"a": "${b}-${c}", "b": "x", "c": "${b}"}
+    calls = []
+
+    def lookup(key):
+        calls.append(key)
+        return raw.get(key, MISSING)
+
+    resolver = TemplateResolver(lookup)
+    assert resolver.get("c") == "x"
+    assert calls == ["c", "b"]
+    assert resolver.get("a") == "x-x"
+    assert resolver.get("a") == "x-x"
+    assert calls == ["c", "b", "a"]
+
+
+def test_invalidation_on_dependency_change(config):
+    assert config.get("db.url") == "pg://localhost:5432/app"
+    assert config.get("items") == ["app", 5432]
+
+    config.set("db.host", "remote")
+    assert config.get("db.url") == "pg://remote:5432/app"
+    assert config.get("copy")["host"] == "remote"
+
+    config.merge_dict({"db": {"user": "admin"}})
+    assert config.get("copy")["user"] == "admin"
+
+    config.append_dict({"name": "other"}, True)
+    assert config.get("db.url") == "pg://remote:5432/other"
+    assert config.get("items") == ["other", 5432]
+
+
+def test_invalidation_is_selective():
+    raw = {"a": "${b}", "b": "1", "c": "${d.e}", "d": {"e": "2"}, "d.e": "2"}
+    resolver = TemplateResolver(lambda key: raw.get(key, MISSING))
+    assert (resolver.get("a"), resolver.get("c")) == ("1", "2")
+
+    raw["b"] = "changed"
+    resolver.invalidate(["b"])
+    raw["d"], raw["d.e"] = {"e": "3"}, "3"
+    assert (resolver.get("a"), resolver.get("c")) == ("changed", "2")  # c isn't invalidated
+    resolver.invalidate(["d"])  # parent of the dependency
+    assert resolver.get("c") == "3"
+
+
+@pytest.mark.parametrize(
+    "values, key",
+    [
+        ({"a": "${a}"}, "a"),
+        ({"a": "x${b}", "b": "${c}", "c": "${a}"}, "b"),
+        ({"a": {"b": "${a}"}}, "a"),
+    ],
+)
+def test_cycle_detection(values, key):
+    config = Configuration(dict_to_merge=values, is_merge_env=False, resolve_templates=True)
+    with pytest.raises(ConfigError, match="Cyclic reference"):
+        config.get(key)
+
+
+def test_missing_reference():
+    config = Configuration(dict_to_merge={"a": "${b.c}"}, is_merge_env=False, resolve_templates=True)
+    with pytest.raises(ConfigError, match=r"\[b.c\], referenced by \[a\]"):
+        config.get("a")
+    config.set("b.c", 1)
+    assert config.get("a") == 1
+
+
+def test_templates_with_env_and_snapshot(monkeypatch):
+    monkeypatch.setenv("APP__HOST", "env-host")
+    config = Configuration(
+        dict_to_merge={"url": "http://${host}/"}, is_merge_env=False, resolve_templates=True
+    )
+    config.merge_env("APP__", "__")
+    assert config.get("url") == "http://env-host/"
+    snapshot = config.freeze()
+    assert snapshot.get("url") == "http://env-host/"
+
+    config.set("host", "explicit")
+    assert config.get("url") == "http://explicit/"
+    assert snapshot.get("url") == "http://env-host/"
+
+
+def test_templates_disabled_by_default():
+    config = Configuration(dict_to_merge={"a": "${b}", "b": "x"}, is_merge_env=False)
+    assert config.get("a") == "${b}"
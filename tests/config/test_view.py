@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Unit tests for bulk/prefix-scoped lookups (Configuration.get_many() + ConfigView).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+
+from pyutilities.config.configuration import ConfigError, Configuration
+from pyutilities.config.view import to_bool, to_list
+
+
+@pytest.fixture
+def config():
+    return Configuration(
+        dict_to_merge={
+            "db": {
+                "primary": {"host": "h1", "port": "5432", "ssl": "yes", "timeout": 1.5, "opts": {"a": 1}},
+                "replicas": "r1, r2",
+            },
+            "name": "app",
+        },
+        is_merge_env=False,
+    )
+
+
+def test_get_many(config):
+    assert config.get_many(["name", "db.primary.host"]) == {"name": "app", "db.primary.host": "h1"}
+    assert config.get_many(["name", "missing"], "default") == {"name": "app", "missing": "default"}
+    with pytest.raises(ConfigError):
+        config.get_many(["name", "missing"])
+
+
+def test_view_lookups(config):
+    view = config.view("db.primary")
+    assert view.prefix == "db.primary"
+    assert view.get("host") == "h1"
+    assert view.get("opts.a") == 1
+    assert view.get("missing", "default") == "default"
+    assert "host" in view and not view.contains_key("opts.b")
+    assert view.get_many(["host", "port"]) == {"host": "h1", "port": "5432"}
+    assert view.view("opts").get("a") == 1
+    with pytest.raises(ConfigError, match=r"\[db.primary.missing\]"):
+        view.get("missing")
+
+
+def test_view_typed_accessors(config):
+    view = config.view("db.primary")
+    assert view.get_int("port") == 5432
+    assert view.get_bool("ssl") is True
+    assert view.get_float("timeout") == 1.5
+    assert view.get_str("timeout") == "1.5"
+    assert config.view("db").get_list("replicas") == ["r1", "r2"]
+    assert view.get_int("missing", 10) == 10
+    with pytest.raises(ConfigError, match="Invalid value"):
+        view.get_int("host")
+
+
+def test_view_typed_values_memoized(config):
+    view = config.view("db.primary")
+    calls = []
+
+    def converter(value):
+        calls.append(value)
+        return value.upper()
+
+    assert view.get_typed("host", converter) == "H1"
+    assert view.get_typed("host", converter) == "H1"
+    assert calls == ["h1"]
+
+    config.set("db.primary.host", "h2")  # configuration change drops memoized values
+    assert view.get_typed("host", converter) == "H2"
+    assert view.get("host") == "h2"
+    assert calls == ["h1", "h2"]
+
+
+def test_view_invalid_prefix(config):
+    with pytest.raises(ConfigError, match="not found"):
+        config.view("db.secondary")
+    with pytest.raises(ConfigError, match="isn't a dictionary"):
+        config.view("name")
+
+
+def test_view_with_env(monkeypatch, config):
+    monkeypatch.setenv("APP__DB__PRIMARY__HOST", "env-host")
+    config.merge_env("APP__", "__")
+    assert config.view("db.primary").get("host") == "env-host"
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(True, True), (0, False), ("Yes", True), (" off ", False), ("1", True)]
+)
+def test_to_bool(value, expected):
+    assert to_bool(value) is expected
+
+
+def test_to_bool_invalid():
+    with pytest.raises(ValueError):
+        to_bool("maybe")
+
+
+@pytest.mark.parametrize("value, expected", [("a, b,", ["a", "b"]), ((1, 2), [1, 2]), (5, [5])])
+def test_to_list(value, expected):
+    assert to_list(value) == expected
@@ -5,16 +5,25 @@
     Unit tests for io_utilities module.
 
     Created:  Dmitrii Gusev, 12.10.2022
-    Modified: Dmitrii Gusev, 18.07.2025
+    Modified: Dmitrii Gusev, 18.10.2026
 """
 
 import pytest
 from mock import mock_open, patch
 
-from pyutilities.io.io_utils import _list_files, list_files, read_yaml
+from pyutilities.exception import PyUtilitiesException
+from pyutilities.io.io_utils import (
+    YAML_LOADER_AUTO,
+    YAML_LOADER_C,
+    YAML_LOADER_PYTHON,
+    _list_files,
+    list_files,
+    read_yaml,
+)
 
 MOCK_OPEN_METHOD = "pyutilities.io.io_utils.open"
 MOCK_WALK_METHOD = "pyutilities.io.io_utils.walk"
+MOCK_C_LOADER_AVAILABLE = "pyutilities.io.io_utils.YAML_C_LOADER_AVAILABLE"
 
 
 def test_parse_yaml_ioerror():
@@ -42,12 +51,40 @@ def test_file2str():
     pass
 
 
-def test_read_yaml():
-    # def test_parse_yaml():
-    # with patch(MOCK_OPEN_METHOD, mock_open(read_data="name123: value123"), create=True):
-    #     result = read_yaml("foo_ok.file")
-    #     assert result["name123"] == "value123"
-    pass
+@pytest.mark.parametrize("loader", [YAML_LOADER_AUTO, YAML_LOADER_C, YAML_LOADER_PYTHON])
+def test_read_yaml(tmp_path, loader):
+    yaml_file = tmp_path / "config.yml"
+    yaml_file.write_text(
+        "name123: value123\nsection:\n  key: [1, 2]\n" + "\n".join(f"k{i}: v{i}" for i in range(10000))
+    )
+    result = read_yaml(str(yaml_file), loader=loader)
+    assert result["name123"] == "value123"
+    assert result["section"] == {"key": [1, 2]}
+    assert result["k9999"] == "v9999"
+
+
+@pytest.mark.parametrize("loader", [YAML_LOADER_C, YAML_LOADER_PYTHON])
+def test_read_yaml_tab_in_big_file(tmp_path, loader):
+    yaml_file = tmp_path / "config.yml"
+    yaml_file.write_text("\n".join(f"k{i}: v{i}" for i in range(10000)) + "\nkey:\tvalue\n")
+    with pytest.raises(IOError):
+        read_yaml(str(yaml_file), loader=loader)
+
+
+def test_read_yaml_unknown_loader(tmp_path):
+    yaml_file = tmp_path / "config.yml"
+    yaml_file.write_text("name: value")
+    with pytest.raises(PyUtilitiesException):
+        read_yaml(str(yaml_file), loader="unknown")
+
+
+def test_read_yaml_no_c_loader(tmp_path):
+    yaml_file = tmp_path / "config.yml"
+    yaml_file.write_text("name: value")
+    with patch(MOCK_C_LOADER_AVAILABLE, False):
+        assert read_yaml(str(yaml_file)) == {"name": "value"}  # fallback to pure python loader
+        with pytest.raises(PyUtilitiesException):
+            read_yaml(str(yaml_file), loader=YAML_LOADER_C)
 
 
 def test_read_yaml_ioerror():
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+    Shared fixtures for the web tests: local HTTP server (HTTP/1.1, keep-alive connections).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """Request handler: response for the path is taken from the server routes (path -> callable
+    (handler) -> (status, headers, body)), default response - 200 OK with the path as the body."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive connections
+    disable_nagle_algorithm = True  # no delays for the small responses
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests.append((self.command, self.path, dict(self.headers)))
+        route = self.server.routes.get(self.path.split("?")[0])
+        status, headers, body = route(self) if route else (200, {}, self.path.encode("utf-8"))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if "Content-Length" not in headers:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_HEAD = do_GET
+    do_POST = do_GET
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass  # no output to stderr
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP server: [base_url], [routes] and [requests] (method, path, headers) attributes."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler)
+    server.daemon_threads = True
+    server.routes = {}
+    server.requests = []
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
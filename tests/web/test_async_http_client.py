@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for asyncio http client (with the local aiohttp server).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from pyutilities.web.async_http_client import AsyncHttpClient
+from pyutilities.web.rate_limiter import RateLimiter
+
+
+async def run_with_server(scenario):
+    """Runs the scenario (coroutine function: base URL, requests counters -> result) with the local server."""
+    counters = {}
+
+    async def handler(request):
+        name = request.match_info["name"]
+        counters[name] = counters.get(name, 0) + 1
+        if name.startswith("status"):  # /status<code>
+            return web.Response(status=int(name.removeprefix("status")), text="error")
+        if name == "flaky" and counters[name] == 1:
+            return web.Response(status=503, text="unavailable")
+        if name == "slow":
+            await asyncio.sleep(0.2)
+        body = await request.text()
+        return web.Response(text=f"{request.method} {name} {request.query_string} {body}".strip())
+
+    app = web.Application()
+    app.router.add_route("*", "/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+    try:
+        return await scenario(f"http://127.0.0.1:{port}", counters)
+    finally:
+        await runner.cleanup()
+
+
+def test_async_requests():
+    async def scenario(base_url, counters):
+        async with AsyncHttpClient(user_agent="test-agent") as client:
+            assert await (await client.get(f"{base_url}/a", params={"x": "1"})).text() == "GET a x=1"
+            assert await (await client.post(f"{base_url}/b", data={"y": "2"})).text() == "POST b  y=2"
+            assert (await client.put(f"{base_url}/c")).status == 200
+            assert (await client.delete(f"{base_url}/c")).status == 200
+            assert (await client.head(f"{base_url}/c")).status == 200
+            assert (await client.options(f"{base_url}/c")).status == 200
+
+    asyncio.run(run_with_server(scenario))
+
+
+def test_async_retries_and_errors():
+    async def scenario(base_url, counters):
+        async with AsyncHttpClient(retries=1) as client:
+            assert await (await client.get(f"{base_url}/flaky")).text() == "GET flaky"
+            assert counters["flaky"] == 2  # retried for 503
+
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                await client.get(f"{base_url}/status404")
+            assert error.value.status == 404
+            assert counters["status404"] == 1  # not retried
+
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                await client.get(f"{base_url}/status500")
+            assert error.value.status == 500
+            assert counters["status500"] == 2  # retries are exhausted
+
+    asyncio.run(run_with_server(scenario))
+
+
+def test_async_get_many():
+    async def scenario(base_url, counters):
+        urls = [f"{base_url}/slow" for _ in range(10)] + [f"{base_url}/status404"]
+        async with AsyncHttpClient(limit_per_host=10) as client:
+            start = asyncio.get_running_loop().time()
+            results = [result async for result in client.get_many(urls, max_concurrency=10, ordered=True)]
+            elapsed = asyncio.get_running_loop().time() - start
+        assert [result.url for result in results] == urls
+        assert [await result.response.text() for result in results[:10]] == ["GET slow"] * 10
+        assert results[10].response is None and results[10].error.status == 404
+        assert elapsed < 1.0  # requests were concurrent (10 * 0.2 sec sequentially)
+
+    asyncio.run(run_with_server(scenario))
+
+
+def test_async_request_many_stopped():
+    async def scenario(base_url, counters):
+        async with AsyncHttpClient() as client:
+            urls = [f"{base_url}/a"] + [f"{base_url}/slow"] * 4
+            results = client.get_many(urls, max_concurrency=5, ordered=True)
+            assert (await anext(results)).url == f"{base_url}/a"
+            await results.aclose()
+            requests = [task for task in asyncio.all_tasks() if "__request" in task.get_coro().__qualname__]
+            assert not requests  # cancelled requests are awaited
+
+    asyncio.run(run_with_server(scenario))
+
+
+def test_async_rate_limiter():
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def scenario(base_url, counters):
+        async with AsyncHttpClient(rate_limiter=limiter) as client:
+            results = [result async for result in client.get_many([f"{base_url}/a"] * 6, max_concurrency=6)]
+        assert all(result.error is None for result in results)
+
+    asyncio.run(run_with_server(scenario))
+    assert list(limiter.stats().values())[0]["waits"] == 5
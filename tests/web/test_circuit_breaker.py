@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for per-host circuit breaker (CircuitBreaker + HttpClient, local HTTP server).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import time
+
+import pytest
+import requests
+
+from pyutilities.web.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    host_key,
+)
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.http_timing import RequestTimer
+
+URL = "http://api.host.com/path"
+
+
+def test_host_key():
+    assert host_key(URL) == "api.host.com:80"
+    assert host_key("https://API.host.com:8443/x?y=1") == "api.host.com:8443"
+    assert host_key("https://api.host.com") == "api.host.com:443"
+
+
+def test_circuit_breaker_states():
+    transitions = []
+    breaker = CircuitBreaker(
+        window=4, min_calls=4, open_timeout=0.1, on_state_change=lambda *args: transitions.append(args)
+    )
+    for success in (True, False, True):
+        breaker.record(URL, success)
+    breaker.allow(URL)
+    breaker.record(URL, False)  # 2 failures of 4 calls
+    assert breaker.state(URL) == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.allow(URL)
+    assert error.value.host == "api.host.com:80" and 0 < error.value.retry_in <= 0.1
+    state = breaker.states()["api.host.com:80"]
+    assert (state["state"], state["opened"], state["rejected"]) == (CIRCUIT_OPEN, 1, 1)
+
+    time.sleep(0.12)
+    breaker.allow(URL)  # the trial request
+    assert breaker.state(URL) == CIRCUIT_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(URL)  # trial is in progress
+    breaker.record(URL, False)  # failed trial - open again
+    assert breaker.is_open(URL)
+
+    time.sleep(0.12)
+    breaker.allow(URL)
+    breaker.record(URL, True)
+    assert breaker.state(URL) == CIRCUIT_CLOSED
+    assert transitions == [
+        ("api.host.com:80", CIRCUIT_CLOSED, CIRCUIT_OPEN),
+        ("api.host.com:80", CIRCUIT_OPEN, CIRCUIT_HALF_OPEN),
+        ("api.host.com:80", CIRCUIT_HALF_OPEN, CIRCUIT_OPEN),
+        ("api.host.com:80", CIRCUIT_OPEN, CIRCUIT_HALF_OPEN),
+        ("api.host.com:80", CIRCUIT_HALF_OPEN, CIRCUIT_CLOSED),
+    ]
+    breaker.allow("http://other.host.com/")  # circuits are per host
+
+
+def test_circuit_breaker_latency_threshold():
+    breaker = CircuitBreaker(latency_threshold=0.5, slow_rate=0.5, window=10, min_calls=2)
+    breaker.record(URL, True, 0.1)
+    breaker.record(URL, True, 0.6)
+    assert breaker.state(URL) == CIRCUIT_OPEN
+    assert breaker.states()["api.host.com:80"]["retry_in"] > 0
+    breaker.reset()
+    assert breaker.state(URL) == CIRCUIT_CLOSED and not breaker.states()
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(window=5, min_calls=10)
+
+
+def test_http_client_stops_retries_when_open(http_server):
+    http_server.routes["/down"] = lambda handler: (503, {}, b"down")
+    breaker = CircuitBreaker(window=2, min_calls=2, open_timeout=60)
+    client = HttpClient(user_agent="test", retries=4, circuit_breaker=breaker, timer=RequestTimer())
+    assert client.circuit_breaker is breaker
+    start = time.monotonic()
+    with pytest.raises(requests.ConnectionError, match="CircuitOpenError"):
+        client.get(f"{http_server.base_url}/down")
+    assert len(http_server.requests) == 2  # retries stopped without backoff sleeps (2, 4, 8 sec)
+    with pytest.raises(CircuitOpenError):
+        client.get(f"{http_server.base_url}/other")  # fast fail - without the request
+    assert len(http_server.requests) == 2
+    assert time.monotonic() - start < 1
+    assert breaker.states()[http_server.base_url.removeprefix("http://")]["rejected"] == 1
+
+    results = list(client.get_many([f"{http_server.base_url}/a"] * 3))
+    assert all(isinstance(result.error, CircuitOpenError) for result in results)
+
+
+def test_http_client_status_hook_records_responses(http_server):
+    http_server.routes["/error"] = lambda handler: (501, {}, b"")  # not retried - see status_forcelist
+    breaker = CircuitBreaker(window=4, min_calls=4)
+    client = HttpClient(user_agent="test", retries=0, circuit_breaker=breaker)
+    client.get(f"{http_server.base_url}/ok")
+    client.get(f"{http_server.base_url}/ok")
+    with pytest.raises(requests.HTTPError):
+        client.get(f"{http_server.base_url}/error")
+    state = breaker.states()[http_server.base_url.removeprefix("http://")]
+    assert (state["state"], state["calls"], state["failure_rate"]) == (
+        CIRCUIT_CLOSED,
+        3,
+        pytest.approx(1 / 3),
+    )
+    with pytest.raises(requests.HTTPError):
+        client.get(f"{http_server.base_url}/error")
+    assert breaker.state(http_server.base_url) == CIRCUIT_OPEN
+
+
+def test_http_client_status_hook_records_redirect_hops(http_server):
+    port = http_server.server_address[1]
+    http_server.routes["/moved"] = lambda handler: (302, {"Location": f"http://localhost:{port}/error"}, b"")
+    http_server.routes["/error"] = lambda handler: (501, {}, b"")
+    breaker = CircuitBreaker(window=4, min_calls=4)
+    client = HttpClient(user_agent="test", retries=0, circuit_breaker=breaker)
+    with pytest.raises(requests.HTTPError):
+        client.get(f"{http_server.base_url}/moved")
+    states = breaker.states()
+    assert states[f"127.0.0.1:{port}"]["failure_rate"] == 0.0  # redirect response - success
+    assert states[f"localhost:{port}"]["failure_rate"] == 1.0
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+    Unit tests for HTTP responses cache (HttpCache + HttpClient with cache).
+
+    Created:  Dmitrii Gusev, 18.10.2026
+    Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from pyutilities.web.http_cache import HttpCache, freshness_deadline
+from pyutilities.web.http_client import HttpClient
+
+NOW = 1_000_000.0
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"Cache-Control": "max-age=60"}, NOW + 60),
+        ({"Cache-Control": "public, max-age=60", "Age": "10"}, NOW + 50),
+        ({"Cache-Control": "max-age=0", "ETag": '"v1"'}, 0),
+        ({"Cache-Control": "max-age=0"}, None),
+        ({"Cache-Control": "no-cache", "ETag": '"v1"'}, 0),
+        ({"Cache-Control": "no-store, max-age=60"}, None),
+        ({"Cache-Control": "max-age=60", "Vary": "*"}, None),
+        ({"Expires": "Thu, 01 Jan 2026 00:01:00 GMT", "Date": "Thu, 01 Jan 2026 00:00:00 GMT"}, NOW + 60),
+        ({"Expires": "0", "Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT"}, 0),
+        ({}, None),
+    ],
+)
+def test_freshness_deadline(headers, expected):
+    assert freshness_deadline(CaseInsensitiveDict(headers), NOW) == expected
+
+
+def etag_route(handler):
+    if handler.headers.get("If-None-Match") == '"v1"':
+        return 304, {"ETag": '"v1"', "Cache-Control": "max-age=0"}, b""
+    return 200, {"ETag": '"v1"', "Cache-Control": "max-age=0", "Content-Type": "text/plain"}, b"etag body"
+
+
+def test_client_cache_fresh_and_revalidated(http_server):
+    http_server.routes["/fresh"] = lambda handler: (200, {"Cache-Control": "max-age=60"}, b"fresh body")
+    http_server.routes["/etag"] = etag_route
+    client = HttpClient(cache=HttpCache())
+
+    for _ in range(3):
+        assert client.get(f"{http_server.base_url}/fresh", params={"a": "1"}).text == "fresh body"
+        response = client.get(f"{http_server.base_url}/etag")
+        assert response.status_code == 200
+        assert response.text == "etag body"
+        assert response.headers["Content-Type"] == "text/plain"
+
+    assert [path for _, path, _ in http_server.requests] == ["/fresh?a=1"] + ["/etag"] * 3
+    assert client.cache.stats()["hits"] == 2
+    assert client.cache.stats()["misses"] == 2
+    assert client.cache.stats()["revalidations"] == 2
+
+
+def test_client_cache_not_cached(http_server):
+    http_server.routes["/nostore"] = lambda handler: (200, {"Cache-Control": "no-store"}, b"body")
+    client = HttpClient(cache=HttpCache())
+    for _ in range(2):
+        assert client.get(f"{http_server.base_url}/nostore").text == "body"
+        assert client.get(f"{http_server.base_url}/plain").text == "/plain"
+    assert len(http_server.requests) == 4
+    assert client.cache.stats()["misses"] == 4
+
+
+def test_cache_memory_lru(http_server):
+    client = HttpClient(cache=HttpCache(max_entries=2))
+    http_server.routes.update(
+        {f"/{name}": lambda handler: (200, {"Cache-Control": "max-age=60"}, b"x") for name in "abc"}
+    )
+    for name in "abac":  # c evicts b (a was used recently)
+        client.get(f"{http_server.base_url}/{name}")
+    client.get(f"{http_server.base_url}/a")
+    client.get(f"{http_server.base_url}/b")
+    assert [path for _, path, _ in http_server.requests] == ["/a", "/b", "/c", "/b"]
+
+
+def test_cache_disk_tier(http_server, tmp_path):
+    http_server.routes["/big"] = lambda handler: (200, {"Cache-Control": "max-age=60"}, b"x" * 1000)
+    http_server.routes["/big2"] = lambda handler: (200, {"Cache-Control": "max-age=60"}, b"y" * 1000)
+    cache_dir = str(tmp_path / "cache")
+    client = HttpClient(cache=HttpCache(max_entries=1, cache_dir=cache_dir))
+    client.get(f"{http_server.base_url}/big")
+    client.get(f"{http_server.base_url}/big2")
+    assert client.get(f"{http_server.base_url}/big").text == "x" * 1000  # from the disk tier
+    assert len(http_server.requests) == 2
+
+    # new cache instance (e.g. after restart) uses responses from the disk, size limit evicts old ones
+    cache = HttpCache(max_entries=1, cache_dir=cache_dir, max_disk_size=1500)
+    assert cache.stats()["disk_size"] > 2000
+    client = HttpClient(cache=cache)
+    assert client.get(f"{http_server.base_url}/big2").text == "y" * 1000
+    http_server.routes["/big3"] = lambda handler: (200, {"Cache-Control": "max-age=60"}, b"z" * 1000)
+    client.get(f"{http_server.base_url}/big3")
+    assert cache.stats()["disk_size"] <= 1500
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    assert len(http_server.requests) == 3
+
+
+def test_cache_disk_tier_not_shared_responses(http_server, tmp_path):
+    http_server.routes["/private"] = lambda handler: (200, {"Cache-Control": "private, max-age=60"}, b"p")
+    http_server.routes["/public"] = lambda handler: (200, {"Cache-Control": "public, max-age=60"}, b"x")
+    http_server.routes["/fresh"] = lambda handler: (200, {"Cache-Control": "max-age=60"}, b"f")
+    cache_dir = tmp_path / "cache"
+    client = HttpClient(cache=HttpCache(cache_dir=str(cache_dir)))
+    client.get(f"{http_server.base_url}/private")
+    assert client.get(f"{http_server.base_url}/private").text == "p"  # from the memory tier
+    assert len(http_server.requests) == 1
+    assert not list(cache_dir.iterdir())
+
+    client = HttpClient(auth=("user", "password"), cache=HttpCache(cache_dir=str(cache_dir)))
+    client.get(f"{http_server.base_url}/fresh")  # response to the request with credentials
+    assert not list(cache_dir.iterdir())
+    client.get(f"{http_server.base_url}/public")
+    assert len(list(cache_dir.iterdir())) == 1
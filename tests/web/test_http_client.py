@@ -5,15 +5,17 @@
     Unit tests for http client.
 
     Created:  Dmitrii Gusev, 02.06.2021
-    Modified: Dmitrii Gusev, 18.07.2025
+    Modified: Dmitrii Gusev, 18.10.2026
 """
 
+import time
+
 import pytest
 import responses
-# from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError
 from responses.registries import OrderedRegistry
 
-from pyutilities.web.http_client import HttpClient
+from pyutilities.web.http_client import HttpClient, HttpClientException
 
 # HTTP request parameters (should be added to the URL)
 http_request_params1 = {"zzz": "ccc"}
@@ -272,3 +274,76 @@ def mocked_responses():
 # )
 # def test_process_url(url, postfix, format_params, expected):
 #     assert process_url(url, postfix, format_params) == expected
+
+
+# responses fixture for the concurrent requests (order of requests isn't defined)
+@pytest.fixture
+def unordered_responses():
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+def test_get_many(httpclient, unordered_responses):
+    urls = [f"http://example.com/api/{number}" for number in range(20)]
+    for number, url in enumerate(urls):
+        unordered_responses.get(url, body=f"body {number}", status=404 if number == 7 else 200)
+
+    results = list(httpclient.get_many(urls, max_concurrency=4, ordered=True))
+    assert [result.url for result in results] == urls
+    for number, result in enumerate(results):
+        if number == 7:  # failed request doesn't cancel the batch
+            assert result.response is None
+            assert isinstance(result.error, HTTPError)
+        else:
+            assert result.error is None
+            assert result.response.text == f"body {number}"
+
+
+def test_post_many_unordered(httpclient, unordered_responses):
+    for number in range(5):
+        unordered_responses.post(f"http://example.com/api/{number}", body="OK")
+
+    urls = [(f"http://example.com/api/{number}", {"data": {"n": str(number)}}) for number in range(5)]
+    results = list(httpclient.post_many(urls, data={"default": "1"}, max_concurrency=2))
+    assert sorted(result.url for result in results) == [url for url, _ in urls]
+    assert all(result.response.text == "OK" for result in results)
+    bodies = sorted(call.request.body for call in unordered_responses.calls)
+    assert bodies == [f"n={number}" for number in range(5)]
+
+
+def test_request_many_invalid_concurrency(httpclient):
+    with pytest.raises(HttpClientException):
+        httpclient.request_many("GET", ["http://example.com"], max_concurrency=0)  # fails on the call
+
+
+def slow_route(handler):  # pylint: disable=unused-argument
+    time.sleep(0.05)  # requests overlap
+    return 200, {}, b"slow"
+
+
+def test_pool_stats(http_server):
+    client = HttpClient(pool_size=2)
+    for _ in range(3):
+        client.get(f"{http_server.base_url}/a")
+    stats = client.pool_stats()
+    assert stats["created"] == 1  # one keep-alive connection for sequential requests
+    assert stats["reused"] == 2
+
+    http_server.routes["/slow"] = slow_route
+    results = list(client.get_many([f"{http_server.base_url}/slow"] * 20, max_concurrency=8))
+    assert all(result.error is None for result in results)
+    stats = client.pool_stats()
+    assert stats["created"] + stats["reused"] == 23
+    assert stats["discarded"] > 0  # pool is smaller than the number of concurrent requests
+    assert stats["waits"] == 0 and stats["waiting"] == 0
+
+
+def test_pool_stats_blocking_pool(http_server):
+    client = HttpClient(pool_size=2, pool_block=True)
+    http_server.routes["/slow"] = slow_route
+    results = list(client.get_many([f"{http_server.base_url}/slow"] * 20, max_concurrency=8))
+    assert all(result.error is None for result in results)
+    stats = client.pool_stats()
+    assert stats["created"] <= 2  # number of connections is limited by the pool size
+    assert stats["discarded"] == 0
+    assert stats["waits"] > 0 and stats["waiting"] == 0
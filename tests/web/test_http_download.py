@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for file downloads by http client (with the local HTTP server).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import hashlib
+import os
+
+import pytest
+import requests
+
+from pyutilities.web.circuit_breaker import CircuitBreaker
+from pyutilities.web.http_client import HttpClient, HttpClientException
+
+CONTENT = bytes(range(256)) * 4000  # ~1 MB
+SHA256 = "sha256:" + hashlib.sha256(CONTENT).hexdigest()
+
+
+def file_route(content: bytes, ranges: bool = True, break_at: int | None = None):
+    """Route for the file: supports Range requests (if ranges), breaks connection after break_at bytes."""
+
+    def route(handler):
+        headers = {"Content-Type": "application/octet-stream"}
+        status, body = 200, content
+        byte_range = handler.headers.get("Range", "")
+        if ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if ranges and byte_range.startswith("bytes="):
+            start, _, end = byte_range.removeprefix("bytes=").partition("-")
+            start, end = int(start), int(end) if end else len(content) - 1
+            if start >= len(content):
+                return 416, {"Content-Range": f"bytes */{len(content)}"}, b""
+            stop = end + 1
+            status, body = 206, content[start:stop]
+            headers["Content-Range"] = f"bytes {start}-{start + len(body) - 1}/{len(content)}"
+        if break_at is not None and status == 200:
+            headers["Content-Length"] = str(len(body))
+            body = body[:break_at]
+            handler.close_connection = True  # client gets incomplete body
+        return status, headers, body
+
+    return route
+
+
+@pytest.fixture
+def client():
+    return HttpClient(retries=0)
+
+
+def test_download(http_server, client, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT)
+    path = str(tmp_path / "sub" / "file.bin")
+    assert client.download(f"{http_server.base_url}/file.bin", path, checksum=SHA256, chunk_size=4096) == path
+    with open(path, "rb") as file:
+        assert file.read() == CONTENT
+    assert os.listdir(tmp_path / "sub") == ["file.bin"]
+    assert http_server.requests[0][2]["Accept-Encoding"] == "identity"
+
+
+def test_download_resume(http_server, client, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT, break_at=300_000)
+    path = str(tmp_path / "file.bin")
+    with pytest.raises(HttpClientException, match="interrupted"):
+        client.download(f"{http_server.base_url}/file.bin", path, checksum=SHA256)
+    assert os.path.getsize(path + ".part") == 300_000
+    assert not os.path.exists(path)
+
+    client.download(f"{http_server.base_url}/file.bin", path, checksum=SHA256)
+    with open(path, "rb") as file:
+        assert file.read() == CONTENT
+    assert http_server.requests[-1][2]["Range"] == "bytes=300000-"
+
+
+def test_download_resume_complete_part(http_server, client, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT)
+    path = str(tmp_path / "file.bin")
+    with open(path + ".part", "wb") as part:
+        part.write(CONTENT)
+    client.download(f"{http_server.base_url}/file.bin", path, checksum=SHA256)  # 416 - nothing to download
+    assert os.path.getsize(path) == len(CONTENT)
+
+
+def test_download_without_ranges_support(http_server, client, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT, ranges=False)
+    path = str(tmp_path / "file.bin")
+    with open(path + ".part", "wb") as part:
+        part.write(b"garbage")
+    client.download(f"{http_server.base_url}/file.bin", path, checksum=SHA256)
+    assert os.path.getsize(path) == len(CONTENT)
+
+
+def test_download_checksum_mismatch(http_server, client, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT)
+    path = str(tmp_path / "file.bin")
+    with pytest.raises(HttpClientException, match="Checksum"):
+        client.download(f"{http_server.base_url}/file.bin", path, checksum="md5:0123")
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(HttpClientException):
+        client.download(f"{http_server.base_url}/file.bin", path, checksum="unknown:0123")
+    with pytest.raises(HttpClientException):
+        client.download(" ", path)
+
+
+def test_download_segmented(http_server, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT)
+    path = str(tmp_path / "file.bin")
+    client = HttpClient()
+    client.download_segmented(f"{http_server.base_url}/file.bin", path, 4, checksum=SHA256, chunk_size=4096)
+    with open(path, "rb") as file:
+        assert file.read() == CONTENT
+    assert os.listdir(tmp_path) == ["file.bin"]
+    methods_ranges = sorted((method, headers.get("Range")) for method, _, headers in http_server.requests)
+    quarter = len(CONTENT) // 4
+    assert methods_ranges == [
+        ("GET", f"bytes={number * quarter}-{number * quarter + quarter - 1}") for number in range(4)
+    ] + [("HEAD", None)]
+
+
+def test_download_segmented_retries_failed_segment(http_server, tmp_path):
+    route = file_route(CONTENT)
+    failures = []
+
+    def flaky_route(handler):  # the first request of the last segment is broken
+        status, headers, body = route(handler)
+        last_segment = headers.get("Content-Range", "").endswith(f"-{len(CONTENT) - 1}/{len(CONTENT)}")
+        if status == 206 and last_segment and not failures:
+            failures.append(handler.headers["Range"])
+            headers["Content-Length"] = str(len(body))
+            body = body[:1000]
+            handler.close_connection = True
+        return status, headers, body
+
+    http_server.routes["/file.bin"] = flaky_route
+    path = str(tmp_path / "file.bin")
+    HttpClient(retries=2).download_segmented(
+        f"{http_server.base_url}/file.bin", path, 4, checksum=SHA256, chunk_size=512
+    )
+    with open(path, "rb") as file:
+        assert file.read() == CONTENT
+    start = len(CONTENT) * 3 // 4
+    assert failures == [f"bytes={start}-{len(CONTENT) - 1}"]
+    ranges = [headers.get("Range") for _, _, headers in http_server.requests]
+    assert f"bytes={start + 1000}-{len(CONTENT) - 1}" in ranges  # retried from the failed position
+
+
+def test_download_segmented_fallback(http_server, tmp_path):
+    http_server.routes["/file.bin"] = file_route(CONTENT, ranges=False)
+    path = str(tmp_path / "file.bin")
+    HttpClient().download_segmented(f"{http_server.base_url}/file.bin", path, 4, checksum=SHA256)
+    assert os.path.getsize(path) == len(CONTENT)
+    assert [method for method, _, _ in http_server.requests] == ["HEAD", "GET"]
+    assert "Range" not in http_server.requests[-1][2]
+
+
+def test_download_segmented_circuit_open(http_server, tmp_path):
+    route = file_route(CONTENT)
+    http_server.routes["/file.bin"] = lambda handler: (
+        route(handler) if handler.command == "HEAD" else (503, {}, b"unavailable")
+    )
+    client = HttpClient(retries=4, circuit_breaker=CircuitBreaker(window=2, min_calls=2, open_timeout=60))
+    with pytest.raises(requests.ConnectionError, match="CircuitOpenError|is open"):
+        client.download_segmented(
+            f"{http_server.base_url}/file.bin", str(tmp_path / "file.bin"), 4, chunk_size=4096
+        )
+    assert len(http_server.requests) <= 5  # HEAD + the first request of each segment (no retries)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for requests timing instrumentation (RequestTimer + HttpClient, local HTTP server).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import socket
+
+import pytest
+import requests
+
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.http_timing import LatencyHistogram, RequestTimer, TimedRetry, active_timing
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 2.0):
+        histogram.add(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == 2.0
+    data = histogram.to_dict()
+    assert data["buckets"] == [[0.1, 2], [1.0, 1], ["+Inf", 1]]
+    assert (data["count"], data["min"], data["max"]) == (4, 0.05, 2.0)
+    assert LatencyHistogram().to_dict()["p99"] == 0.0
+    with pytest.raises(ValueError):
+        RequestTimer(bounds=(1.0, 0.1))
+
+
+def test_http_client_timings(http_server):
+    timings = []
+    timer = RequestTimer(hooks=[timings.append, lambda timing: 1 / 0])  # failed hook is only logged
+    client = HttpClient(user_agent="test", timer=timer)
+    assert client.timer is timer
+    for _ in range(2):
+        assert client.get(f"{http_server.base_url}/a").text == "/a"
+
+    first, second = timings
+    assert (first.method, first.status, first.error, first.attempts) == ("GET", 200, None, 1)
+    assert first.connect > 0 and second.connect == 0  # the second request reuses the connection
+    assert first.ttfb > 0 and second.ttfb > 0
+    assert first.tls == first.retry_sleep == first.throttle == 0
+    assert first.total >= first.connect + first.ttfb + first.body
+    assert active_timing() is None
+
+    host = http_server.base_url.removeprefix("http://")
+    exported = timer.export()[host]
+    assert (exported["requests"], exported["attempts"], exported["errors"]) == (2, 2, 0)
+    assert exported["histogram"]["count"] == 2
+    assert exported["phases"]["connect"] == pytest.approx(first.connect)
+    assert timer.histograms()[host].count == 2
+    timer.reset()
+    assert not timer.export()
+
+
+def test_http_client_timings_retries_and_errors(http_server):
+    failures = []
+
+    def flaky(handler):  # pylint: disable=unused-argument
+        failures.append(1)
+        return (503, {}, b"busy") if len(failures) == 1 else (200, {}, b"OK")
+
+    http_server.routes["/flaky"] = flaky
+    timings = []
+    client = HttpClient(user_agent="test", retries=2, timer=RequestTimer(hooks=[timings.append]))
+    assert client.get(f"{http_server.base_url}/flaky").text == "OK"
+    assert (timings[0].attempts, timings[0].status) == (2, 200)
+
+    http_server.routes["/missing"] = lambda handler: (404, {}, b"")
+    with pytest.raises(requests.HTTPError):
+        client.get(f"{http_server.base_url}/missing")
+    assert (timings[1].status, timings[1].error) == (404, None)
+
+    with socket.socket() as sock:  # free port - connection is refused
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    with pytest.raises(requests.ConnectionError):
+        HttpClient(user_agent="test", retries=0, timer=client.timer).get(f"http://127.0.0.1:{port}/")
+    assert timings[2].error == "ConnectionError"
+    assert client.timer.export()[f"127.0.0.1:{port}"]["errors"] == 1
+
+
+def test_timed_retry_sleep():
+    timer = RequestTimer()
+    retry = TimedRetry(total=3, backoff_factor=0.01)
+    retry = retry.increment("GET", "/", error=ConnectionError()).increment(
+        "GET", "/", error=ConnectionError()
+    )
+    timing = timer.start("GET", "http://host/")
+    retry.sleep()
+    timer.finish(timing)
+    assert timing.retry_sleep >= 0.01
+    assert timer.export()["host"]["phases"]["retry_sleep"] == timing.retry_sleep
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for per-host rate limiter (RateLimiter + HttpClient/AsyncHttpClient with rate limiter).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.rate_limiter import RateLimiter
+
+URL = "http://api.example.com/path"
+
+
+def test_rate_limiter_bursts_and_rate():
+    limiter = RateLimiter(rate=50, burst=2)
+    start = time.monotonic()
+    waits = [limiter.acquire(URL) for _ in range(7)]
+    elapsed = time.monotonic() - start
+    assert waits[:2] == [0, 0]  # burst
+    assert all(wait > 0 for wait in waits[2:])
+    assert 0.08 <= elapsed < 0.5  # 5 requests at 50 req/sec
+    stats = limiter.stats()["api.example.com"]
+    assert stats["requests"] == 7 and stats["waits"] == 5
+    assert 0 < stats["max_wait"] <= stats["wait_time"]
+
+
+def test_rate_limiter_per_host_limits():
+    limiter = RateLimiter(rate=1, hosts={"fast.example.com": (1000, 100)})
+    for _ in range(50):
+        assert limiter.acquire("https://fast.example.com/x") == 0
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) > 0.5  # default rate for other hosts
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Retry-After": "1"},
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1"},
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "epoch+1"},  # reset time as epoch seconds
+    ],
+)
+def test_rate_limiter_server_hints(headers):
+    if headers.get("X-RateLimit-Reset") == "epoch+1":
+        headers = dict(headers, **{"X-RateLimit-Reset": str(time.time() + 1)})
+    limiter = RateLimiter(rate=1000, burst=1000)
+    limiter.acquire(URL)
+    limiter.update(URL, headers)
+    limiter.update("http://other.example.com", headers)  # unknown host - ignored
+    started = time.monotonic()
+    wait = asyncio.run(limiter.acquire_async(URL))
+    assert 0.8 < wait <= 1.0
+    assert time.monotonic() - started >= wait - 0.01
+
+
+def test_rate_limiter_ignores_other_headers():
+    limiter = RateLimiter(rate=1000, burst=1000)
+    limiter.acquire(URL)
+    limiter.update(URL, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "100", "Retry-After": "bad"})
+    assert limiter.acquire(URL) == 0
+
+
+def test_http_client_with_rate_limiter(http_server):
+    http_server.routes["/limited"] = lambda handler: (200, {"Retry-After": "0"}, b"OK")
+    limiter = RateLimiter(rate=100, burst=1)
+    client = HttpClient(rate_limiter=limiter)
+    start = time.monotonic()
+    results = list(client.get_many([f"{http_server.base_url}/limited"] * 11, max_concurrency=4))
+    assert all(result.response.text == "OK" for result in results)
+    assert time.monotonic() - start >= 0.09  # 10 requests after the first one at 100 req/sec
+    assert limiter.stats()[http_server.base_url.removeprefix("http://")]["waits"] == 10
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for single-flight coalescing of the concurrent requests (SingleFlight + HttpClient).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.single_flight import SingleFlight
+
+THREADS = 8
+
+
+def wait_for(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "Condition wasn't met in time!"
+        time.sleep(0.005)
+
+
+def blocking_route(release: threading.Event, status: int = 200):
+    def route(handler):  # pylint: disable=unused-argument
+        release.wait(5)
+        return status, {"X-Test": "yes"}, b"shared body"
+
+    return route
+
+
+def concurrent_gets(client: HttpClient, url: str, release: threading.Event) -> list:
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        futures = [executor.submit(client.get, url) for _ in range(THREADS)]
+        wait_for(lambda: client.single_flight.stats()["calls"] == THREADS)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+@pytest.mark.parametrize("copy_responses", [True, False])
+def test_http_client_coalesces_identical_gets(http_server, copy_responses):
+    release = threading.Event()
+    http_server.routes["/slow"] = blocking_route(release)
+    client = HttpClient(user_agent="test", single_flight=SingleFlight(copy_responses=copy_responses))
+    responses = concurrent_gets(client, f"{http_server.base_url}/slow?a=1", release)
+
+    assert len(http_server.requests) == 1
+    assert all(response.content == b"shared body" for response in responses)
+    assert len({id(response) for response in responses}) == (THREADS if copy_responses else 1)
+    if copy_responses:  # headers are separate, body isn't copied
+        responses[0].headers["X-Test"] = "changed"
+        assert responses[1].headers["X-Test"] == "yes"
+        assert len({id(response.content) for response in responses}) == 1
+    stats = client.single_flight.stats()
+    assert (stats["calls"], stats["executions"], stats["coalesced"]) == (THREADS, 1, THREADS - 1)
+    assert stats["rate"] == pytest.approx((THREADS - 1) / THREADS)
+    assert stats["in_flight"] == 0
+
+    client.get(f"{http_server.base_url}/slow?a=1")  # completed request isn't reused
+    client.get(f"{http_server.base_url}/slow?a=2")
+    assert len(http_server.requests) == 3
+
+
+def test_http_client_coalesced_error(http_server):
+    release = threading.Event()
+    http_server.routes["/missing"] = blocking_route(release, status=404)
+    client = HttpClient(user_agent="test", single_flight=SingleFlight())
+    errors = concurrent_gets(client, f"{http_server.base_url}/missing", release)
+    assert all(isinstance(error, requests.HTTPError) for error in errors)
+    assert len(http_server.requests) == 1
+    assert client.single_flight.stats()["errors"] == 1
+
+
+def test_http_client_get_many_coalesced(http_server):
+    release = threading.Event()
+    http_server.routes["/slow"] = blocking_route(release)
+    client = HttpClient(user_agent="test", single_flight=SingleFlight())
+    results = client.get_many([f"{http_server.base_url}/slow"] * THREADS, max_concurrency=THREADS)
+    threading.Timer(0.2, release.set).start()
+    assert all(result.response.text == "shared body" for result in results)
+    assert len(http_server.requests) < THREADS
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Unit tests for user agents pool (UserAgentPool + HttpClient user agents).
+
+Created:  Dmitrii Gusev, 18.10.2026
+Modified: Dmitrii Gusev, 18.10.2026
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pyutilities.web.http_client import HttpClient
+from pyutilities.web.user_agents import UserAgentPool
+
+
+def test_user_agents_pool_rotation():
+    pool = UserAgentPool(size=3)
+    assert not pool.loaded
+    agents = [pool.next() for _ in range(6)]
+    assert pool.loaded
+    assert agents[:3] == agents[3:]
+    assert all(agent for agent in agents)
+    with pytest.raises(ValueError):
+        UserAgentPool(size=0)
+
+
+def test_user_agents_dataset_not_loaded_on_import():
+    code = (
+        "import sys; from pyutilities.web.http_client import HttpClient; HttpClient(user_agent='fixed'); "
+        "print('fake_useragent' in sys.modules)"
+    )
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONTRACEMALLOC"}  # fast start
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    output = process.stdout
+    assert output.strip() == "False"
+
+
+def test_http_client_rotated_user_agents(http_server):
+    client = HttpClient(user_agent="fixed", rotate_user_agent=True)
+    for _ in range(3):
+        client.get(f"{http_server.base_url}/a")
+    HttpClient(user_agent="fixed").get(f"{http_server.base_url}/b")
+    agents = [
+        {name.lower(): value for name, value in headers.items()}["user-agent"]
+        for *_, headers in http_server.requests
+    ]
+    assert "fixed" not in agents[:3]
+    assert len(set(agents[:3])) > 1
+    assert agents[3] == "fixed"